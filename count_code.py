@@ -1,42 +1,162 @@
 # -*- coding: utf-8 -*-
 
 import typing as T
+import os
+import functools
 import json
+import shutil
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib_mate import Path
 
 dir_project_root = Path.dir_here(__file__).absolute()
 
+# read source file in 1MB chunk, avoid decoding and loading the entire file
+CHUNK_SIZE = 1 << 20
 
-def cloc(path: T.Union[Path, T.List[Path]]) -> dict:
-    if isinstance(path, list):
-        cloc_list_file.write_text("\n".join([str(p) for p in path]))
-        args = [
-            "cloc",
-            f"--list-file={cloc_list_file}",
-            "--json",
-        ]
-    else:
-        args = [
-            "cloc",
-            f"{path}",
-            "--json",
-        ]
+
+def count_line_in_file(path: T.Union[str, Path]) -> int:
+    """
+    Count number of lines in a file, without decoding it to ``str``.
+    The same buffer is reused for every chunk, so no new ``bytes`` object
+    is allocated per read.
+    """
+    total = 0
+    buffer = bytearray(CHUNK_SIZE)
+    last_byte = None
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            total += buffer.count(b"\n", 0, n)
+            last_byte = buffer[n - 1]
+    # the last line doesn't end with a new line character
+    if last_byte is not None and last_byte != ord("\n"):
+        total += 1
+    return total
+
+
+@functools.lru_cache(maxsize=None)
+def list_file(dir_path: str) -> T.Tuple[str, ...]:
+    """
+    Traverse the directory once with ``os.walk`` and cache all file paths,
+    so counting the same directory again doesn't walk it again.
+    """
+    files = list()
+    for root, _, filenames in os.walk(dir_path):
+        for filename in filenames:
+            files.append(os.path.join(root, filename))
+    return tuple(files)
+
+
+def iter_file(dir_path: str, ext: str = "") -> T.Iterator[str]:
+    """
+    Recursively yield the absolute path of files with the given extension.
+    """
+    for path in list_file(dir_path):
+        if path.endswith(ext):
+            yield path
+
+
+def count_line_in_dir(path: Path) -> int:
+    return count_line_in_many_dir([path])
+
+
+def count_line_in_many_dir(paths: T.List[Path]) -> int:
+    # pass str instead of Path to the worker process to reduce pickle cost
+    files = [p for path in paths for p in iter_file(str(path), ".py")]
+    with ProcessPoolExecutor() as executor:
+        return sum(executor.map(count_line_in_file, files, chunksize=32))
+
+
+def scc(path: T.Union[Path, T.List[Path]]) -> dict:
+    """
+    Use scc, a much faster cloc alternative, and convert the output to the
+    same shape as cloc.
+    """
+    if not isinstance(path, list):
+        path = [path]
+    # scc accepts multiple paths directly, no list file needed
+    args = ["scc", "--format", "json"]
+    args.extend([str(p) for p in path])
     result = subprocess.run(args, capture_output=True)
-    data = json.loads(result.stdout.decode("utf-8"))
-    del data["header"]
+    data = dict()
+    for lang in json.loads(result.stdout.decode("utf-8")):
+        data[lang["Name"]] = {
+            "nFiles": lang["Count"],
+            "blank": lang["Blank"],
+            "comment": lang["Comment"],
+            "code": lang["Code"],
+        }
+    return data
+
+
+def cloc(path: T.Union[Path, T.List[Path]]) -> dict:
+    """
+    cloc is single threaded, so we split the files into one shard per CPU,
+    run one cloc process per shard concurrently, then merge the results.
+    """
+    if not isinstance(path, list):
+        path = [path]
+    files = list()
+    for p in path:
+        if os.path.isdir(p):
+            files.extend(iter_file(str(p)))
+        else:
+            files.append(str(p))
+    n_shard = max(min(os.cpu_count() or 1, len(files)), 1)
+
+    # stream the file list to cloc via stdin, no list file on disk
+    args = [
+        "cloc",
+        "--list-file=-",
+        "--json",
+    ]
+    processes = list()
+    for shard in [files[i::n_shard] for i in range(n_shard)]:
+        process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        process.stdin.write("\n".join(shard).encode("utf-8"))
+        process.stdin.close()
+        processes.append(process)
+
+    data = dict()
+    for process in processes:
+        stdout = process.stdout.read()
+        process.wait()
+        if not stdout.strip():  # no source code file in this shard
+            continue
+        result = json.loads(stdout.decode("utf-8"))
+        del result["header"]
+        for lang, counts in result.items():
+            merged = data.setdefault(
+                lang, {"nFiles": 0, "blank": 0, "comment": 0, "code": 0}
+            )
+            for key in merged:
+                merged[key] += counts.get(key, 0)
     return data
 
 
 def count_code(title, path: T.Union[Path, T.List[Path]]):
-    data = cloc(path)
     print(f"-------------------- {title} --------------------")
+    # prefer scc, then cloc, then the pure Python line counter
+    if shutil.which("scc") is not None:
+        data = scc(path)
+    elif shutil.which("cloc") is not None:
+        data = cloc(path)
+    else:
+        if not isinstance(path, list):
+            path = [path]
+        print(f"Python: {count_line_in_many_dir(path)} lines")
+        return
     print(json.dumps(data, indent=4))
 
 
 if __name__ == "__main__":
-    cloc_list_file = dir_project_root.joinpath(".cloc-list-file")
-
     count_code(
         "source code",
         [
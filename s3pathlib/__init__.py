@@ -14,6 +14,8 @@ __maintainer__ = "Sanhe Hu"
 __maintainer_email__ = "sanhehu@amazon.com"
 __github_username__ = "aws-samples"
 
+# ``setup.py`` imports this package to read the metadata above before the
+# dependencies are installed, so only the ``ImportError`` is ignored here.
 try:
     from . import utils
     from .better_client import api
@@ -23,5 +25,3 @@ try:
     from iterproxy import and_, or_, not_
 except ImportError:  # pragma: no cover
     pass
-except:  # pragma: no cover
-    raise
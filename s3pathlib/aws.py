@@ -6,6 +6,9 @@ Manage the AWS environment that ``s3pathlib`` dealing with.
 
 import typing as T
 
+from .compat import cached_property
+from .better_client.client import make_tuned_s3_client
+
 try:
     import boto3
 except ImportError:  # pragma: no cover
@@ -22,71 +25,84 @@ class Context:
     """
     A globally available context object managing AWS SDK credentials.
 
-    TODO: use singleton pattern to create context object
+    It is a singleton, ``Context()`` always returns the same object. The default
+    boto session is lazy created when it is first accessed.
     """
 
-    def __init__(self):
-        self.boto_ses: T.Optional["boto3.session.Session"] = None
-        self._aws_region: T.Optional[str] = None
-        self._aws_account_id: T.Optional[str] = None
-        self._s3_client: T.Optional["S3Client"] = None
-        self._sts_client: T.Optional["STSClient"] = None
+    _instance: T.Optional["Context"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            self = super().__new__(cls)
+            self._boto_ses = None
+            cls._instance = self
+        return cls._instance
+
+    @property
+    def boto_ses(self) -> T.Optional["boto3.session.Session"]:
+        """
+        Access the boto session, try to create the default session if
+        it is not created yet.
+        """
+        if self._boto_ses is None:
+            try:
+                self._boto_ses = boto3.session.Session()
+            except:  # pragma: no cover
+                pass
+        return self._boto_ses
 
-        # try to create default session
-        try:
-            self.boto_ses = boto3.session.Session()
-        except:  # pragma: no cover
-            pass
+    @boto_ses.setter
+    def boto_ses(self, boto_ses: "boto3.session.Session"):
+        self._boto_ses = boto_ses
 
     def attach_boto_session(self, boto_ses: "boto3.session.Session"):
         """
         Attach a custom boto session, also remove caches.
         """
-        self.boto_ses = boto_ses
-        self._s3_client = None
-        self._sts_client = None
-        self._aws_account_id = None
-        self._aws_region = None
+        self._boto_ses = boto_ses
+        for attr in _CACHED_ATTRIBUTES:
+            self.__dict__.pop(attr, None)
 
-    @property
+    @cached_property
     def s3_client(self) -> "S3Client":
         """
         Access the s3 client.
 
         https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#client
         """
-        if self._s3_client is None:
-            self._s3_client = self.boto_ses.client("s3")
-        return self._s3_client
+        return make_tuned_s3_client(boto_ses=self.boto_ses)
 
-    @property
+    @cached_property
     def sts_client(self) -> "STSClient":
         """
         Access the s3 client.
 
         https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#client
         """
-        if self._sts_client is None:
-            self._sts_client = self.boto_ses.client("sts")
-        return self._sts_client
+        return self.boto_ses.client("sts")
 
-    @property
+    @cached_property
     def aws_account_id(self) -> str:
         """
         The AWS Account ID of the current boto session.
         """
-        if self._aws_account_id is None:
-            self._aws_account_id = self.sts_client.get_caller_identity()["Account"]
-        return self._aws_account_id
+        return self.sts_client.get_caller_identity()["Account"]
 
-    @property
+    @cached_property
     def aws_region(self) -> str:
         """
         The AWS Region of the current boto session.
         """
-        if self._aws_region is None:
-            self._aws_region = self.boto_ses.region_name
-        return self._aws_region
+        return self.boto_ses.region_name
+
+
+# the cached properties that depend on the boto session
+_CACHED_ATTRIBUTES = (
+    "s3_client",
+    "sts_client",
+    "aws_account_id",
+    "aws_region",
+)
 
 
 context = Context()
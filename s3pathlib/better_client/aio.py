@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+"""
+Async version of the head / tagging / put helpers for aiobotocore_ (or
+aioboto3_) s3 client. Fanning out thousands of small API calls with
+``asyncio`` costs less than threads: no per-thread stack, no GIL hand off.
+
+The caller is responsible for the life cycle of the async client.
+
+Example::
+
+    >>> import aioboto3
+    >>> async with aioboto3.Session().client("s3") as s3_client:
+    ...     await aupdate_object_tagging_many(
+    ...         s3_client, "my-bucket", keys, tags={"project": "p1"}
+    ...     )
+
+.. _aiobotocore: https://github.com/aio-libs/aiobotocore
+.. _aioboto3: https://github.com/terrycain/aioboto3
+
+.. versionadded:: 2.0.2
+"""
+
+import typing as T
+import asyncio
+
+import botocore.exceptions
+from func_args import NOTHING, resolve_kwargs
+
+from .. import tag
+from .. import exc
+from ..type import TagType, MetadataType
+from .put_object import build_put_object_kwargs
+
+
+async def ahead_object(
+    s3_client,
+    bucket: str,
+    key: str,
+    version_id: str = NOTHING,
+    request_payer: str = NOTHING,
+    expected_bucket_owner: str = NOTHING,
+    ignore_not_found: bool = False,
+) -> T.Optional[dict]:
+    """
+    Async version of :func:`~s3pathlib.better_client.head_object.head_object`.
+
+    .. versionadded:: 2.0.2
+    """
+    try:
+        return await s3_client.head_object(
+            **resolve_kwargs(
+                Bucket=bucket,
+                Key=key,
+                VersionId=version_id,
+                RequestPayer=request_payer,
+                ExpectedBucketOwner=expected_bucket_owner,
+            )
+        )
+    except botocore.exceptions.ClientError as e:
+        if exc.is_not_found_error(e):
+            if ignore_not_found:
+                return None
+            else:
+                raise exc.S3FileNotExist.make(f"s3://{bucket}/{key}")
+        else:  # pragma: no cover
+            raise e
+
+
+async def ais_object_exists(
+    s3_client,
+    bucket: str,
+    key: str,
+    version_id: str = NOTHING,
+) -> bool:
+    """
+    Async version of :func:`~s3pathlib.better_client.head_object.is_object_exists`,
+    without the cache.
+
+    .. versionadded:: 2.0.2
+    """
+    response = await ahead_object(
+        s3_client,
+        bucket,
+        key,
+        version_id=version_id,
+        ignore_not_found=True,
+    )
+    return response is not None
+
+
+async def aget_object_tagging(
+    s3_client,
+    bucket: str,
+    key: str,
+    version_id: str = NOTHING,
+    expected_bucket_owner: str = NOTHING,
+    request_payer: str = NOTHING,
+) -> T.Tuple[T.Optional[str], TagType]:
+    """
+    Get the object tags.
+
+    :return: the tuple of ``(version_id, tags)``.
+
+    .. versionadded:: 2.0.2
+    """
+    res = await s3_client.get_object_tagging(
+        **resolve_kwargs(
+            Bucket=bucket,
+            Key=key,
+            VersionId=version_id,
+            ExpectedBucketOwner=expected_bucket_owner,
+            RequestPayer=request_payer,
+        )
+    )
+    return res.get("VersionId", None), tag.parse_tags(res.get("TagSet", []))
+
+
+async def aupdate_object_tagging(
+    s3_client,
+    bucket: str,
+    key: str,
+    tags: TagType,
+    version_id: str = NOTHING,
+    expected_bucket_owner: str = NOTHING,
+    request_payer: str = NOTHING,
+    merge: bool = True,
+) -> T.Tuple[T.Optional[str], TagType]:
+    """
+    Async version of :func:`~s3pathlib.better_client.tagging.update_object_tagging`.
+
+    .. versionadded:: 2.0.2
+    """
+    if merge is False:
+        res = await s3_client.put_object_tagging(
+            **resolve_kwargs(
+                Bucket=bucket,
+                Key=key,
+                Tagging={"TagSet": tag.encode_for_put_object_tagging(tags)},
+                VersionId=version_id,
+                ExpectedBucketOwner=expected_bucket_owner,
+                RequestPayer=request_payer,
+            )
+        )
+        return res.get("VersionId", None), dict(tags)
+
+    res = await s3_client.get_object_tagging(
+        **resolve_kwargs(
+            Bucket=bucket,
+            Key=key,
+            VersionId=version_id,
+            ExpectedBucketOwner=expected_bucket_owner,
+            RequestPayer=request_payer,
+        )
+    )
+    existing_version_id = res.get("VersionId", None)
+    tag_set = res.get("TagSet", [])
+    existing_tags = tag.parse_tags(tag_set)
+    # nothing changed, no need to put it back
+    if all(existing_tags.get(k) == v for k, v in tags.items()):
+        return existing_version_id, existing_tags
+    existing_tags.update(tags)
+    await s3_client.put_object_tagging(
+        **resolve_kwargs(
+            Bucket=bucket,
+            Key=key,
+            # patch the original tag set instead of re-encoding the merged dict
+            Tagging={"TagSet": tag.merge_tag_set(tag_set, tags)},
+            VersionId=res.get("VersionId", NOTHING),
+            ExpectedBucketOwner=expected_bucket_owner,
+            RequestPayer=request_payer,
+        )
+    )
+    return existing_version_id, existing_tags
+
+
+async def aupdate_object_tagging_many(
+    s3_client,
+    bucket: str,
+    keys: T.Iterable[str],
+    tags: TagType,
+    concurrency: int = 32,
+    merge: bool = True,
+    expected_bucket_owner: str = NOTHING,
+    request_payer: str = NOTHING,
+) -> T.Dict[str, T.Tuple[T.Optional[str], TagType]]:
+    """
+    Async version of :func:`~s3pathlib.better_client.tagging.update_object_tagging_many`.
+
+    :param concurrency: max number of in-flight objects, each of them
+        takes up to two API calls.
+
+    :return: a dict of ``{key: (version_id, tags)}``.
+
+    .. versionadded:: 2.0.2
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def update_one(key: str):
+        async with semaphore:
+            return key, await aupdate_object_tagging(
+                s3_client,
+                bucket,
+                key,
+                tags,
+                expected_bucket_owner=expected_bucket_owner,
+                request_payer=request_payer,
+                merge=merge,
+            )
+
+    results = await asyncio.gather(*[update_one(key) for key in keys])
+    return dict(results)
+
+
+async def aput_object(
+    s3_client,
+    bucket: str,
+    key: str,
+    body: T.Union[bytes, T.IO] = b"",
+    metadata: MetadataType = NOTHING,
+    tags: TagType = NOTHING,
+    **kwargs,
+) -> dict:
+    """
+    Async version of :func:`~s3pathlib.better_client.put_object.put_object`.
+
+    :param kwargs: other :func:`~s3pathlib.better_client.put_object.put_object`
+        arguments, e.g. ``content_type``.
+
+    .. versionadded:: 2.0.2
+    """
+    return await s3_client.put_object(
+        **build_put_object_kwargs(
+            bucket,
+            key,
+            body,
+            metadata=metadata,
+            tags=tags,
+            **kwargs,
+        )
+    )
@@ -1,13 +1,25 @@
 # -*- coding: utf-8 -*-
 
+from .client import make_tuned_s3_client
+from .client import check_pool_size
+from .client import resolve_max_workers
+from .client import warm_up_client
+from .client import get_executor
 from .head_bucket import is_bucket_exists
 from .head_object import (
     head_object,
     is_object_exists,
+    exists_many,
 )
 from .tagging import (
     update_bucket_tagging,
     update_object_tagging,
+    update_object_tagging_from_head,
+    update_object_tagging_many,
+)
+from .put_object import (
+    put_object,
+    put_objects_concurrent,
 )
 from .upload import (
     upload_dir,
@@ -16,11 +28,27 @@ from .list_objects import (
     ObjectTypeDefIterproxy,
     CommonPrefixTypeDefIterproxy,
     ListObjectsV2OutputTypeDefIterproxy,
+    ContentColumns,
     paginate_list_objects_v2,
     is_content_an_object,
+    PrefixStats,
+    scan_prefix_stats,
     calculate_total_size,
     count_objects,
 )
+from .list_objects_async import apaginate_list_objects_v2
+from .aio import (
+    ahead_object,
+    ais_object_exists,
+    aget_object_tagging,
+    aupdate_object_tagging,
+    aupdate_object_tagging_many,
+    aput_object,
+)
+from .inventory import (
+    InventorySource,
+    calculate_total_size_from_inventory,
+)
 from .list_object_versions import (
     ObjectVersionTypeDefIterproxy,
     DeleteMarkerEntryTypeDefIterproxy,
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+"""
+Create boto3 s3 client that is tuned for concurrent API calls.
+
+.. versionadded:: 2.0.2
+"""
+
+import typing as T
+import os
+import atexit
+import weakref
+import warnings
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import boto3
+    from botocore.config import Config
+except ImportError:  # pragma: no cover
+    pass
+except:  # pragma: no cover
+    raise
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_s3 import S3Client
+
+# the max number of keys S3 returns per list page, it is 1000 today.
+# use the environment variable to override it if S3 relaxes the limit.
+S3_LIST_MAX_KEYS = int(os.environ.get("S3PATHLIB_LIST_MAX_KEYS", "1000"))
+
+# the default number of threads of the concurrent helpers, the throughput of
+# a single client usually stops growing at around 16 threads.
+DEFAULT_MAX_WORKERS = int(os.environ.get("S3PATHLIB_MAX_WORKERS", "16"))
+
+
+def make_tuned_s3_client(
+    boto_ses: T.Optional["boto3.session.Session"] = None,
+    region_name: T.Optional[str] = None,
+    pool_size: int = 64,
+    retry_mode: str = "adaptive",
+    max_attempts: int = 5,
+) -> "S3Client":
+    """
+    Create a s3 client with a larger HTTP connection pool. The default
+    ``max_pool_connections`` of botocore is 10, when more than 10 threads
+    share the same client (e.g. the concurrent delete, sharded listing),
+    connections are dropped and new TCP + TLS handshakes are needed.
+
+    Example::
+
+        >>> s3_client = make_tuned_s3_client(pool_size=32)
+        >>> paginate_list_objects_v2(s3_client, ..., max_workers=16)
+
+    :param boto_ses: the boto session to create the client from, if not
+        given, create a default one.
+    :param region_name: the AWS region name.
+    :param pool_size: the ``max_pool_connections`` of the client, should be
+        greater than the number of threads that share this client.
+    :param retry_mode: the botocore retry mode.
+    :param max_attempts: the max attempts of the botocore retry.
+
+    .. versionadded:: 2.0.2
+    """
+    if boto_ses is None:
+        boto_ses = boto3.session.Session()
+    return boto_ses.client(
+        "s3",
+        region_name=region_name,
+        config=Config(
+            max_pool_connections=pool_size,
+            tcp_keepalive=True,
+            retries={"mode": retry_mode, "max_attempts": max_attempts},
+        ),
+    )
+
+
+def check_pool_size(
+    s3_client: "S3Client",
+    max_workers: int,
+) -> None:
+    """
+    Warn if the HTTP connection pool of the s3 client is smaller than the
+    number of threads that share it. botocore's default pool size is 10,
+    extra connections are discarded ("Connection pool is full") and
+    re-created, so most of the benefit of the threads is lost.
+
+    .. versionadded:: 2.0.2
+    """
+    pool_size = s3_client.meta.config.max_pool_connections
+    if pool_size < max_workers:
+        warnings.warn(
+            f"the s3 client's max_pool_connections ({pool_size}) is smaller "
+            f"than max_workers ({max_workers}), create the client with "
+            f"make_tuned_s3_client(pool_size={max_workers}) or "
+            f"botocore.config.Config(max_pool_connections={max_workers}).",
+            UserWarning,
+        )
+
+
+def resolve_max_workers(
+    s3_client: "S3Client",
+    max_workers: T.Optional[int] = None,
+) -> int:
+    """
+    Resolve the ``max_workers`` argument of the concurrent helpers.
+
+    If it is not given, use :data:`DEFAULT_MAX_WORKERS`, but never more than
+    the ``max_pool_connections`` of the client, so the default works with
+    a plain boto3 client without a warning. An explicit value is used as it
+    is, and :func:`check_pool_size` warns if the pool is too small.
+
+    .. versionadded:: 2.0.2
+    """
+    if max_workers is None:
+        pool_size = s3_client.meta.config.max_pool_connections
+        return max(1, min(DEFAULT_MAX_WORKERS, pool_size))
+    check_pool_size(s3_client, max_workers)
+    return max_workers
+
+
+# s3 clients that already made at least one API call
+_warm_clients: "weakref.WeakSet[S3Client]" = weakref.WeakSet()
+
+
+def warm_up_client(
+    s3_client: "S3Client",
+    bucket: str,
+) -> None:
+    """
+    Make one cheap head_bucket call before fanning out to many threads, so
+    the credential resolution, endpoint resolution and the first TLS
+    connection happen once, instead of racing in every thread. It is done
+    only once per ``s3_client``, any error is ignored (e.g. missing
+    ``s3:ListBucket`` permission), the real API call will surface it.
+
+    Pass the same *client* (not a *session*) to all threads, boto3 client is
+    thread safe and shares its credential cache and connection pool.
+
+    .. versionadded:: 2.0.2
+    """
+    if s3_client in _warm_clients:
+        return
+    try:
+        s3_client.head_bucket(Bucket=bucket)
+    except Exception:
+        pass
+    _warm_clients.add(s3_client)
+
+
+# s3_client -> {operation_name: paginator}
+_paginator_cache: "weakref.WeakKeyDictionary[S3Client, T.Dict[str, T.Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_paginator(
+    s3_client: "S3Client",
+    operation_name: str,
+):
+    """
+    Get the paginator of the s3 client, the paginator is created only once
+    per ``(s3_client, operation_name)`` pair. Creating paginator needs to
+    load the paginator config from the service model, which is not free.
+
+    .. versionadded:: 2.0.2
+    """
+    paginators = _paginator_cache.setdefault(s3_client, dict())
+    try:
+        return paginators[operation_name]
+    except KeyError:
+        paginator = s3_client.get_paginator(operation_name)
+        paginators[operation_name] = paginator
+        return paginator
+
+
+def validate_batch_size(batch_size: int) -> None:
+    """
+    Validate the ``batch_size`` (``PageSize``) argument of the list API.
+    A value larger than :data:`S3_LIST_MAX_KEYS` only emits a warning,
+    because S3 silently caps it on the server side.
+
+    .. versionadded:: 2.0.2
+    """
+    if batch_size < 1:
+        raise ValueError("``batch_size`` has to be greater than 0.")
+    if batch_size > S3_LIST_MAX_KEYS:
+        warnings.warn(
+            f"``batch_size`` {batch_size} is greater than {S3_LIST_MAX_KEYS}, "
+            f"S3 returns at most {S3_LIST_MAX_KEYS} keys per page.",
+            UserWarning,
+        )
+
+
+# max_workers -> shared thread pool
+_executors: T.Dict[int, ThreadPoolExecutor] = dict()
+_executors_pid = os.getpid()
+_executors_lock = threading.Lock()
+
+
+def get_executor(
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> ThreadPoolExecutor:
+    """
+    Get the module level thread pool of the given size, it is created on
+    first use and reused by all following calls, so the concurrent helpers
+    (e.g. :func:`~s3pathlib.better_client.upload.upload_dir`) don't pay the
+    thread startup cost on every call. The pool is shut down at exit.
+
+    Don't use the returned executor in a ``with`` statement, it would shut
+    down the shared pool.
+
+    .. versionadded:: 2.0.2
+    """
+    global _executors_pid
+    with _executors_lock:
+        # the threads don't survive ``os.fork``
+        if _executors_pid != os.getpid():
+            _executors.clear()
+            _executors_pid = os.getpid()
+        try:
+            return _executors[max_workers]
+        except KeyError:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="s3pathlib",
+            )
+            atexit.register(executor.shutdown)
+            _executors[max_workers] = executor
+            return executor
@@ -8,18 +8,17 @@ Improve the delete_object_ API.
 """
 
 import typing as T
-
+from collections import deque
 
 import botocore.exceptions
 from func_args import NOTHING, resolve_kwargs
 
 from .. import exc
 from ..utils import grouper_list, ensure_s3_dir
-from .list_objects import (
-    paginate_list_objects_v2,
-    is_content_an_object,
-)
+from .client import get_executor, resolve_max_workers
+from .list_objects import paginate_list_objects_v2
 from .list_object_versions import paginate_list_object_versions
+from .head_object import invalidate_object_exists_cache
 
 
 if T.TYPE_CHECKING:  # pragma: no cover
@@ -56,21 +55,31 @@ def delete_object(
 
     :return: See delete_object_.
     """
-    try:
-        response = s3_client.delete_object(
-            **resolve_kwargs(
-                Bucket=bucket,
-                Key=key,
-                MFA=mfa,
-                VersionId=version_id,
-                RequestPayer=request_payer,
-                BypassGovernanceRetention=bypass_governance_retention,
-                ExpectedBucketOwner=expected_bucket_owner,
-            )
+    invalidate_object_exists_cache(s3_client, bucket, key)
+    # fast path, most of the time only bucket and key are given
+    if (
+        version_id is NOTHING
+        and mfa is NOTHING
+        and request_payer is NOTHING
+        and bypass_governance_retention is NOTHING
+        and expected_bucket_owner is NOTHING
+    ):
+        kwargs = {"Bucket": bucket, "Key": key}
+    else:
+        kwargs = resolve_kwargs(
+            Bucket=bucket,
+            Key=key,
+            MFA=mfa,
+            VersionId=version_id,
+            RequestPayer=request_payer,
+            BypassGovernanceRetention=bypass_governance_retention,
+            ExpectedBucketOwner=expected_bucket_owner,
         )
+    try:
+        response = s3_client.delete_object(**kwargs)
         return response
     except botocore.exceptions.ClientError as e:  # pragma: no cover
-        if "Not Found" in str(e):
+        if exc.is_not_found_error(e):
             if ignore_not_found:
                 return None
             else:
@@ -79,6 +88,51 @@ def delete_object(
             raise e
 
 
+def _delete_objects(
+    s3_client: "S3Client",
+    kwargs: dict,
+) -> int:
+    # in quiet mode the response only lists the keys that failed to delete
+    response = s3_client.delete_objects(**kwargs)
+    return len(kwargs["Delete"]["Objects"]) - len(response.get("Errors", ()))
+
+
+def _delete_objects_in_parallel(
+    s3_client: "S3Client",
+    kwargs_list: T.Iterable[dict],
+    max_workers: T.Optional[int] = None,
+    max_pending: T.Optional[int] = None,
+) -> int:
+    """
+    Run delete_objects_ for each batch in the shared thread pool, so listing
+    the next batch and deleting the current batch can overlap. At most
+    ``max_pending`` (default ``max_workers * 2``) batches are in the memory
+    at the same time. See
+    :func:`~s3pathlib.better_client.client.resolve_max_workers` for
+    ``max_workers``.
+
+    :return: number of deleted objects
+    """
+    max_workers = resolve_max_workers(s3_client, max_workers)
+    if max_pending is None:
+        max_pending = max_workers * 2
+    executor = get_executor(max_workers)
+    count = 0
+    pending = deque()
+    try:
+        for kwargs in kwargs_list:
+            if len(pending) >= max_pending:
+                count += pending.popleft().result()
+            pending.append(executor.submit(_delete_objects, s3_client, kwargs))
+        while pending:
+            count += pending.popleft().result()
+    except Exception:
+        for future in pending:
+            future.cancel()
+        raise
+    return count
+
+
 def delete_dir(
     s3_client,
     bucket: str,
@@ -114,6 +168,11 @@ def delete_dir(
     :return: number of deleted objects
 
     .. versionadded:: 2.0.1
+
+    .. versionchanged:: 2.0.2
+
+        Use the quiet mode of delete_objects_, the response only carries the
+        keys that failed to delete, they are not counted as deleted.
     """
     if prefix == "": # pragma: no cover
         if skip_prompt is False:
@@ -127,7 +186,9 @@ def delete_dir(
     else:
         ensure_s3_dir(prefix)
 
-    contents_iterproxy = paginate_list_objects_v2(
+    # each ListObjectsV2 page has at most 1000 (batch_size) objects, which
+    # matches the delete_objects limit, so we can delete page by page
+    responses = paginate_list_objects_v2(
         s3_client=s3_client,
         bucket=bucket,
         prefix=prefix,
@@ -135,22 +196,26 @@ def delete_dir(
         limit=limit,
         request_payer=request_payer,
         expected_bucket_owner=expected_bucket_owner,
-    ).contents()
+    )
 
-    count = 0
-    for contents in grouper_list(contents_iterproxy, 1000):
-        kwargs = resolve_kwargs(
+    kwargs_list = (
+        resolve_kwargs(
             Bucket=bucket,
-            Delete={"Objects": [dict(Key=dct["Key"]) for dct in contents]},
+            Delete={
+                "Objects": [{"Key": dct["Key"]} for dct in contents],
+                "Quiet": True,
+            },
             MFA=mfa,
             RequestPayer=request_payer,
             BypassGovernanceRetention=bypass_governance_retention,
             ExpectedBucketOwner=expected_bucket_owner,
             ChecksumAlgorithm=check_sum_algorithm,
         )
-        s3_client.delete_objects(**kwargs)
-        count += len(contents)
+        for contents in responses.content_batches()
+    )
+    count = _delete_objects_in_parallel(s3_client, kwargs_list)
 
+    invalidate_object_exists_cache(s3_client, bucket, prefix)
     return count
 
 
@@ -190,6 +255,11 @@ def delete_object_versions(
     :return: number of deleted objects
 
     .. versionadded:: 2.0.1
+
+    .. versionchanged:: 2.0.2
+
+        Use the quiet mode of delete_objects_, the response only carries the
+        keys that failed to delete, they are not counted as deleted.
     """
     if prefix == "": # pragma: no cover
         if skip_prompt is False:
@@ -210,18 +280,15 @@ def delete_object_versions(
         limit=limit,
         expected_bucket_owner=expected_bucket_owner,
     )
-    count = 0
-    for key_and_version_id_pairs in grouper_list(
-        proxy.iterate_key_and_version(),
-        1000,
-    ):
-        kwargs = resolve_kwargs(
+    kwargs_list = (
+        resolve_kwargs(
             Bucket=bucket,
             Delete={
                 "Objects": [
-                    dict(Key=key, VersionId=version_id)
+                    {"Key": key, "VersionId": version_id}
                     for key, version_id in key_and_version_id_pairs
-                ]
+                ],
+                "Quiet": True,
             },
             MFA=mfa,
             RequestPayer=request_payer,
@@ -229,6 +296,11 @@ def delete_object_versions(
             ExpectedBucketOwner=expected_bucket_owner,
             ChecksumAlgorithm=check_sum_algorithm,
         )
-        s3_client.delete_objects(**kwargs)
-        count += len(key_and_version_id_pairs)
+        for key_and_version_id_pairs in grouper_list(
+            proxy.iterate_key_and_version(),
+            1000,
+        )
+    )
+    count = _delete_objects_in_parallel(s3_client, kwargs_list)
+    invalidate_object_exists_cache(s3_client, bucket, prefix)
     return count
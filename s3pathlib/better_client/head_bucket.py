@@ -7,17 +7,31 @@ Improve the head_bucket_ API.
 """
 
 import typing as T
+import time
+import weakref
 
 import botocore.exceptions
 
+from .. import exc
+
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from mypy_boto3_s3 import S3Client
 
+# opt-in cache for :func:`is_bucket_exists`, both positive and negative results
+# are cached. s3_client -> {bucket: (expire_at, is_exists)}. The entries of a
+# s3 client are dropped when the client is garbage collected.
+BUCKET_EXISTS_CACHE_TTL = 5  # seconds
+BUCKET_EXISTS_CACHE_MAXSIZE = 4096
+_bucket_exists_cache: "weakref.WeakKeyDictionary[S3Client, T.Dict[str, T.Tuple[float, bool]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def is_bucket_exists(
     s3_client: "S3Client",
     bucket: str,
+    cache: bool = False,
 ) -> bool:
     """
     Check if a bucket exists.
@@ -29,14 +43,37 @@ def is_bucket_exists(
 
     :param s3_client: See head_bucket_
     :param bucket: See head_bucket_
+    :param cache: Default is ``False``; if ``True``, reuse the result of
+        a recent probe of the same bucket (both exists and not exists)
+        within ``BUCKET_EXISTS_CACHE_TTL`` seconds. Use
+        ``is_bucket_exists.cache_clear()`` to drop all cached results.
 
     :return: A Boolean flag to indicate whether the bucket exists.
+
+    .. versionchanged:: 2.0.2
+
+        Add ``cache`` parameter.
     """
+    if cache:
+        client_cache = _bucket_exists_cache.setdefault(s3_client, dict())
+        cached = client_cache.get(bucket)
+        now = time.time()
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        flag = is_bucket_exists(s3_client=s3_client, bucket=bucket)
+        if len(client_cache) >= BUCKET_EXISTS_CACHE_MAXSIZE:
+            client_cache.clear()
+        client_cache[bucket] = (now + BUCKET_EXISTS_CACHE_TTL, flag)
+        return flag
+
     try:
         s3_client.head_bucket(Bucket=bucket)
         return True
     except botocore.exceptions.ClientError as e:
-        if "Not Found" in str(e):
+        if exc.is_not_found_error(e):
             return False
         else:  # pragma: no cover
             raise e
+
+
+is_bucket_exists.cache_clear = _bucket_exists_cache.clear
@@ -7,17 +7,74 @@ Improve the head_object_ API.
 """
 
 import typing as T
+import os
+import time
+import weakref
 from datetime import datetime
 
 import botocore.exceptions
-from func_args import NOTHING, resolve_kwargs
+from func_args import NOTHING
 
 from .. import exc
+from ..utils import make_kwargs_builder
+from .list_objects import paginate_list_objects_v2
+from .client import DEFAULT_MAX_WORKERS, get_executor
 
 if T.TYPE_CHECKING: # pragma: no cover
     from mypy_boto3_s3 import S3Client
     from mypy_boto3_s3.type_defs import HeadObjectOutputTypeDef
 
+# opt-in cache for :func:`is_object_exists`, both positive and negative results
+# are cached. s3_client -> {(bucket, key, version_id): (expire_at, is_exists)}.
+# The entries of a s3 client are dropped when the client is garbage collected.
+OBJECT_EXISTS_CACHE_TTL = 5  # seconds
+OBJECT_EXISTS_CACHE_MAXSIZE = 4096
+_object_exists_cache: "weakref.WeakKeyDictionary[S3Client, T.Dict[T.Tuple[str, str, str], T.Tuple[float, bool]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def invalidate_object_exists_cache(
+    s3_client: "S3Client",
+    bucket: str,
+    prefix: str = "",
+) -> None:
+    """
+    Remove the cached :func:`is_object_exists` results of all keys
+    starting with ``prefix``. Should be called after any write or delete.
+
+    .. versionadded:: 2.0.2
+    """
+    client_cache = _object_exists_cache.get(s3_client)
+    if not client_cache:  # the cache is opt-in, usually empty
+        return
+    for cache_key in list(client_cache):
+        if cache_key[0] == bucket and cache_key[1].startswith(prefix):
+            client_cache.pop(cache_key, None)
+
+
+# (head_object argument name, python parameter name)
+_HEAD_OBJECT_FIELDS = (
+    ("IfMatch", "if_match"),
+    ("IfModifiedSince", "if_modified_since"),
+    ("IfNoneMatch", "if_none_match"),
+    ("IfUnmodifiedSince", "if_unmodified_since"),
+    ("Range", "range"),
+    ("VersionId", "version_id"),
+    ("SSECustomerAlgorithm", "sse_customer_algorithm"),
+    ("SSECustomerKey", "sse_customer_key"),
+    ("RequestPayer", "request_payer"),
+    ("PartNumber", "part_number"),
+    ("ExpectedBucketOwner", "expected_bucket_owner"),
+    ("ChecksumMode", "checksum_mode"),
+)
+
+build_head_object_kwargs = make_kwargs_builder(
+    name="build_head_object_kwargs",
+    required_fields=(("Bucket", "bucket"), ("Key", "key")),
+    optional_fields=_HEAD_OBJECT_FIELDS,
+)
+
 
 def head_object(
     s3_client: "S3Client",
@@ -68,28 +125,27 @@ def head_object(
 
     :return: See head_object_
     """
+    kwargs = build_head_object_kwargs(
+        bucket,
+        key,
+        if_match=if_match,
+        if_modified_since=if_modified_since,
+        if_none_match=if_none_match,
+        if_unmodified_since=if_unmodified_since,
+        range=range,
+        version_id=version_id,
+        sse_customer_algorithm=sse_customer_algorithm,
+        sse_customer_key=sse_customer_key,
+        request_payer=request_payer,
+        part_number=part_number,
+        expected_bucket_owner=expected_bucket_owner,
+        checksum_mode=checksum_mode,
+    )
     try:
-        dct = s3_client.head_object(
-            **resolve_kwargs(
-                Bucket=bucket,
-                Key=key,
-                IfMatch=if_match,
-                IfModifiedSince=if_modified_since,
-                IfNoneMatch=if_none_match,
-                IfUnmodifiedSince=if_unmodified_since,
-                Range=range,
-                VersionId=version_id,
-                SSECustomerAlgorithm=sse_customer_algorithm,
-                SSECustomerKey=sse_customer_key,
-                RequestPayer=request_payer,
-                PartNumber=part_number,
-                ExpectedBucketOwner=expected_bucket_owner,
-                ChecksumMode=checksum_mode,
-            )
-        )
+        dct = s3_client.head_object(**kwargs)
         return dct
     except botocore.exceptions.ClientError as e:
-        if "Not Found" in str(e):
+        if exc.is_not_found_error(e):
             if ignore_not_found:
                 return None
             else:
@@ -103,6 +159,7 @@ def is_object_exists(
     bucket: str,
     key: str,
     version_id: str = NOTHING,
+    cache: bool = False,
 ) -> bool:
     """
     Check if an object exists. If you want to use the head_object_ API response
@@ -117,17 +174,130 @@ def is_object_exists(
     :param bucket: See head_object_
     :param key: See head_object_
     :param version_id: See head_object_
+    :param cache: Default is ``False``; if ``True``, reuse the result of
+        a recent probe of the same object (both exists and not exists)
+        within ``OBJECT_EXISTS_CACHE_TTL`` seconds. Use
+        ``is_object_exists.cache_clear()`` to drop all cached results.
 
     :return: A Boolean flag to indicate whether the object exists.
+
+    .. versionchanged:: 2.0.2
+
+        Add ``cache`` parameter.
     """
-    response = head_object(
-        s3_client=s3_client,
-        bucket=bucket,
-        key=key,
-        version_id=version_id,
-        ignore_not_found=True,
-    )
-    if response is None:
-        return False
+    if cache:
+        client_cache = _object_exists_cache.setdefault(s3_client, dict())
+        cache_key = (bucket, key, version_id)
+        cached = client_cache.get(cache_key)
+        now = time.time()
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        flag = is_object_exists(
+            s3_client=s3_client,
+            bucket=bucket,
+            key=key,
+            version_id=version_id,
+        )
+        if len(client_cache) >= OBJECT_EXISTS_CACHE_MAXSIZE:
+            client_cache.clear()
+        client_cache[cache_key] = (now + OBJECT_EXISTS_CACHE_TTL, flag)
+        return flag
+
+    # call the API directly, we don't need the response of head_object()
+    if version_id is NOTHING:
+        kwargs = {"Bucket": bucket, "Key": key}
     else:
+        kwargs = {"Bucket": bucket, "Key": key, "VersionId": version_id}
+    try:
+        s3_client.head_object(**kwargs)
         return True
+    except botocore.exceptions.ClientError as e:
+        if exc.is_not_found_error(e):
+            return False
+        else:  # pragma: no cover
+            raise e
+
+
+is_object_exists.cache_clear = _object_exists_cache.clear
+
+
+def exists_many(
+    s3_client: "S3Client",
+    bucket: str,
+    keys: T.Iterable[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    batch_size: int = 1000,
+    max_list_calls: T.Optional[int] = None,
+) -> T.Set[str]:
+    """
+    Check if many objects exist, return the set of existing keys.
+
+    If there are more than a few keys and they share a common prefix, it
+    lists the key range from ``min(keys)`` to ``max(keys)`` with ListObjectsV2,
+    it takes one API call per 1000 listed objects instead of one head_object_
+    per key. The listing stops after ``max_list_calls`` pages (the range is
+    wider than expected), the keys not reached yet are checked by
+    :func:`is_object_exists` in a thread pool, the same as when there are
+    only a few keys.
+
+    Example::
+
+        >>> exists_many(s3_client, "my-bucket", ["folder/1.txt", "folder/2.txt"])
+        {"folder/1.txt"}
+
+    :param s3_client: See head_object_
+    :param bucket: See head_object_
+    :param keys: the s3 object keys.
+    :param max_workers: number of threads for the head_object_ fallback.
+    :param batch_size: number of objects per ListObjectsV2 page.
+    :param max_list_calls: the maximum number of ListObjectsV2 pages to list,
+        by default it is ``ceil(len(keys) / max_workers)``, the number of
+        round trips the head_object_ fallback takes.
+
+    .. versionadded:: 2.0.2
+    """
+    keys = list(keys)
+    if len(keys) == 0:
+        return set()
+    existing_keys = set()
+    common_prefix = os.path.commonprefix(keys)
+    # don't list the entire bucket
+    if len(keys) >= 4 and common_prefix:
+        if max_list_calls is None:
+            max_list_calls = -(-len(keys) // max_workers)
+        key_set = set(keys)
+        min_key, max_key = min(keys), max(keys)
+        last_key = None
+        for i, response in enumerate(
+            paginate_list_objects_v2(
+                s3_client=s3_client,
+                bucket=bucket,
+                prefix=common_prefix,
+                batch_size=batch_size,
+                # any string that sorts right before min_key, the listed
+                # keys are filtered by key_set anyway
+                start_after=min_key[:-1],
+            ),
+            start=1,
+        ):
+            for content in response.get("Contents", ()):
+                key = content["Key"]
+                if key > max_key:
+                    return existing_keys
+                if key in key_set:
+                    existing_keys.add(key)
+                last_key = key
+            # the range is too wide, head the rest of the keys
+            if i >= max_list_calls and response.get("IsTruncated"):
+                break
+        else:
+            return existing_keys
+        if last_key is not None:
+            keys = [key for key in keys if key > last_key]
+
+    flags = get_executor(max_workers).map(
+        lambda key: is_object_exists(s3_client, bucket, key),
+        keys,
+    )
+    existing_keys.update(key for key, flag in zip(keys, flags) if flag)
+    return existing_keys
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+"""
+Use `S3 Inventory <https://docs.aws.amazon.com/AmazonS3/latest/userguide/storage-inventory.html>`_
+report to calculate total size and count objects. For a very large bucket,
+reading the inventory files is orders of magnitude cheaper than paginating
+the ListObjectsV2 API.
+
+Both ``CSV`` and ``Parquet`` inventory formats are supported. ``Parquet``
+requires `pyarrow <https://pypi.org/project/pyarrow/>`_ to be installed.
+
+.. versionadded:: 2.0.2
+"""
+
+import typing as T
+import io
+import csv
+import gzip
+import json
+import dataclasses
+from urllib.parse import unquote_plus
+
+try:
+    import pyarrow.parquet as pq
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pass
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_s3 import S3Client
+
+
+@dataclasses.dataclass
+class InventorySource:
+    """
+    Locate an S3 Inventory report.
+
+    :param bucket: the destination bucket of the inventory report.
+    :param manifest_key: the s3 key of the ``manifest.json`` file, for example
+        ``${prefix}/${source_bucket}/${config_id}/2023-01-01T00-00Z/manifest.json``.
+
+    .. versionadded:: 2.0.2
+    """
+
+    bucket: str
+    manifest_key: str
+
+
+def _is_object(key: str, size: int, include_folder: bool) -> bool:
+    return include_folder or key[-1:] != "/" or size != 0
+
+
+def _iter_key_and_size_in_csv(
+    body: T.IO[bytes],
+    key_index: int,
+    size_index: int,
+    is_latest_index: T.Optional[int] = None,
+    is_delete_marker_index: T.Optional[int] = None,
+) -> T.Iterator[T.Tuple[str, int]]:
+    # CSV inventory files are gzip compressed, without header,
+    # and the object key is URL-encoded. Decompress while reading, never
+    # hold the whole file in memory.
+    text = io.TextIOWrapper(gzip.GzipFile(fileobj=body), encoding="utf-8")
+    for row in csv.reader(text):
+        # the inventory of a versioned bucket has a row per version and per
+        # delete marker, only the latest version is an object in ListObjectsV2
+        if (is_latest_index is not None) and row[is_latest_index] != "true":
+            continue
+        if (is_delete_marker_index is not None) and (
+            row[is_delete_marker_index] == "true"
+        ):
+            continue
+        size = row[size_index]
+        yield unquote_plus(row[key_index]), int(size) if size else 0
+
+
+def _count_and_size_in_parquet(
+    body: bytes,
+    prefix: str,
+    include_folder: bool,
+) -> T.Tuple[int, int]:
+    count, total_size = 0, 0
+    parquet_file = pq.ParquetFile(io.BytesIO(body))
+    names = parquet_file.schema_arrow.names
+    columns = ["key", "size"]
+    # only in the inventory of a versioned bucket
+    has_is_latest = "is_latest" in names
+    has_is_delete_marker = "is_delete_marker" in names
+    if has_is_latest:
+        columns.append("is_latest")
+    if has_is_delete_marker:
+        columns.append("is_delete_marker")
+    for batch in parquet_file.iter_batches(columns=columns):
+        keys = batch.column(0)
+        sizes = pc.fill_null(batch.column(1), 0)
+        mask = None
+        if has_is_latest:
+            mask = pc.fill_null(batch.column(columns.index("is_latest")), True)
+        if has_is_delete_marker:
+            is_not_delete_marker = pc.invert(
+                pc.fill_null(batch.column(columns.index("is_delete_marker")), False)
+            )
+            mask = (
+                is_not_delete_marker
+                if mask is None
+                else pc.and_(mask, is_not_delete_marker)
+            )
+        if prefix:
+            starts_with = pc.starts_with(keys, prefix)
+            mask = starts_with if mask is None else pc.and_(mask, starts_with)
+        if include_folder is False:
+            is_object = pc.or_(
+                pc.invert(pc.ends_with(keys, "/")),
+                pc.not_equal(sizes, 0),
+            )
+            mask = is_object if mask is None else pc.and_(mask, is_object)
+        if mask is not None:
+            sizes = pc.filter(sizes, mask)
+        count += len(sizes)
+        total_size += pc.sum(sizes).as_py() or 0
+    return count, total_size
+
+
+def calculate_total_size_from_inventory(
+    s3_client: "S3Client",
+    inventory: InventorySource,
+    prefix: str = "",
+    include_folder: bool = False,
+    bucket: T.Optional[str] = None,
+) -> T.Tuple[int, int]:
+    """
+    Perform the "Calculate Total Size" action using the S3 Inventory report,
+    it reads the ``manifest.json`` file and all the data files it references.
+
+    :param s3_client: ``boto3.session.Session().client("s3")`` object
+    :param inventory: the :class:`InventorySource` object.
+    :param prefix: only count objects starting with this prefix.
+    :param include_folder: Default False, whether counting the hard folder
+        (an empty "/" object).
+    :param bucket: Optional, if given, make sure the inventory report is
+        generated for this bucket.
+
+    For the inventory of a versioned bucket (with ``IsLatest`` and
+    ``IsDeleteMarker`` fields), only the latest version that is not a delete
+    marker is counted, the same as ListObjectsV2.
+
+    :return: Tuple of ``(count, total_size)``. First value is number of objects,
+        Second value is total size in bytes.
+
+    .. versionadded:: 2.0.2
+    """
+    response = s3_client.get_object(
+        Bucket=inventory.bucket,
+        Key=inventory.manifest_key,
+    )
+    manifest = json.loads(response["Body"].read().decode("utf-8"))
+    if (bucket is not None) and (manifest["sourceBucket"] != bucket):
+        raise ValueError(
+            f"the inventory report is for bucket {manifest['sourceBucket']!r}, "
+            f"not {bucket!r}"
+        )
+    file_format = manifest["fileFormat"].lower()
+    if file_format == "csv":
+        columns = [col.strip() for col in manifest["fileSchema"].split(",")]
+        key_index = columns.index("Key")
+        size_index = columns.index("Size")
+        is_latest_index = (
+            columns.index("IsLatest") if "IsLatest" in columns else None
+        )
+        is_delete_marker_index = (
+            columns.index("IsDeleteMarker") if "IsDeleteMarker" in columns else None
+        )
+    elif file_format != "parquet":
+        raise ValueError(
+            f"{manifest['fileFormat']!r} inventory format is not supported, "
+            f"only 'CSV' and 'Parquet' are supported"
+        )
+
+    count, total_size = 0, 0
+    for file in manifest["files"]:
+        body = s3_client.get_object(
+            Bucket=inventory.bucket,
+            Key=file["key"],
+        )["Body"]
+        if file_format == "csv":
+            for key, size in _iter_key_and_size_in_csv(
+                body,
+                key_index,
+                size_index,
+                is_latest_index,
+                is_delete_marker_index,
+            ):
+                if key.startswith(prefix) and _is_object(key, size, include_folder):
+                    count += 1
+                    total_size += size
+        else:
+            # parquet reader needs random access to the footer
+            sub_count, sub_total_size = _count_and_size_in_parquet(
+                body.read(), prefix, include_folder
+            )
+            count += sub_count
+            total_size += sub_total_size
+    return count, total_size
@@ -10,10 +10,16 @@ Improve the list_object_versions_ and ListObjectVersions_ API.
 """
 
 import typing as T
+import itertools
 
 from func_args import NOTHING, resolve_kwargs
 from iterproxy import IterProxy
 
+from .client import get_paginator, validate_batch_size
+
+# ListObjectsV2 and ListObjectVersions share the same "CommonPrefixes" type
+from .list_objects import CommonPrefixTypeDefIterproxy, _EMPTY
+
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from mypy_boto3_s3 import S3Client
@@ -43,14 +49,6 @@ class DeleteMarkerEntryTypeDefIterproxy(IterProxy["DeleteMarkerEntryTypeDef"]):
     """
 
 
-class CommonPrefixTypeDefIterproxy(IterProxy["CommonPrefixTypeDef"]):
-    """
-    An iterproxy that yields the "CommonPrefixes" part of the ListObjectVersions_ response.
-
-    .. versionadded:: 2.0.1
-    """
-
-
 class ListObjectVersionsOutputTypeDefIterproxy(
     IterProxy["ListObjectVersionsOutputTypeDef"]
 ):
@@ -62,9 +60,9 @@ class ListObjectVersionsOutputTypeDefIterproxy(
     """
 
     def _yield_versions(self) -> T.Iterator["ObjectVersionTypeDef"]:
-        for response in self:
-            for version in response.get("Versions", []):
-                yield version
+        return itertools.chain.from_iterable(
+            response.get("Versions", _EMPTY) for response in self
+        )
 
     def versions(self) -> ObjectVersionTypeDefIterproxy:
         """
@@ -74,10 +72,22 @@ class ListObjectVersionsOutputTypeDefIterproxy(
         """
         return ObjectVersionTypeDefIterproxy(self._yield_versions())
 
-    def _yield_delete_markers(self) -> T.Iterator["DeleteMarkerEntryTypeDef"]:
+    def version_batches(self) -> T.Iterator[T.List["ObjectVersionTypeDef"]]:
+        """
+        Iterate the "Versions" list of each page as it is, empty pages are
+        skipped.
+
+        .. versionadded:: 2.0.2
+        """
         for response in self:
-            for delete_marker in response.get("DeleteMarkers", []):
-                yield delete_marker
+            versions = response.get("Versions")
+            if versions:
+                yield versions
+
+    def _yield_delete_markers(self) -> T.Iterator["DeleteMarkerEntryTypeDef"]:
+        return itertools.chain.from_iterable(
+            response.get("DeleteMarkers", _EMPTY) for response in self
+        )
 
     def delete_markers(self) -> DeleteMarkerEntryTypeDefIterproxy:
         """
@@ -88,9 +98,9 @@ class ListObjectVersionsOutputTypeDefIterproxy(
         return DeleteMarkerEntryTypeDefIterproxy(self._yield_delete_markers())
 
     def _yield_common_prefixes(self) -> T.Iterator["CommonPrefixTypeDef"]:
-        for response in self:
-            for common_prefix in response.get("CommonPrefixes", []):
-                yield common_prefix
+        return itertools.chain.from_iterable(
+            response.get("CommonPrefixes", _EMPTY) for response in self
+        )
 
     def common_prefixes(self) -> CommonPrefixTypeDefIterproxy:
         """
@@ -115,6 +125,9 @@ class ListObjectVersionsOutputTypeDefIterproxy(
 
     def versions_and_delete_markers_and_common_prefixes(
         self,
+        max_versions: T.Optional[int] = None,
+        max_delete_markers: T.Optional[int] = None,
+        max_common_prefixes: T.Optional[int] = None,
     ) -> T.Tuple[
         T.List["ObjectVersionTypeDef"],
         T.List["DeleteMarkerEntryTypeDef"],
@@ -123,20 +136,62 @@ class ListObjectVersionsOutputTypeDefIterproxy(
         """
         Return the full list of object versions, delete markers and folders.
 
+        :param max_versions: Optional, max number of versions to return.
+        :param max_delete_markers: Optional, max number of delete markers to return.
+        :param max_common_prefixes: Optional, max number of folders to return.
+
+        If all three limits are given, it stops fetching the next page once
+        all of them are reached.
+
         .. versionadded:: 2.0.1
+
+        .. versionchanged:: 2.0.2
+
+            Add ``max_versions``, ``max_delete_markers``, ``max_common_prefixes``
+            parameters.
         """
-        versions = list()
-        delete_markers = list()
-        common_prefixes = list()
+        if (
+            max_versions is None
+            and max_delete_markers is None
+            and max_common_prefixes is None
+        ):
+            responses = list(self)
+            versions = list(
+                itertools.chain.from_iterable(
+                    response.get("Versions", _EMPTY) for response in responses
+                )
+            )
+            delete_markers = list(
+                itertools.chain.from_iterable(
+                    response.get("DeleteMarkers", _EMPTY) for response in responses
+                )
+            )
+            common_prefixes = list(
+                itertools.chain.from_iterable(
+                    response.get("CommonPrefixes", _EMPTY) for response in responses
+                )
+            )
+            return versions, delete_markers, common_prefixes
+
+        versions, delete_markers, common_prefixes = list(), list(), list()
+        pairs = [
+            (versions, "Versions", max_versions),
+            (delete_markers, "DeleteMarkers", max_delete_markers),
+            (common_prefixes, "CommonPrefixes", max_common_prefixes),
+        ]
         for response in self:
-            (
-                versions_,
-                delete_markers_,
-                common_prefixes_,
-            ) = self.extract_versions_and_delete_markers_and_common_prefixes(response)
-            versions.extend(versions_)
-            delete_markers.extend(delete_markers_)
-            common_prefixes.extend(common_prefixes_)
+            is_all_full = True
+            for lst, key, cap in pairs:
+                if cap is None:
+                    lst.extend(response.get(key, _EMPTY))
+                    is_all_full = False
+                elif len(lst) < cap:
+                    lst.extend(response.get(key, _EMPTY)[: cap - len(lst)])
+                    if len(lst) < cap:
+                        is_all_full = False
+            # don't fetch the next page if we already have enough
+            if is_all_full:
+                break
         return versions, delete_markers, common_prefixes
 
     def iterate_key_and_version(self) -> T.Iterator[T.Tuple[str, str]]:
@@ -144,9 +199,9 @@ class ListObjectVersionsOutputTypeDefIterproxy(
         Iterate the key and version pairs.
         """
         for response in self:
-            for version in response.get("Versions", []):
+            for version in response.get("Versions", _EMPTY):
                 yield (version["Key"], version["VersionId"])
-            for delete_marker in response.get("DeleteMarkers", []):
+            for delete_marker in response.get("DeleteMarkers", _EMPTY):
                 yield (delete_marker["Key"], delete_marker["VersionId"])
 
 
@@ -184,16 +239,21 @@ def paginate_list_object_versions(
 
     :return: a :class:`ListObjectVersionsOutputTypeDefIterproxy` object.
 
+    .. note::
+
+        If you list many prefixes from multiple threads with the same client,
+        use :func:`~s3pathlib.better_client.client.make_tuned_s3_client`
+        to create a client with a larger connection pool.
+
     .. versionadded:: 2.0.1
     """
     # validate arguments
-    if batch_size < 1 or batch_size > 1000:  # pragma: no cover
-        raise ValueError("``batch_size`` has to be 1 ~ 1000.")
+    validate_batch_size(batch_size)
     if (limit is not NOTHING) and (batch_size > limit):  # pragma: no cover
         batch_size = limit
 
     def _paginate_list_objects_v2():
-        paginator = s3_client.get_paginator("list_object_versions")
+        paginator = get_paginator(s3_client, "list_object_versions")
         kwargs = resolve_kwargs(
             Bucket=bucket,
             Prefix=prefix,
@@ -205,7 +265,7 @@ def paginate_list_object_versions(
                 PageSize=batch_size,
             ),
         )
-        for response in paginator.paginate(**kwargs):
-            yield response
+        # the PageIterator is already lazy, no need to wrap it in a generator
+        return paginator.paginate(**kwargs)
 
     return ListObjectVersionsOutputTypeDefIterproxy(_paginate_list_objects_v2())
@@ -8,10 +8,19 @@ Improve the list_objects_v2_ and ListObjectsV2_ API.
 """
 
 import typing as T
+import itertools
+import dataclasses
+from datetime import datetime
+import queue
+import threading
+from concurrent.futures import wait
 
 from func_args import NOTHING, resolve_kwargs
 from iterproxy import IterProxy
 
+from .client import get_paginator, get_executor, validate_batch_size
+from .inventory import InventorySource, calculate_total_size_from_inventory
+
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from mypy_boto3_s3 import S3Client
@@ -23,6 +32,10 @@ if T.TYPE_CHECKING:  # pragma: no cover
 
     _ = ListObjectsV2OutputTypeDef
 
+# shared default for missing "Contents" / "CommonPrefixes" in a response,
+# avoid allocating a new empty list per page
+_EMPTY = ()
+
 
 class ObjectTypeDefIterproxy(IterProxy["ObjectTypeDef"]):
     """
@@ -34,12 +47,31 @@ class ObjectTypeDefIterproxy(IterProxy["ObjectTypeDef"]):
 
 class CommonPrefixTypeDefIterproxy(IterProxy["CommonPrefixTypeDef"]):
     """
-    An iterproxy that yields the "CommonPrefixes" part of the ListObjectsV2_ response.
+    An iterproxy that yields the "CommonPrefixes" part of the ListObjectsV2_
+    or ListObjectVersions response.
 
     .. versionadded:: 2.0.1
     """
 
 
+@dataclasses.dataclass
+class ContentColumns:
+    """
+    The "Contents" of one ListObjectsV2_ page in column layout, one list per
+    field, the i-th item of each list belongs to the same object. It is
+    handy for bulk processing, for example
+    ``numpy.array(columns.sizes, dtype=numpy.int64)`` or
+    ``pandas.DataFrame(dataclasses.asdict(columns))``.
+
+    .. versionadded:: 2.0.2
+    """
+
+    keys: T.List[str]
+    sizes: T.List[int]
+    etags: T.List[str]
+    last_modified: T.List[datetime]
+
+
 class ListObjectsV2OutputTypeDefIterproxy(IterProxy["ListObjectsV2OutputTypeDef"]):
     """
     An iterproxy that yields the original ListObjectsV2_ response.
@@ -49,9 +81,9 @@ class ListObjectsV2OutputTypeDefIterproxy(IterProxy["ListObjectsV2OutputTypeDef"
     """
 
     def _yield_content(self) -> T.Iterator["ObjectTypeDef"]:
-        for response in self:
-            for content in response.get("Contents", []):
-                yield content
+        return itertools.chain.from_iterable(
+            response.get("Contents", _EMPTY) for response in self
+        )
 
     def contents(self) -> ObjectTypeDefIterproxy:
         """
@@ -61,10 +93,39 @@ class ListObjectsV2OutputTypeDefIterproxy(IterProxy["ListObjectsV2OutputTypeDef"
         """
         return ObjectTypeDefIterproxy(self._yield_content())
 
-    def _yield_common_prefixes(self) -> T.Iterator["CommonPrefixTypeDef"]:
+    def content_batches(self) -> T.Iterator[T.List["ObjectTypeDef"]]:
+        """
+        Iterate the "Contents" list of each page as it is, empty pages are
+        skipped. Each batch has at most ``batch_size`` (up to 1000) items,
+        which can be passed to bulk API like delete_objects directly
+        without re-chunking.
+
+        .. versionadded:: 2.0.2
+        """
         for response in self:
-            for common_prefix in response.get("CommonPrefixes", []):
-                yield common_prefix
+            contents = response.get("Contents")
+            if contents:
+                yield contents
+
+    def content_columns(self) -> T.Iterator[ContentColumns]:
+        """
+        Iterate the "Contents" of each page as :class:`ContentColumns`,
+        empty pages are skipped. No per object ``S3Path`` or dict is created.
+
+        .. versionadded:: 2.0.2
+        """
+        for contents in self.content_batches():
+            yield ContentColumns(
+                keys=[content["Key"] for content in contents],
+                sizes=[content["Size"] for content in contents],
+                etags=[content["ETag"] for content in contents],
+                last_modified=[content["LastModified"] for content in contents],
+            )
+
+    def _yield_common_prefixes(self) -> T.Iterator["CommonPrefixTypeDef"]:
+        return itertools.chain.from_iterable(
+            response.get("CommonPrefixes", _EMPTY) for response in self
+        )
 
     def common_prefixs(self) -> CommonPrefixTypeDefIterproxy:
         """
@@ -93,18 +154,78 @@ class ListObjectsV2OutputTypeDefIterproxy(IterProxy["ListObjectsV2OutputTypeDef"
 
         .. versionadded:: 2.0.1
         """
-        contents = list()
-        common_prefixs = list()
-        for response in self:
-            (
-                _contents,
-                _common_prefixs,
-            ) = self.extract_contents_and_common_prefixes(response)
-            contents.extend(_contents)
-            common_prefixs.extend(_common_prefixs)
+        responses = list(self)
+        contents = list(
+            itertools.chain.from_iterable(
+                response.get("Contents", _EMPTY) for response in responses
+            )
+        )
+        common_prefixs = list(
+            itertools.chain.from_iterable(
+                response.get("CommonPrefixes", _EMPTY) for response in responses
+            )
+        )
         return contents, common_prefixs
 
 
+_SHARD_DONE = object()
+
+
+def _paginate_shards_in_parallel(
+    paginate: T.Callable[[str], T.Iterable[dict]],
+    shards: T.List[str],
+    max_workers: int,
+) -> T.Iterator[dict]:
+    """
+    Run ``paginate(shard)`` for each shard in the shared thread pool, and
+    yield the responses as soon as any of the worker gets it. The order of
+    the responses across shards is not guaranteed. When the consumer stops
+    early or a shard fails, the shards that haven't started are skipped.
+    """
+    response_queue = queue.Queue(maxsize=max_workers * 2)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # don't block forever if the consumer already stopped
+        while not stop.is_set():
+            try:
+                response_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def worker(shard: str):
+        try:
+            # the consumer already stopped, don't make any API call
+            if stop.is_set():
+                return
+            for response in paginate(shard):
+                if put(response) is False:
+                    return
+        except Exception as e:
+            put(e)
+        finally:
+            put(_SHARD_DONE)
+
+    executor = get_executor(max_workers)
+    futures = [executor.submit(worker, shard) for shard in shards]
+    n_done = 0
+    try:
+        while n_done < len(shards):
+            item = response_queue.get()
+            if item is _SHARD_DONE:
+                n_done += 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        stop.set()
+        # the pool is shared, wait for our own workers only
+        wait(futures)
+
+
 def paginate_list_objects_v2(
     s3_client: "S3Client",
     bucket: str,
@@ -117,6 +238,8 @@ def paginate_list_objects_v2(
     start_after: str = NOTHING,
     request_payer: str = NOTHING,
     expected_bucket_owner: str = NOTHING,
+    shard_prefixes: T.Optional[T.List[str]] = None,
+    max_workers: int = 16,
 ) -> ListObjectsV2OutputTypeDefIterproxy:
     """
     Wrapper of list_objects_v2_ and ListObjectsV2_. However, it returns
@@ -139,27 +262,41 @@ def paginate_list_objects_v2(
     :param s3_client: ``boto3.session.Session().client("s3")`` object.
     :param bucket: See ListObjectsV2_.
     :param prefix: See ListObjectsV2_.
-    :param batch_size: See ListObjectsV2_.
-    :param limit: See ListObjectsV2_.
+    :param batch_size: the ``PageSize`` (number of keys per API call),
+        See ListObjectsV2_.
+    :param limit: the ``MaxItems`` (total number of keys to return),
+        See ListObjectsV2_.
     :param delimiter: See ListObjectsV2_.
     :param encoding_type: See ListObjectsV2_.
     :param fetch_owner: See ListObjectsV2_.
     :param start_after: See ListObjectsV2_.
     :param request_payer: See ListObjectsV2_.
     :param expected_bucket_owner: See ListObjectsV2_.
+    :param shard_prefixes: Optional, a list of non-overlapping sub prefixes
+        under ``prefix``. If given, each of them is paginated in its own
+        thread and the responses are yielded as soon as they arrive, the
+        order is not guaranteed. It cannot be used with ``limit``.
+    :param max_workers: Number of threads when ``shard_prefixes`` is given.
+        The ``s3_client`` should have a connection pool larger than this,
+        see :func:`~s3pathlib.better_client.client.make_tuned_s3_client`.
 
     :return: a :class:`ListObjectsV2OutputTypeDefIterproxy` object.
 
     .. versionadded:: 2.0.1
+
+    .. versionchanged:: 2.0.2
+
+        Add ``shard_prefixes`` and ``max_workers`` parameters.
     """
     # validate arguments
-    if batch_size < 1 or batch_size > 1000:
-        raise ValueError("``batch_size`` has to be 1 ~ 1000.")
+    validate_batch_size(batch_size)
     if (limit is not NOTHING) and (batch_size > limit):
         batch_size = limit
+    if (shard_prefixes is not None) and (limit is not NOTHING):
+        raise ValueError("``shard_prefixes`` cannot be used with ``limit``.")
 
-    def _paginate_list_objects_v2():
-        paginator = s3_client.get_paginator("list_objects_v2")
+    def _paginate_list_objects_v2(prefix: str = prefix):
+        paginator = get_paginator(s3_client, "list_objects_v2")
         kwargs = resolve_kwargs(
             Bucket=bucket,
             Prefix=prefix,
@@ -174,8 +311,20 @@ def paginate_list_objects_v2(
                 PageSize=batch_size,
             ),
         )
-        for response in paginator.paginate(**kwargs):
-            yield response
+        # the PageIterator is already lazy, no need to wrap it in a generator
+        return paginator.paginate(**kwargs)
+
+    if shard_prefixes is not None:
+        for shard_prefix in shard_prefixes:
+            if not shard_prefix.startswith(prefix):
+                raise ValueError(f"{shard_prefix!r} is not under {prefix!r}")
+        return ListObjectsV2OutputTypeDefIterproxy(
+            _paginate_shards_in_parallel(
+                paginate=_paginate_list_objects_v2,
+                shards=shard_prefixes,
+                max_workers=max_workers,
+            )
+        )
 
     return ListObjectsV2OutputTypeDefIterproxy(_paginate_list_objects_v2())
 
@@ -187,11 +336,120 @@ def is_content_an_object(content: "ObjectTypeDef") -> bool:
     Truth table
 
     - ends with "/", size is 0: False
-    - ends with "/", size > 0: False
-    - ends without "/", size is 0:
-    - ends without "/", size > 0:
+    - ends with "/", size > 0: True
+    - ends without "/", size is 0: True
+    - ends without "/", size > 0: True
+    """
+    # compare the last character directly, cheaper than a str.endswith call
+    return content["Key"][-1:] != "/" or content["Size"] != 0
+
+
+@dataclasses.dataclass
+class PrefixStats:
     """
-    return (not content["Key"].endswith("/")) or (content["Size"] != 0)
+    Statistics of the objects under a s3 prefix, see :func:`scan_prefix_stats`.
+
+    The ``min_size``, ``max_size`` and ``last_modified`` are ``None`` if
+    there is no object.
+
+    .. versionadded:: 2.0.2
+    """
+
+    count: int = 0
+    total_size: int = 0
+    min_size: T.Optional[int] = None
+    max_size: T.Optional[int] = None
+    last_modified: T.Optional[datetime] = None
+
+
+def _iter_sharded_responses(
+    s3_client: "S3Client",
+    bucket: str,
+    prefix: str,
+    max_workers: int,
+) -> T.Iterator[dict]:
+    """
+    Yield all ListObjectsV2_ responses under prefix. The top level is listed
+    with ``Delimiter="/"``, then each sub folder found is paginated in its
+    own thread.
+    """
+    shards = list()
+    for response in paginate_list_objects_v2(
+        s3_client=s3_client,
+        bucket=bucket,
+        prefix=prefix,
+        delimiter="/",
+    ):
+        shards.extend(dct["Prefix"] for dct in response.get("CommonPrefixes", _EMPTY))
+        yield response
+    if shards:
+        yield from paginate_list_objects_v2(
+            s3_client=s3_client,
+            bucket=bucket,
+            prefix=prefix,
+            shard_prefixes=shards,
+            max_workers=max_workers,
+        )
+
+
+def scan_prefix_stats(
+    s3_client: "S3Client",
+    bucket: str,
+    prefix: str,
+    include_folder: bool = False,
+    max_workers: int = 1,
+) -> PrefixStats:
+    """
+    Calculate the count, total size, min / max size and the latest
+    last modified time of objects under prefix, in a single walk of
+    ListObjectsV2_.
+
+    :param s3_client: ``boto3.session.Session().client("s3")`` object
+    :param bucket: S3 bucket name
+    :param prefix: The s3 prefix (logic directory) you want to calculate
+    :param include_folder: Default False, whether counting the hard folder
+        (an empty "/" object).
+    :param max_workers: Default 1, list everything in one thread. If greater
+        than 1, the sub folders of the prefix are listed concurrently, it is
+        faster for a large prefix with many sub folders. The ``s3_client``
+        should have a connection pool larger than this, see
+        :func:`~s3pathlib.better_client.client.make_tuned_s3_client`.
+
+    .. versionadded:: 2.0.2
+    """
+    count = 0
+    total_size = 0
+    min_size = None
+    max_size = None
+    last_modified = None
+    if max_workers > 1:
+        responses = _iter_sharded_responses(s3_client, bucket, prefix, max_workers)
+    else:
+        responses = paginate_list_objects_v2(
+            s3_client=s3_client,
+            bucket=bucket,
+            prefix=prefix,
+        )
+    # iterate the raw pages, skip the IterProxy filter chain
+    for response in responses:
+        for content in response.get("Contents", _EMPTY):
+            size = content["Size"]
+            if include_folder or content["Key"][-1:] != "/" or size != 0:
+                count += 1
+                total_size += size
+                if min_size is None or size < min_size:
+                    min_size = size
+                if max_size is None or size > max_size:
+                    max_size = size
+                if last_modified is None or content["LastModified"] > last_modified:
+                    last_modified = content["LastModified"]
+    return PrefixStats(
+        count=count,
+        total_size=total_size,
+        min_size=min_size,
+        max_size=max_size,
+        last_modified=last_modified,
+    )
 
 
 def calculate_total_size(
@@ -199,6 +457,8 @@ def calculate_total_size(
     bucket: str,
     prefix: str,
     include_folder: bool = False,
+    inventory: T.Optional[InventorySource] = None,
+    max_workers: int = 1,
 ) -> T.Tuple[int, int]:
     """
     Perform the "Calculate Total Size" action in AWS S3 console.
@@ -208,25 +468,39 @@ def calculate_total_size(
     :param prefix: The s3 prefix (logic directory) you want to calculate
     :param include_folder: Default False, whether counting the hard folder
         (an empty "/" object).
+    :param inventory: Optional, if given, read the S3 Inventory report
+        instead of calling ListObjectsV2, see
+        :func:`~s3pathlib.better_client.inventory.calculate_total_size_from_inventory`.
+        The result is as fresh as the latest inventory report.
+    :param max_workers: See :func:`scan_prefix_stats`.
 
     :return: Tuple of ``(count, total_size)``. First value is number of objects,
         Second value is total size in bytes.
 
     .. versionadded:: 2.0.1
+
+    .. versionchanged:: 2.0.2
+
+        Add ``inventory`` and ``max_workers`` parameter. It is a thin
+        wrapper of :func:`scan_prefix_stats` now, use that if you also need
+        the min / max size or the last modified time.
     """
-    count = 0
-    total_size = 0
-    contents_iterproxy = paginate_list_objects_v2(
+    if inventory is not None:
+        return calculate_total_size_from_inventory(
+            s3_client=s3_client,
+            inventory=inventory,
+            prefix=prefix,
+            include_folder=include_folder,
+            bucket=bucket,
+        )
+    stats = scan_prefix_stats(
         s3_client=s3_client,
         bucket=bucket,
         prefix=prefix,
-    ).contents()
-    if include_folder is False:
-        contents_iterproxy = contents_iterproxy.filter(is_content_an_object)
-    for content in contents_iterproxy:
-        count += 1
-        total_size += content["Size"]
-    return count, total_size
+        include_folder=include_folder,
+        max_workers=max_workers,
+    )
+    return stats.count, stats.total_size
 
 
 def count_objects(
@@ -234,6 +508,8 @@ def count_objects(
     bucket: str,
     prefix: str,
     include_folder: bool = False,
+    inventory: T.Optional[InventorySource] = None,
+    max_workers: int = 1,
 ) -> int:
     """
     Count number of objects under prefix.
@@ -243,19 +519,32 @@ def count_objects(
     :param prefix: The s3 prefix (logic directory) you want to calculate
     :param include_folder: Default False, whether counting the hard folder
         (an empty "/" object).
+    :param inventory: Optional, if given, read the S3 Inventory report
+        instead of calling ListObjectsV2.
+    :param max_workers: See :func:`scan_prefix_stats`.
 
     :return: Number of objects under prefix.
 
     .. versionadded:: 2.0.1
+
+    .. versionchanged:: 2.0.2
+
+        Add ``inventory`` and ``max_workers`` parameter. It is a thin
+        wrapper of :func:`scan_prefix_stats` now, use that if you also need
+        the min / max size or the last modified time.
     """
-    contents_iterproxy = paginate_list_objects_v2(
+    if inventory is not None:
+        return calculate_total_size_from_inventory(
+            s3_client=s3_client,
+            inventory=inventory,
+            prefix=prefix,
+            include_folder=include_folder,
+            bucket=bucket,
+        )[0]
+    return scan_prefix_stats(
         s3_client=s3_client,
         bucket=bucket,
         prefix=prefix,
-    ).contents()
-    if include_folder is False:
-        contents_iterproxy = contents_iterproxy.filter(is_content_an_object)
-    count = 0
-    for count, _ in enumerate(contents_iterproxy, start=1):
-        pass
-    return count
+        include_folder=include_folder,
+        max_workers=max_workers,
+    ).count
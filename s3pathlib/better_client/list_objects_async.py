@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+Async version of :func:`~s3pathlib.better_client.list_objects.paginate_list_objects_v2`
+for aiobotocore_ s3 client.
+
+.. _aiobotocore: https://github.com/aio-libs/aiobotocore
+.. _ListObjectsV2: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/paginator/ListObjectsV2.html
+
+.. versionadded:: 2.0.2
+"""
+
+import typing as T
+import asyncio
+
+from func_args import NOTHING, resolve_kwargs
+
+from .client import validate_batch_size
+
+
+_SHARD_DONE = object()
+
+
+async def apaginate_list_objects_v2(
+    s3_client,
+    bucket: str,
+    prefix: str,
+    batch_size: int = 1000,
+    delimiter: str = NOTHING,
+    encoding_type: str = NOTHING,
+    fetch_owner: bool = NOTHING,
+    start_after: str = NOTHING,
+    request_payer: str = NOTHING,
+    expected_bucket_owner: str = NOTHING,
+    shard_prefixes: T.Optional[T.List[str]] = None,
+    concurrency: int = 32,
+) -> T.AsyncIterator[dict]:
+    """
+    Async generator that yields the original ListObjectsV2_ response.
+    It works with the aiobotocore_ s3 client, the caller is responsible
+    for the life cycle of the client.
+
+    Example::
+
+        >>> from aiobotocore.session import get_session
+        >>> async with get_session().create_client("s3") as s3_client:
+        ...     async for response in apaginate_list_objects_v2(
+        ...         s3_client=s3_client,
+        ...         bucket="my-bucket",
+        ...         prefix="my-folder/",
+        ...         shard_prefixes=["my-folder/a/", "my-folder/b/"],
+        ...     ):
+        ...         for content in response.get("Contents", []):
+        ...             print(content["Key"])
+
+    :param s3_client: ``aiobotocore.session.get_session().create_client("s3")`` object.
+    :param bucket: See ListObjectsV2_.
+    :param prefix: See ListObjectsV2_.
+    :param batch_size: See ListObjectsV2_.
+    :param delimiter: See ListObjectsV2_.
+    :param encoding_type: See ListObjectsV2_.
+    :param fetch_owner: See ListObjectsV2_.
+    :param start_after: See ListObjectsV2_.
+    :param request_payer: See ListObjectsV2_.
+    :param expected_bucket_owner: See ListObjectsV2_.
+    :param shard_prefixes: Optional, a list of non-overlapping sub prefixes
+        under ``prefix``. If given, all of them are paginated concurrently
+        and the responses are yielded as soon as they arrive, the order is
+        not guaranteed.
+    :param concurrency: max number of shards being paginated at the same time.
+
+    .. versionadded:: 2.0.2
+    """
+    # validate arguments
+    validate_batch_size(batch_size)
+    if shard_prefixes is None:
+        shard_prefixes = [prefix]
+    for shard_prefix in shard_prefixes:
+        if not shard_prefix.startswith(prefix):
+            raise ValueError(f"{shard_prefix!r} is not under {prefix!r}")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    response_queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def _paginate(shard_prefix: str):
+        try:
+            async with semaphore:
+                paginator = s3_client.get_paginator("list_objects_v2")
+                kwargs = resolve_kwargs(
+                    Bucket=bucket,
+                    Prefix=shard_prefix,
+                    Delimiter=delimiter,
+                    EncodingType=encoding_type,
+                    FetchOwner=fetch_owner,
+                    StartAfter=start_after,
+                    RequestPayer=request_payer,
+                    ExpectedBucketOwner=expected_bucket_owner,
+                    PaginationConfig=dict(PageSize=batch_size),
+                )
+                async for response in paginator.paginate(**kwargs):
+                    await response_queue.put(response)
+        except Exception as e:
+            await response_queue.put(e)
+        # don't put in ``finally``, a cancelled task may block on a full queue
+        await response_queue.put(_SHARD_DONE)
+
+    tasks = [
+        asyncio.ensure_future(_paginate(shard_prefix))
+        for shard_prefix in shard_prefixes
+    ]
+    n_done = 0
+    try:
+        while n_done < len(tasks):
+            item = await response_queue.get()
+            if item is _SHARD_DONE:
+                n_done += 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+"""
+Improve the put_object_ API.
+
+.. _put_object: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/client/put_object.html
+
+.. versionadded:: 2.0.2
+"""
+
+import typing as T
+from datetime import datetime
+from concurrent.futures import wait, FIRST_COMPLETED
+
+from func_args import NOTHING
+
+from ..type import TagType, MetadataType
+from ..tag import encode_url_query
+from ..utils import make_kwargs_builder
+from .client import get_executor, resolve_max_workers
+from .head_object import invalidate_object_exists_cache
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_s3 import S3Client
+    from mypy_boto3_s3.type_defs import PutObjectOutputTypeDef
+
+
+# (put_object argument name, python parameter name)
+_PUT_OBJECT_FIELDS = (
+    ("Metadata", "metadata"),
+    ("Tagging", "tags"),
+    ("ACL", "acl"),
+    ("CacheControl", "cache_control"),
+    ("ContentDisposition", "content_disposition"),
+    ("ContentEncoding", "content_encoding"),
+    ("ContentLanguage", "content_language"),
+    ("ContentLength", "content_length"),
+    ("ContentMD5", "content_md5"),
+    ("ContentType", "content_type"),
+    ("ChecksumAlgorithm", "checksum_algorithm"),
+    ("ChecksumCRC32", "checksum_crc32"),
+    ("ChecksumCRC32C", "checksum_crc32c"),
+    ("ChecksumSHA1", "checksum_sha1"),
+    ("ChecksumSHA256", "checksum_sha256"),
+    ("Expires", "expires_datetime"),
+    ("GrantFullControl", "grant_full_control"),
+    ("GrantRead", "grant_read"),
+    ("GrantReadACP", "grant_read_acp"),
+    ("GrantWriteACP", "grant_write_acp"),
+    ("ServerSideEncryption", "server_side_encryption"),
+    ("StorageClass", "storage_class"),
+    ("WebsiteRedirectLocation", "website_redirect_location"),
+    ("SSECustomerAlgorithm", "sse_customer_algorithm"),
+    ("SSECustomerKey", "sse_customer_key"),
+    ("SSEKMSKeyId", "sse_kms_key_id"),
+    ("SSEKMSEncryptionContext", "sse_kms_encryption_context"),
+    ("BucketKeyEnabled", "bucket_key_enabled"),
+    ("RequestPayer", "request_payer"),
+    ("ObjectLockMode", "object_lock_mode"),
+    ("ObjectLockRetainUntilDate", "object_lock_retain_until_datetime"),
+    ("ObjectLockLegalHoldStatus", "object_lock_legal_hold_status"),
+    ("ExpectedBucketOwner", "expected_bucket_owner"),
+)
+
+build_put_object_kwargs = make_kwargs_builder(
+    name="build_put_object_kwargs",
+    required_fields=(("Bucket", "bucket"), ("Key", "key"), ("Body", "body")),
+    optional_fields=_PUT_OBJECT_FIELDS,
+    converters={"tags": encode_url_query},
+)
+
+
+def put_object(
+    s3_client: "S3Client",
+    bucket: str,
+    key: str,
+    body: T.Union[bytes, T.IO] = b"",
+    metadata: MetadataType = NOTHING,
+    tags: TagType = NOTHING,
+    acl: str = NOTHING,
+    cache_control: str = NOTHING,
+    content_disposition: str = NOTHING,
+    content_encoding: str = NOTHING,
+    content_language: str = NOTHING,
+    content_length: int = NOTHING,
+    content_md5: str = NOTHING,
+    content_type: str = NOTHING,
+    checksum_algorithm: str = NOTHING,
+    checksum_crc32: str = NOTHING,
+    checksum_crc32c: str = NOTHING,
+    checksum_sha1: str = NOTHING,
+    checksum_sha256: str = NOTHING,
+    expires_datetime: datetime = NOTHING,
+    grant_full_control: str = NOTHING,
+    grant_read: str = NOTHING,
+    grant_read_acp: str = NOTHING,
+    grant_write_acp: str = NOTHING,
+    server_side_encryption: str = NOTHING,
+    storage_class: str = NOTHING,
+    website_redirect_location: str = NOTHING,
+    sse_customer_algorithm: str = NOTHING,
+    sse_customer_key: str = NOTHING,
+    sse_kms_key_id: str = NOTHING,
+    sse_kms_encryption_context: str = NOTHING,
+    bucket_key_enabled: bool = NOTHING,
+    request_payer: str = NOTHING,
+    object_lock_mode: str = NOTHING,
+    object_lock_retain_until_datetime: datetime = NOTHING,
+    object_lock_legal_hold_status: str = NOTHING,
+    expected_bucket_owner: str = NOTHING,
+) -> "PutObjectOutputTypeDef":
+    """
+    Wrapper of put_object_.
+
+    :param s3_client: ``boto3.session.Session().client("s3")`` object.
+    :param bucket: See put_object_.
+    :param key: See put_object_.
+    :param body: See put_object_.
+    :param metadata: the s3 object metadata in string key value pair dict.
+    :param tags: the s3 object tags in string key value pair dict.
+    :param acl: See put_object_.
+    :param cache_control: See put_object_.
+    :param content_disposition: See put_object_.
+    :param content_encoding: See put_object_.
+    :param content_language: See put_object_.
+    :param content_length: See put_object_.
+    :param content_md5: See put_object_.
+    :param content_type: See put_object_.
+    :param checksum_algorithm: See put_object_.
+    :param checksum_crc32: See put_object_.
+    :param checksum_crc32c: See put_object_.
+    :param checksum_sha1: See put_object_.
+    :param checksum_sha256: See put_object_.
+    :param expires_datetime: See put_object_.
+    :param grant_full_control: See put_object_.
+    :param grant_read: See put_object_.
+    :param grant_read_acp: See put_object_.
+    :param grant_write_acp: See put_object_.
+    :param server_side_encryption: See put_object_.
+    :param storage_class: See put_object_.
+    :param website_redirect_location: See put_object_.
+    :param sse_customer_algorithm: See put_object_.
+    :param sse_customer_key: See put_object_.
+    :param sse_kms_key_id: See put_object_.
+    :param sse_kms_encryption_context: See put_object_.
+    :param bucket_key_enabled: See put_object_.
+    :param request_payer: See put_object_.
+    :param object_lock_mode: See put_object_.
+    :param object_lock_retain_until_datetime: See put_object_.
+    :param object_lock_legal_hold_status: See put_object_.
+    :param expected_bucket_owner: See put_object_.
+
+    :return: See put_object_.
+
+    .. versionadded:: 2.0.2
+    """
+    kwargs = build_put_object_kwargs(
+        bucket,
+        key,
+        body,
+        tags=tags,
+        metadata=metadata,
+        acl=acl,
+        cache_control=cache_control,
+        content_disposition=content_disposition,
+        content_encoding=content_encoding,
+        content_language=content_language,
+        content_length=content_length,
+        content_md5=content_md5,
+        content_type=content_type,
+        checksum_algorithm=checksum_algorithm,
+        checksum_crc32=checksum_crc32,
+        checksum_crc32c=checksum_crc32c,
+        checksum_sha1=checksum_sha1,
+        checksum_sha256=checksum_sha256,
+        expires_datetime=expires_datetime,
+        grant_full_control=grant_full_control,
+        grant_read=grant_read,
+        grant_read_acp=grant_read_acp,
+        grant_write_acp=grant_write_acp,
+        server_side_encryption=server_side_encryption,
+        storage_class=storage_class,
+        website_redirect_location=website_redirect_location,
+        sse_customer_algorithm=sse_customer_algorithm,
+        sse_customer_key=sse_customer_key,
+        sse_kms_key_id=sse_kms_key_id,
+        sse_kms_encryption_context=sse_kms_encryption_context,
+        bucket_key_enabled=bucket_key_enabled,
+        request_payer=request_payer,
+        object_lock_mode=object_lock_mode,
+        object_lock_retain_until_datetime=object_lock_retain_until_datetime,
+        object_lock_legal_hold_status=object_lock_legal_hold_status,
+        expected_bucket_owner=expected_bucket_owner,
+    )
+    response = s3_client.put_object(**kwargs)
+    invalidate_object_exists_cache(s3_client, bucket, key)
+    return response
+
+
+def put_objects_concurrent(
+    s3_client: "S3Client",
+    kwargs_iterable: T.Iterable[T.Dict[str, T.Any]],
+    max_workers: T.Optional[int] = None,
+    max_pending: T.Optional[int] = None,
+) -> T.Iterator[T.Tuple[T.Dict[str, T.Any], "PutObjectOutputTypeDef"]]:
+    """
+    Call :func:`put_object` for many objects concurrently in a thread pool,
+    and yield ``(kwargs, response)`` as soon as each of them finishes.
+    The order is not guaranteed.
+
+    boto3 client is thread safe, all threads share the same ``s3_client``.
+    It should be created by
+    :func:`~s3pathlib.better_client.client.make_tuned_s3_client` with
+    ``pool_size >= max_workers``, its ``adaptive`` retry mode handles the
+    ``SlowDown`` error with backoff. An explicit ``max_workers`` larger
+    than the pool emits a warning.
+
+    Example::
+
+        >>> s3_client = make_tuned_s3_client(pool_size=32)
+        >>> kwargs_iterable = (
+        ...     dict(bucket="my-bucket", key=f"data/{i}.json", body=b"...")
+        ...     for i in range(10000)
+        ... )
+        >>> for kwargs, response in put_objects_concurrent(s3_client, kwargs_iterable):
+        ...     print(kwargs["key"], response["ETag"])
+
+    :param s3_client: ``boto3.session.Session().client("s3")`` object.
+    :param kwargs_iterable: an iterable of :func:`put_object` keyword arguments
+        (without ``s3_client``), it is consumed lazily.
+    :param max_workers: number of threads, the threads are reused across
+        calls, see :func:`~s3pathlib.better_client.client.get_executor`.
+        By default it is
+        :data:`~s3pathlib.better_client.client.DEFAULT_MAX_WORKERS`, capped
+        to the ``max_pool_connections`` of the ``s3_client``.
+    :param max_pending: max number of submitted but unfinished put, default
+        is ``max_workers * 2``. It limits how many object bodies are in
+        the memory at the same time.
+
+    .. versionadded:: 2.0.2
+    """
+    max_workers = resolve_max_workers(s3_client, max_workers)
+    if max_pending is None:
+        max_pending = max_workers * 2
+    executor = get_executor(max_workers)
+    pending = dict()
+    try:
+        for kwargs in kwargs_iterable:
+            future = executor.submit(put_object, s3_client, **kwargs)
+            pending[future] = kwargs
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        # the consumer stopped early or a put failed, the pool is shared,
+        # cancel the queued puts and wait for the running ones only
+        for future in pending:
+            future.cancel()
+        wait(pending)
@@ -8,13 +8,23 @@ Update S3 bucket, object tagging.
 
 .. _get_object_tagging: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/client/get_object_tagging.html
 .. _put_object_tagging: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/client/put_object_tagging.html
+.. _head_object: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/client/head_object.html
+.. _get_object: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/client/get_object.html
 """
 
 import typing as T
+from concurrent.futures import as_completed
+
 import botocore.exceptions
 from func_args import NOTHING, resolve_kwargs
 
 from .. import tag
+from .. import exc
+from .client import (
+    get_executor,
+    resolve_max_workers,
+    warm_up_client,
+)
 
 
 if T.TYPE_CHECKING:  # pragma: no cover
@@ -30,9 +40,14 @@ def update_bucket_tagging(
 ) -> tag.TagType:
     """
     Allow you to use ``dict.update`` liked API to update s3 bucket tagging.
-    It is a combination of get, update and put.
+    It is a combination of get, update and put. The put is skipped
+    if all the given tags are already there.
 
     :return: the updated tags in Python dict.
+
+    .. versionchanged:: 2.0.2
+
+        Skip the put if nothing changed.
     """
     try:
         res = s3_client.get_bucket_tagging(
@@ -41,18 +56,22 @@ def update_bucket_tagging(
                 ExpectedBucketOwner=expected_bucket_owner,
             )
         )
-        existing_tags = tag.parse_tags(res.get("TagSet", []))
+        tag_set = res.get("TagSet", [])
     except botocore.exceptions.ClientError as e:
-        if "NoSuchTagSet" in str(e):
-            existing_tags = {}
+        if exc.get_error_code(e) == "NoSuchTagSet":
+            tag_set = []
         else: # pragma: no cover
             raise e
 
+    existing_tags = tag.parse_tags(tag_set)
+    # nothing changed, no need to put it back
+    if all(existing_tags.get(k) == v for k, v in tags.items()):
+        return existing_tags
     existing_tags.update(tags)
     s3_client.put_bucket_tagging(
         **resolve_kwargs(
             Bucket=bucket,
-            Tagging=dict(TagSet=tag.encode_for_put_bucket_tagging(existing_tags)),
+            Tagging={"TagSet": tag.merge_tag_set(tag_set, tags)},
             ChecksumAlgorithm=checksum_algorithm,
             ExpectedBucketOwner=expected_bucket_owner,
         )
@@ -70,14 +89,43 @@ def update_object_tagging(
     checksum_algorithm: str = NOTHING,
     expected_bucket_owner: str = NOTHING,
     request_payer: str = NOTHING,
+    merge: bool = True,
+    known_empty: bool = False,
 ) -> T.Tuple[T.Optional[str], tag.TagType]:
     """
     Allow you to use ``dict.update`` liked API to update s3 object tagging.
     It is a combination of get, update and put.
 
+    :param merge: Default True, merge ``tags`` into the existing tags.
+        If False, replace the existing tags with ``tags`` without reading
+        them first, it saves one get_object_tagging_ API call.
+    :param known_empty: Default False, if True, the caller knows that the
+        object has no tag, merging is the same as replacing, the
+        get_object_tagging_ API call is skipped.
+
     :return: the tuple of ``(version_id, tags)``, where version_id is optional,
         and tags is the updated tags in Python dict.
+
+    .. versionchanged:: 2.0.2
+
+        Add ``merge`` and ``known_empty`` parameter. Skip the
+        put_object_tagging_ API call if the tags are not changed.
     """
+    if merge is False or known_empty:
+        res = s3_client.put_object_tagging(
+            **resolve_kwargs(
+                Bucket=bucket,
+                Key=key,
+                Tagging={"TagSet": tag.encode_for_put_object_tagging(tags)},
+                VersionId=version_id,
+                ContentMD5=content_md5,
+                ChecksumAlgorithm=checksum_algorithm,
+                ExpectedBucketOwner=expected_bucket_owner,
+                RequestPayer=request_payer,
+            )
+        )
+        return res.get("VersionId", None), dict(tags)
+
     res = s3_client.get_object_tagging(
         **resolve_kwargs(
             Bucket=bucket,
@@ -88,13 +136,18 @@ def update_object_tagging(
         )
     )
     existing_version_id = res.get("VersionId", None)
-    existing_tags = tag.parse_tags(res.get("TagSet", []))
+    tag_set = res.get("TagSet", [])
+    existing_tags = tag.parse_tags(tag_set)
+    # nothing changed, no need to put it back
+    if all(existing_tags.get(k) == v for k, v in tags.items()):
+        return existing_version_id, existing_tags
     existing_tags.update(tags)
     s3_client.put_object_tagging(
         **resolve_kwargs(
             Bucket=bucket,
             Key=key,
-            Tagging=dict(TagSet=tag.encode_for_put_object_tagging(existing_tags)),
+            # patch the original tag set instead of re-encoding the merged dict
+            Tagging={"TagSet": tag.merge_tag_set(tag_set, tags)},
             VersionId=res.get("VersionId", NOTHING),
             ContentMD5=content_md5,
             ChecksumAlgorithm=checksum_algorithm,
@@ -103,3 +156,93 @@ def update_object_tagging(
         )
     )
     return existing_version_id, existing_tags
+
+
+def update_object_tagging_from_head(
+    s3_client: "S3Client",
+    bucket: str,
+    key: str,
+    tags: tag.TagType,
+    head_response: dict,
+    expected_bucket_owner: str = NOTHING,
+    request_payer: str = NOTHING,
+) -> T.Tuple[T.Optional[str], tag.TagType]:
+    """
+    Same as :func:`update_object_tagging`, but reuse the head_object_
+    (or get_object_) response you already have. If it says the object has
+    no tag (``TagCount`` is 0), skip the get_object_tagging_ API call and put
+    the tags directly. If ``TagCount`` is not in the response, the tag count
+    is unknown, fall back to the normal get, update and put.
+
+    .. versionadded:: 2.0.2
+    """
+    return update_object_tagging(
+        s3_client=s3_client,
+        bucket=bucket,
+        key=key,
+        tags=tags,
+        version_id=head_response.get("VersionId", NOTHING),
+        expected_bucket_owner=expected_bucket_owner,
+        request_payer=request_payer,
+        known_empty=head_response.get("TagCount") == 0,
+    )
+
+
+def update_object_tagging_many(
+    s3_client: "S3Client",
+    bucket: str,
+    keys: T.Iterable[str],
+    tags: tag.TagType,
+    max_workers: T.Optional[int] = None,
+    merge: bool = True,
+    expected_bucket_owner: str = NOTHING,
+    request_payer: str = NOTHING,
+) -> T.Dict[str, T.Tuple[T.Optional[str], tag.TagType]]:
+    """
+    Run :func:`update_object_tagging` for many objects concurrently in a
+    thread pool, all threads share the same ``s3_client``.
+
+    The default ``max_pool_connections`` of botocore is 10. If you pass
+    ``max_workers`` explicitly, the ``s3_client`` should be created by
+    :func:`~s3pathlib.better_client.client.make_tuned_s3_client` with
+    ``pool_size >= max_workers``, otherwise a warning is emitted and you
+    will see the "Connection pool is full" log.
+
+    :param keys: the s3 object keys.
+    :param tags: the s3 object tags in string key value pairs dict.
+    :param max_workers: number of threads, the threads are reused across
+        calls, see :func:`~s3pathlib.better_client.client.get_executor`.
+        By default it is
+        :data:`~s3pathlib.better_client.client.DEFAULT_MAX_WORKERS`, capped
+        to the ``max_pool_connections`` of the ``s3_client``.
+    :param merge: See :func:`update_object_tagging`.
+
+    :return: a dict of ``{key: (version_id, tags)}``.
+
+    .. versionadded:: 2.0.2
+    """
+    results = dict()
+    max_workers = resolve_max_workers(s3_client, max_workers)
+    warm_up_client(s3_client, bucket)
+    executor = get_executor(max_workers)
+    future_to_key = {
+        executor.submit(
+            update_object_tagging,
+            s3_client=s3_client,
+            bucket=bucket,
+            key=key,
+            tags=tags,
+            expected_bucket_owner=expected_bucket_owner,
+            request_payer=request_payer,
+            merge=merge,
+        ): key
+        for key in keys
+    }
+    try:
+        for future in as_completed(future_to_key):
+            results[future_to_key[future]] = future.result()
+    except Exception:
+        for future in future_to_key:
+            future.cancel()
+        raise
+    return results
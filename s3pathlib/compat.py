@@ -2,27 +2,14 @@
 
 """
 Provide compatibility with older versions of Python and dependent libraries.
+
+``smart_open`` is imported lazily on first access, programs that never
+open a s3 object as a file object don't pay the import cost.
 """
 
 import sys
-
-try:
-    import smart_open
-
-    smart_open_version = smart_open.__version__
-    (
-        smart_open_version_major,
-        smart_open_version_minor,
-        _,
-    ) = smart_open_version.split(".")
-    smart_open_version_major = int(smart_open_version_major)
-    smart_open_version_minor = int(smart_open_version_minor)
-except ImportError:  # pragma: no cover
-    smart_open = None
-    smart_open_version_major = None
-    smart_open_version_minor = None
-except:  # pragma: no cover
-    raise
+import typing as T
+import functools
 
 if sys.version_info.minor < 8:
     from cached_property import cached_property
@@ -30,18 +17,64 @@ else:
     from functools import cached_property
 
 
+@functools.lru_cache(maxsize=1)
+def _import_smart_open():
+    try:
+        import smart_open
+
+        return smart_open
+    except ImportError:  # pragma: no cover
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _parse() -> T.Tuple[T.Optional[int], T.Optional[int]]:
+    """
+    Parse the major and minor version of ``smart_open``.
+    """
+    smart_open = _import_smart_open()
+    if smart_open is None:  # pragma: no cover
+        return None, None
+    major, minor, _ = smart_open.__version__.split(".", 2)
+    return int(major), int(minor)
+
+
+def __getattr__(name: str):
+    # keep ``from s3pathlib.compat import smart_open`` working, without
+    # importing smart_open when this module is imported
+    if name == "smart_open":
+        return _import_smart_open()
+    elif name == "smart_open_version":
+        smart_open = _import_smart_open()
+        return None if smart_open is None else smart_open.__version__
+    elif name == "smart_open_version_major":
+        return _parse()[0]
+    elif name == "smart_open_version_minor":
+        return _parse()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class Compat:  # pragma: no cover
+    @property
+    def smart_open(self):
+        smart_open = _import_smart_open()
+        if smart_open is None:
+            raise ImportError("You don't have smart_open installed")
+        return smart_open
+
     @property
     def smart_open_version_major(self) -> int:
-        if smart_open_version_major is None:
+        major = _parse()[0]
+        if major is None:
             raise ImportError("You don't have smart_open installed")
-        return smart_open_version_major
+        return major
 
     @property
     def smart_open_version_minor(self) -> int:
-        if smart_open_version_minor is None:
+        minor = _parse()[1]
+        if minor is None:
             raise ImportError("You don't have smart_open installed")
-        return smart_open_version_minor
+        return minor
 
 
 compat = Compat()
@@ -12,6 +12,14 @@ if T.TYPE_CHECKING:  # pragma: no cover
     from .s3path import S3Path
 
 
+def _parent_key(key: str) -> str:
+    """
+    Return the key of the parent directory, ``"a/b/c"`` and ``"a/b/c/"``
+    both return ``"a/b/"``, top level key returns ``""``.
+    """
+    return key[: key.rfind("/", 0, len(key) - 1) + 1]
+
+
 class AttributeAPIMixin:
     """
     A mixin class that implements the property methods.
@@ -46,11 +54,15 @@ class AttributeAPIMixin:
         if len(self._parts) == 0:
             return self
         else:
-            return self._from_parsed_parts(
+            p = self._from_parsed_parts(
                 bucket=self._bucket,
                 parts=self._parts[:-1],
                 is_dir=True,
             )
+            # the parent key is a prefix of the cached key, no join needed
+            if self._key is not None:
+                p._key = _parent_key(self._key)
+            return p
 
     @property
     def parents(self: "S3Path") -> T.List["S3Path"]:
@@ -65,19 +77,23 @@ class AttributeAPIMixin:
 
         .. versionadded:: 1.0.6
         """
-        if self.is_void():
-            raise ValueError(f"void S3path doesn't support .parents method!")
-        if self.is_relpath():
+        # void and relative path are the only paths without a bucket
+        if self._bucket is None:
+            if self.is_void():
+                raise ValueError(f"void S3path doesn't support .parents method!")
             raise ValueError(f"relative S3path doesn't support .parents method!")
+        bucket = self._bucket
+        parts = self._parts
+        from_parsed_parts = self._from_parsed_parts
+        key = self._key
         l = list()
-        parent = self
-        while 1:
-            new_parent = parent.parent
-            if parent.uri == new_parent.uri:
-                break
-            else:
-                l.append(new_parent)
-                parent = new_parent
+        # from the nearest parent to the bucket root
+        for i in range(len(parts) - 1, -1, -1):
+            parent = from_parsed_parts(bucket=bucket, parts=parts[:i], is_dir=True)
+            if key is not None:
+                key = _parent_key(key)
+                parent._key = key
+            l.append(parent)
         return l
 
     def is_parent_of(self: "S3Path", other: "S3Path") -> bool:
@@ -115,14 +131,14 @@ class AttributeAPIMixin:
             return False
         if self.is_dir() is False:
             raise TypeError(f"{self} is not a valid directory!")
-        n_parts_other = len(other.parts)
+        n_parts_other = len(other._parts)
         if n_parts_other == 0:
             return len(self._parts) == 0
-        else:
-            return (
-                self._parts[: (n_parts_other - 1)] == other._parts[:-1]
-                and len(self._parts) < n_parts_other
-            )
+        # check the length first, most of the non-parent returns here
+        # without slicing the parts
+        if len(self._parts) != n_parts_other - 1:
+            return False
+        return self._parts == other._parts[:-1]
 
     def is_prefix_of(self: "S3Path", other: "S3Path") -> bool:
         """
@@ -137,12 +153,18 @@ class AttributeAPIMixin:
             True
 
         .. versionadded:: 1.0.2
+
+        .. versionchanged:: 2.0.2
+
+            it is a real string prefix test on the key. It used to compare
+            the uri lexically, ``S3Path("bucket/a/").is_prefix_of(S3Path("bucket/b"))``
+            was True.
         """
         if self._bucket is None or other._bucket is None:
             raise TypeError(f"both {self}, {other} has to be a concrete S3Path!")
         if self._bucket != other._bucket:
             return False
-        return self.uri <= other.uri
+        return other.key.startswith(self.key)
 
     @FilterableProperty
     def basename(self: "S3Path") -> T.Optional[str]:
@@ -198,7 +220,11 @@ class AttributeAPIMixin:
 
         .. versionadded:: 1.0.1
         """
-        return self.parent.basename
+        # same as ``self.parent.basename``, without creating the parent
+        if len(self._parts) >= 2:
+            return self._parts[-2]
+        else:
+            return ""
 
     @FilterableProperty
     def fname(self: "S3Path") -> str:
@@ -218,9 +244,9 @@ class AttributeAPIMixin:
         basename: str = self.basename
         if not basename:
             raise ValueError
-        i = basename.rfind(".")
-        if 0 < i < len(basename) - 1:
-            return basename[:i]
+        head, _, tail = basename.rpartition(".")
+        if head and tail:
+            return head
         else:
             return basename
 
@@ -280,14 +306,8 @@ class AttributeAPIMixin:
         """
         if self._bucket is None:
             raise TypeError("relative path doesn't have absolute path!")
-        if self.is_bucket():
-            return "/"
-        elif self.is_dir():
-            return "/" + "/".join(self._parts) + "/"
-        elif self.is_file():
-            return "/" + "/".join(self._parts)
-        else:  # pragma: no cover
-            raise TypeError
+        # the key is cached, and already ends with "/" for directory
+        return "/" + self.key
 
     @FilterableProperty
     def dirpath(self: "S3Path"):
@@ -318,7 +338,10 @@ class AttributeAPIMixin:
 
         .. versionadded:: 1.0.2
         """
-        return self.parent.abspath
+        # same as ``self.parent.abspath``, without creating the parent
+        if self._bucket is None:
+            raise TypeError("relative path doesn't have absolute path!")
+        return "/" + _parent_key(self.key)
 
     @property
     def root(self: "S3Path") -> "S3Path":
@@ -331,7 +354,7 @@ class AttributeAPIMixin:
             >>> S3Path("bucket", "folder", "file.txt").root
             '/folder/'
         """
-        if self.is_relpath() or self.is_void():
+        if self._bucket is None:  # relative or void path
             raise TypeError("only concrete File or Directory has a bucket root!")
         else:
             return self._from_parsed_parts(
@@ -345,20 +368,16 @@ class AttributeAPIMixin:
         You cannot use the returned string of __repr__ to recover the original
         S3Path method.
         """
-        classname = self.__class__.__name__
-
-        if self.is_void():
+        if self._bucket is not None:  # bucket, folder or object
+            return "{}('{}')".format(self.__class__.__name__, self.uri)
+        elif self.is_void():
             return "S3VoidPath()"
-
-        elif self.is_relpath():
+        else:  # relative path
             key = self.key
             if len(key):
                 return f"S3RelPath({key!r})"
             else:  # pragma: no cover
                 return "S3RelPath()"
-        else: # bucket, folder or object
-            uri = self.uri
-            return "{}('{}')".format(classname, uri)
 
     def __str__(self: "S3Path"):
         return self.__repr__()
@@ -5,6 +5,7 @@ The base constructor of S3Path object.
 """
 
 import typing as T
+import weakref
 
 try:
     import botocore.exceptions
@@ -19,6 +20,10 @@ from .. import utils
 if T.TYPE_CHECKING:  # pragma: no cover
     from .s3path import S3Path
 
+# canonical instances for :meth:`BaseS3Path.intern`, an entry goes away
+# when nobody else references the path
+_intern_pool = weakref.WeakValueDictionary()
+
 
 class BaseS3Path:
     """
@@ -101,8 +106,11 @@ class BaseS3Path:
         "_parts",
         "_is_dir",
         "_cached_cparts",  # cached comparison parts
+        "_key",  # cached s3 key string
+        "_uri",  # cached s3 uri string
         "_hash",  # cached hash value
         "_meta",  # s3 object metadata cache object
+        "__weakref__",
     )
 
     def __new__(
@@ -134,53 +142,39 @@ class BaseS3Path:
                 is_dir=_is_dir,
             )
 
-        # resolve self._bucket
-        arg = args[0]
-
-        if isinstance(arg, str):
-            # handle S3 URI and ARN
-            if arg.startswith("s3://"):
-                arg = arg[5:]
-            elif arg.startswith("arn:aws:s3:::"):
-                arg = arg[13:]
-            else:
-                pass
-
-            utils.validate_s3_bucket(arg)
-            parts = utils.split_parts(arg)
-            _bucket = parts[0]
-            _parts.extend(parts[1:])
-        elif isinstance(arg, BaseS3Path):
-            _bucket = arg._bucket
-            _parts.extend(arg._parts)
-        else:
-            raise TypeError
-
-        # resolve self._parts
-        for arg in args[1:]:
+        # resolve self._bucket, self._parts and self._is_dir in one pass,
+        # the first argument is the bucket (or a path), the rest are parts
+        is_first = True
+        for arg in args:
             if isinstance(arg, str):
-                utils.validate_s3_key(arg)
-                _parts.extend(utils.split_parts(arg))
-            elif isinstance(arg, BaseS3Path):
-                if arg._bucket is None:
-                    _parts.extend(arg._parts)
+                if is_first:
+                    # handle S3 URI and ARN
+                    if arg.startswith("s3://"):
+                        arg = arg[5:]
+                    elif arg.startswith("arn:aws:s3:::"):
+                        arg = arg[13:]
+                    utils.validate_s3_bucket(arg)
+                    parts = utils.split_parts(arg)
+                    _bucket = parts[0]
+                    _parts.extend(parts[1:])
                 else:
+                    utils.validate_s3_key(arg)
+                    _parts.extend(utils.split_parts(arg))
+                _is_dir = arg.endswith("/")
+            elif isinstance(arg, BaseS3Path):
+                if is_first:
+                    _bucket = arg._bucket
+                elif arg._bucket is not None:
                     raise TypeError(
                         "from the second arguments, it has to be raw string "
                         "(as a part) or a relative S3Path (without bucket)! "
                         f"this is invalid: {arg}."
                     )
+                _parts.extend(arg._parts)
+                _is_dir = arg._is_dir
             else:
                 raise TypeError
-
-        # resolve self._is_dir
-        # inspect the last argument
-        if isinstance(arg, str):
-            _is_dir = arg.endswith("/")
-        elif isinstance(arg, BaseS3Path):
-            _is_dir = arg._is_dir
-        else:  # pragma: no cover
-            raise TypeError
+            is_first = False
 
         if (_bucket is not None) and len(_parts) == 0:  # bucket root
             _is_dir = True
@@ -204,17 +198,82 @@ class BaseS3Path:
         self._bucket = bucket
         self._parts = parts
         self._is_dir = is_dir
+        # comparison parts and hash, S3Path is immutable, compute them once
+        # here. a directory sorts after the file with the same name
+        cparts = (bucket or "", tuple(parts), bool(is_dir))
+        self._cached_cparts = cparts
+        self._hash = hash(cparts)
+        self._key = None
+        self._uri = None
         self._meta = None
         if init:
             self._init()
         return self
 
+    @classmethod
+    def _from_bucket_key(
+        cls: T.Type["S3Path"],
+        bucket: str,
+        key: str,
+    ) -> "S3Path":
+        """
+        Construct S3Path from a bucket and key returned by the S3 API
+        (e.g. list objects), they are already valid, skip the validation
+        and the generic argument dispatch of :meth:`_from_parts`.
+        """
+        # not normalized, let the generic constructor drop the empty parts
+        if not key or "//" in key or key[0] == "/":
+            return cls._from_parts([bucket, key])
+        if key[-1] == "/":
+            p = cls._from_parsed_parts(
+                bucket=bucket,
+                parts=key[:-1].split("/"),
+                is_dir=True,
+            )
+        else:
+            p = cls._from_parsed_parts(
+                bucket=bucket,
+                parts=key.split("/"),
+                is_dir=False,
+            )
+        p._key = key
+        return p
+
     def _init(self: "S3Path") -> None:
         """
         Additional instance initialization
         """
         pass
 
+    def intern(self: "S3Path") -> "S3Path":
+        """
+        Return the canonical instance of this path. Like ``sys.intern`` for
+        string, if you keep many equivalent paths alive (e.g. the same object
+        listed twice, or re-created from serialized uri), interning them
+        keeps one object in memory, and ``==`` short-circuits on identity.
+
+        The canonical instance shares its metadata cache with every caller.
+        A path pinned to an object version is never interned, it returns
+        itself.
+
+        Example::
+
+            >>> p1 = S3Path("bucket/file.txt").intern()
+            >>> p2 = S3Path.from_s3_uri("s3://bucket/file.txt").intern()
+            >>> p1 is p2
+            True
+
+        .. versionadded:: 2.0.2
+        """
+        if self._static_version_id is not None:
+            return self
+        key = (type(self), self._cached_cparts)
+        existing = _intern_pool.get(key)
+        if existing is not None:
+            return existing
+        _intern_pool[key] = self
+        return self
+
     @FilterableProperty
     def parts(self: "S3Path") -> T.List[str]:
         """
@@ -222,5 +281,10 @@ class BaseS3Path:
         It doesn't include the bucket, because bucket is considered as "drive".
 
         .. versionadded:: 1.0.1
+
+        .. versionchanged:: 2.0.2
+
+            It returns a copy. S3Path caches the key, uri, comparison key
+            and hash, mutating the internal parts list would break them.
         """
-        return self._parts
+        return list(self._parts)
@@ -14,65 +14,59 @@ class ComparisonAPIMixin:
     """
     A mixin class that implements the comparison operator magic methods.
     """
+
     @property
-    def _cparts(self: "S3Path"):
-        """
-        Cached comparison parts, for hashing and comparison
+    def _cparts(self: "S3Path") -> T.Tuple[str, T.Tuple[str, ...], bool]:
         """
-        try:
-            return self._cached_cparts
-        except AttributeError:
-            cparts = list()
-
-            if self._bucket:
-                cparts.append(self._bucket)
-            else:
-                cparts.append("")
-
-            cparts.extend(self._parts)
+        Cached comparison parts, for hashing and comparison. It is the
+        ``(bucket, parts, is_dir)`` tuple computed in
+        :meth:`~s3pathlib.core.base.BaseS3Path._from_parsed_parts`.
 
-            if self._is_dir:
-                cparts.append("/")
+        .. versionchanged:: 2.0.2
 
-            self._cached_cparts = cparts
-            return self._cached_cparts
+            it was a flat tuple of bucket, parts and a trailing ``"/"``
+            for directory.
+        """
+        return self._cached_cparts
 
     def __eq__(self: "S3Path", other: "S3Path") -> bool:
         """
         Return ``self == other``.
         """
-        return self._cparts == other._cparts
+        return self._cached_cparts == other._cached_cparts
+
+    def __ne__(self: "S3Path", other: "S3Path") -> bool:
+        """
+        Return ``self != other``.
+        """
+        return self._cached_cparts != other._cached_cparts
 
     def __lt__(self: "S3Path", other: "S3Path") -> bool:
         """
         Return ``self < other``.
         """
-        return self._cparts < other._cparts
+        return self._cached_cparts < other._cached_cparts
 
     def __gt__(self: "S3Path", other: "S3Path") -> bool:
         """
         Return ``self > other``.
         """
-        return self._cparts > other._cparts
+        return self._cached_cparts > other._cached_cparts
 
     def __le__(self: "S3Path", other: "S3Path") -> bool:
         """
         Return ``self <= other``.
         """
-        return self._cparts <= other._cparts
+        return self._cached_cparts <= other._cached_cparts
 
     def __ge__(self: "S3Path", other: "S3Path") -> bool:
         """
         Return ``self >= other``.
         """
-        return self._cparts >= other._cparts
+        return self._cached_cparts >= other._cached_cparts
 
     def __hash__(self: "S3Path") -> int:
         """
         Return ``hash(self)``
         """
-        try:
-            return self._hash
-        except AttributeError:
-            self._hash = hash(tuple(self._cparts))
-            return self._hash
+        return self._hash
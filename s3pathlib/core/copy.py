@@ -13,6 +13,7 @@ from func_args import NOTHING, resolve_kwargs
 
 from ..type import TagType, MetadataType
 from ..tag import encode_url_query
+from ..utils import make_kwargs_builder
 
 from .resolve_s3_client import resolve_s3_client
 from ..aws import context
@@ -22,6 +23,53 @@ if T.TYPE_CHECKING:  # pragma: no cover
     from boto_session_manager import BotoSesManager
 
 
+# (copy_object argument name, python parameter name)
+_COPY_OBJECT_FIELDS = (
+    ("ACL", "acl"),
+    ("CacheControl", "cache_control"),
+    ("ContentDisposition", "content_disposition"),
+    ("ContentEncoding", "content_encoding"),
+    ("ContentLanguage", "content_language"),
+    ("ContentMD5", "content_md5"),
+    ("ContentType", "content_type"),
+    ("CopySourceIfMatch", "copy_source_if_match"),
+    ("CopySourceIfModifiedSince", "copy_source_if_modified_since"),
+    ("CopySourceIfNoneMatch", "copy_source_if_none_match"),
+    ("CopySourceIfUnmodifiedSince", "copy_source_if_unmodified_since"),
+    ("Expires", "expires_datetime"),
+    ("GrantFullControl", "grant_full_control"),
+    ("GrantRead", "grant_read"),
+    ("GrantReadACP", "grant_read_acp"),
+    ("GrantWriteACP", "grant_write_acp"),
+    ("ServerSideEncryption", "server_side_encryption"),
+    ("StorageClass", "storage_class"),
+    ("WebsiteRedirectLocation", "website_redirect_location"),
+    ("SSECustomerAlgorithm", "sse_customer_algorithm"),
+    ("SSECustomerKey", "sse_customer_key"),
+    ("SSEKMSKeyId", "sse_kms_key_id"),
+    ("SSEKMSEncryptionContext", "sse_kms_encryption_context"),
+    ("BucketKeyEnabled", "bucket_key_enabled"),
+    ("CopySourceSSECustomerAlgorithm", "copy_source_sse_customer_algorithm"),
+    ("CopySourceSSECustomerKey", "copy_source_sse_customer_key"),
+    ("RequestPayer", "request_payer"),
+    ("ObjectLockMode", "object_lock_mode"),
+    ("ObjectLockRetainUntilDate", "object_lock_retain_until_datetime"),
+    ("ObjectLockLegalHoldStatus", "object_lock_legal_hold_status"),
+    ("ExpectedBucketOwner", "expected_bucket_owner"),
+    ("ExpectedSourceBucketOwner", "expected_source_bucket_owner"),
+)
+
+build_copy_object_kwargs = make_kwargs_builder(
+    name="build_copy_object_kwargs",
+    required_fields=(
+        ("Bucket", "bucket"),
+        ("Key", "key"),
+        ("CopySource", "copy_source"),
+    ),
+    optional_fields=_COPY_OBJECT_FIELDS,
+)
+
+
 class CopyAPIMixin:
     """
     A mixin class that implements copy related methods.
@@ -103,46 +151,46 @@ class CopyAPIMixin:
         # prepare API kwargs
         s3_client = resolve_s3_client(context, bsm)
 
-        kwargs = dict(
-            Bucket=dst.bucket,
-            Key=dst.key,
-            CopySource=resolve_kwargs(
+        kwargs = build_copy_object_kwargs(
+            dst.bucket,
+            dst.key,
+            resolve_kwargs(
                 Bucket=self.bucket,
                 Key=self.key,
                 VersionId=version_id,
             ),
-            ACL=acl,
-            CacheControl=cache_control,
-            ContentDisposition=content_disposition,
-            ContentEncoding=content_encoding,
-            ContentLanguage=content_language,
-            ContentMD5=content_md5,
-            ContentType=content_type,
-            CopySourceIfMatch=copy_source_if_match,
-            CopySourceIfModifiedSince=copy_source_if_modified_since,
-            CopySourceIfNoneMatch=copy_source_if_none_match,
-            CopySourceIfUnmodifiedSince=copy_source_if_unmodified_since,
-            Expires=expires_datetime,
-            GrantFullControl=grant_full_control,
-            GrantRead=grant_read,
-            GrantReadACP=grant_read_acp,
-            GrantWriteACP=grant_write_acp,
-            ServerSideEncryption=server_side_encryption,
-            StorageClass=storage_class,
-            WebsiteRedirectLocation=website_redirect_location,
-            SSECustomerAlgorithm=sse_customer_algorithm,
-            SSECustomerKey=sse_customer_key,
-            SSEKMSKeyId=sse_kms_key_id,
-            SSEKMSEncryptionContext=sse_kms_encryption_context,
-            BucketKeyEnabled=bucket_key_enabled,
-            CopySourceSSECustomerAlgorithm=copy_source_sse_customer_algorithm,
-            CopySourceSSECustomerKey=copy_source_sse_customer_key,
-            RequestPayer=request_payer,
-            ObjectLockMode=object_lock_mode,
-            ObjectLockRetainUntilDate=object_lock_retain_until_datetime,
-            ObjectLockLegalHoldStatus=object_lock_legal_hold_status,
-            ExpectedBucketOwner=expected_bucket_owner,
-            ExpectedSourceBucketOwner=expected_source_bucket_owner,
+            acl=acl,
+            cache_control=cache_control,
+            content_disposition=content_disposition,
+            content_encoding=content_encoding,
+            content_language=content_language,
+            content_md5=content_md5,
+            content_type=content_type,
+            copy_source_if_match=copy_source_if_match,
+            copy_source_if_modified_since=copy_source_if_modified_since,
+            copy_source_if_none_match=copy_source_if_none_match,
+            copy_source_if_unmodified_since=copy_source_if_unmodified_since,
+            expires_datetime=expires_datetime,
+            grant_full_control=grant_full_control,
+            grant_read=grant_read,
+            grant_read_acp=grant_read_acp,
+            grant_write_acp=grant_write_acp,
+            server_side_encryption=server_side_encryption,
+            storage_class=storage_class,
+            website_redirect_location=website_redirect_location,
+            sse_customer_algorithm=sse_customer_algorithm,
+            sse_customer_key=sse_customer_key,
+            sse_kms_key_id=sse_kms_key_id,
+            sse_kms_encryption_context=sse_kms_encryption_context,
+            bucket_key_enabled=bucket_key_enabled,
+            copy_source_sse_customer_algorithm=copy_source_sse_customer_algorithm,
+            copy_source_sse_customer_key=copy_source_sse_customer_key,
+            request_payer=request_payer,
+            object_lock_mode=object_lock_mode,
+            object_lock_retain_until_datetime=object_lock_retain_until_datetime,
+            object_lock_legal_hold_status=object_lock_legal_hold_status,
+            expected_bucket_owner=expected_bucket_owner,
+            expected_source_bucket_owner=expected_source_bucket_owner,
         )
         if metadata is not NOTHING:
             kwargs["Metadata"] = metadata
@@ -150,7 +198,7 @@ class CopyAPIMixin:
         if tags is not NOTHING:
             kwargs["Tagging"] = encode_url_query(tags)
             kwargs["TaggingDirective"] = "REPLACE"
-        return s3_client.copy_object(**resolve_kwargs(**kwargs))
+        return s3_client.copy_object(**kwargs)
 
     def copy_dir(
         self: "S3Path",
@@ -52,6 +52,11 @@ class ExistsAPIMixin:
         .. versionchanged:: 2.0.1
 
             Add ``version_id`` parameter.
+
+        .. versionchanged:: 2.0.2
+
+            For S3 directory, it makes a single ``list_objects_v2`` call
+            with ``MaxKeys=1``, no paginator and no ``S3Path`` is created.
         """
         if self.is_bucket():
             s3_client = resolve_s3_client(context, bsm)
@@ -73,17 +78,16 @@ class ExistsAPIMixin:
                 self._meta = dct
                 return True
         elif self.is_dir():
-            l = list(
-                self.iterdir(
-                    batch_size=1,
-                    limit=1,
-                    bsm=bsm,
-                )
+            # one list call answers both the hard folder (the "folder/" marker
+            # object is listed) and the soft folder, a head_object on the
+            # marker would cost an extra round trip for soft folders
+            s3_client = resolve_s3_client(context, bsm)
+            res = s3_client.list_objects_v2(
+                Bucket=self.bucket,
+                Prefix=self.key,
+                MaxKeys=1,
             )
-            if len(l):
-                return True
-            else:
-                return False
+            return res.get("KeyCount", 0) > 0
         else:  # pragma: no cover
             raise TypeError
 
@@ -18,11 +18,12 @@ This module implements the same feature.
 
 import typing as T
 import functools
+import operator
 
 FilterableType = T.TypeVar("FilterableType")
 
 
-class FilterableProperty(T.Generic[FilterableType]):
+class FilterableProperty(property, T.Generic[FilterableType]):
     """
     A descriptor decorator that convert a method to a property method.
     ALSO, convert the class attribute to be a comparable object that returns
@@ -41,56 +42,22 @@ class FilterableProperty(T.Generic[FilterableType]):
         filter_function = User.username == "alice
         assert filter_function(User(name="alice")) == True
         assert filter_function(User(name="bob")) == False
+
+    .. versionchanged:: 2.0.2
+
+        It is a subclass of the built-in ``property`` now, the instance
+        attribute access uses the C implemented ``property.__get__``,
+        no extra Python frame per access.
     """
 
     def __init__(self, func: callable):
+        super().__init__(func)
         functools.wraps(func)(self)
         self._func = func
 
-    def __get__(self, obj: T.Union['FilterableType', None], obj_type):
-        if obj is None:
-            return self
-        return self._func(obj)
-
     def __set__(self, obj: T.Union['FilterableType', None], value: T.Any):
         raise AttributeError(f"can't set attribute S3Path.{self.__name__}")
 
-    def __eq__(self, other):
-        def filter_(obj):
-            return self._func(obj) == other
-
-        return filter_
-
-    def __ne__(self, other):
-        def filter_(obj):
-            return self._func(obj) != other
-
-        return filter_
-
-    def __gt__(self, other):
-        def filter_(obj):
-            return self._func(obj) > other
-
-        return filter_
-
-    def __lt__(self, other):
-        def filter_(obj):
-            return self._func(obj) < other
-
-        return filter_
-
-    def __ge__(self, other):
-        def filter_(obj):
-            return self._func(obj) >= other
-
-        return filter_
-
-    def __le__(self, other):
-        def filter_(obj):
-            return self._func(obj) <= other
-
-        return filter_
-
     def equal_to(self, other):  # pragma: no cover
         """
         Return a filter function that returns True
@@ -134,7 +101,7 @@ class FilterableProperty(T.Generic[FilterableType]):
 
         .. versionadded:: 1.0.4
         """
-        return self.__eq__(other)
+        return self.__ge__(other)
 
     def less_equal(self, other):  # pragma: no cover
         """
@@ -143,7 +110,7 @@ class FilterableProperty(T.Generic[FilterableType]):
 
         .. versionadded:: 1.0.4
         """
-        return self.__eq__(other)
+        return self.__le__(other)
 
     def between(self, lower, upper):
         """
@@ -152,9 +119,10 @@ class FilterableProperty(T.Generic[FilterableType]):
 
         .. versionadded:: 1.0.3
         """
+        func = self._func
 
         def filter_(obj):
-            return lower <= self._func(obj) <= upper
+            return lower <= func(obj) <= upper
 
         return filter_
 
@@ -166,9 +134,10 @@ class FilterableProperty(T.Generic[FilterableType]):
 
         .. versionadded:: 1.0.3
         """
+        func = self._func
 
         def filter_(obj):
-            return self._func(obj).startswith(other)
+            return func(obj).startswith(other)
 
         return filter_
 
@@ -180,9 +149,10 @@ class FilterableProperty(T.Generic[FilterableType]):
 
         .. versionadded:: 1.0.3
         """
+        func = self._func
 
         def filter_(obj):
-            return self._func(obj).endswith(other)
+            return func(obj).endswith(other)
 
         return filter_
 
@@ -193,8 +163,29 @@ class FilterableProperty(T.Generic[FilterableType]):
 
         .. versionadded:: 1.0.3
         """
+        func = self._func
 
         def filter_(obj):
-            return other in self._func(obj)
+            return other in func(obj)
 
         return filter_
+
+
+def _make_compare_filter(op: T.Callable[[T.Any, T.Any], bool]):
+    def dunder(self: FilterableProperty, other):
+        func = self._func
+
+        def filter_(obj):
+            return op(func(obj), other)
+
+        return filter_
+
+    dunder.__name__ = f"__{op.__name__}__"
+    return dunder
+
+
+# the six comparison operators only differ by the operator,
+# generate them from the C implemented ``operator`` functions
+for _op in (operator.eq, operator.ne, operator.gt, operator.lt, operator.ge, operator.le):
+    setattr(FilterableProperty, f"__{_op.__name__}__", _make_compare_filter(_op))
+del _op
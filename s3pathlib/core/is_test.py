@@ -36,7 +36,7 @@ class IsTestAPIMixin:
         A void path is also a special :meth:`relative path <is_relpath>`,
         because any path join with void path results to itself.
         """
-        return (self._bucket is None) and (len(self._parts) == 0)
+        return self._bucket is None and not self._parts
 
     def is_dir(self: "S3Path") -> bool:
         """
@@ -49,10 +49,8 @@ class IsTestAPIMixin:
 
         .. versionadded:: 1.0.1
         """
-        if self._is_dir is None:
-            return False
-        else:
-            return self._is_dir
+        # ``_is_dir`` is always True, False or None (unknown type)
+        return self._is_dir is True
 
     def is_file(self: "S3Path") -> bool:
         """
@@ -64,10 +62,7 @@ class IsTestAPIMixin:
 
         .. versionadded:: 1.0.1
         """
-        if self._is_dir is None:
-            return False
-        else:
-            return not self._is_dir
+        return self._is_dir is False
 
     def is_bucket(self: "S3Path") -> bool:
         """
@@ -80,11 +75,7 @@ class IsTestAPIMixin:
 
         .. versionadded:: 1.0.1
         """
-        return (
-            (self._bucket is not None)
-            and (len(self._parts) == 0)
-            and (self._is_dir is True)
-        )
+        return self._is_dir is True and self._bucket is not None and not self._parts
 
     def is_delete_marker(self: "S3Path") -> bool:
         """
@@ -107,7 +98,7 @@ class IsTestAPIMixin:
 
         .. versionadded:: 1.0.1
         """
-        if self.is_file() is not True:
+        if self._is_dir is not False:
             raise S3PathIsNotFileError.make(self.uri)
 
     def ensure_file(self: "S3Path") -> None:
@@ -124,7 +115,7 @@ class IsTestAPIMixin:
 
         .. versionadded:: 1.2.1
         """
-        if self.is_file() is True:
+        if self._is_dir is False:
             raise TypeError(f"S3 URI: {self} IS an s3 object!")
 
     def ensure_not_file(self: "S3Path") -> None:
@@ -141,7 +132,7 @@ class IsTestAPIMixin:
 
         .. versionadded:: 1.0.1
         """
-        if self.is_dir() is not True:
+        if self._is_dir is not True:
             raise S3PathIsNotFolderError.make(self.uri)
 
     def ensure_not_dir(self: "S3Path") -> None:
@@ -150,5 +141,5 @@ class IsTestAPIMixin:
 
         .. versionadded:: 1.2.1
         """
-        if self.is_dir() is True:
+        if self._is_dir is True:
             raise TypeError(f"{self} IS a s3 directory!")
@@ -16,7 +16,6 @@ from .. import utils
 from ..aws import context
 from ..better_client.list_objects import (
     paginate_list_objects_v2,
-    is_content_an_object,
     calculate_total_size,
     count_objects,
 )
@@ -68,23 +67,22 @@ class S3PathIterProxy(IterProxy["S3Path"]):
             >>> for path in p.iter_objects().filter_by_ext(".csv", ".json"):
             ...      print(path)
         """
-        n = len(exts)
-        if n == 0:
+        if len(exts) == 0:
             raise ValueError
-        elif n == 1:
-            ext = exts[0].lower()
+        valid_exts = frozenset([ext.lower() for ext in exts])
 
-            def f(p: "S3Path") -> bool:
-                return p.ext.lower() == ext
+        # same semantic as ``S3Path.ext``, only the suffix after the last dot
+        # is lowered and looked up, the cost doesn't grow with len(exts).
+        # a file without extension has ``""`` ext
+        def f(p: "S3Path") -> bool:
+            if p._is_dir or not p._parts:
+                return False
+            basename = p._parts[-1]
+            i = basename.rfind(".")
+            ext = basename[i:] if 0 < i < len(basename) - 1 else ""
+            return ext.lower() in valid_exts
 
-            return self.filter(f)
-        else:
-            valid_exts = set([ext.lower() for ext in exts])
-
-            def f(p: "S3Path") -> bool:
-                return p.ext.lower() in valid_exts
-
-            return self.filter(f)
+        return self.filter(f)
 
 
 class IterObjectsAPIMixin:
@@ -165,12 +163,11 @@ class IterObjectsAPIMixin:
             )
             if recursive is False:
                 kwargs["delimiter"] = "/"
-            for content in (
-                paginate_list_objects_v2(**kwargs)
-                .contents()
-                .filter(is_content_an_object)
-            ):
-                yield self._from_content_dict(bucket, dct=content)
+            yield from self._iter_from_contents(
+                bucket,
+                paginate_list_objects_v2(**kwargs).contents(),
+                include_folder=False,
+            )
 
         return S3PathIterProxy(_iter_s3path())
 
@@ -244,11 +241,10 @@ class IterObjectsAPIMixin:
                 expected_bucket_owner=expected_bucket_owner,
             )
             for res in proxy:
-                for dct in res.get("CommonPrefixes", list()):
+                for dct in res.get("CommonPrefixes", ()):
                     yield root.joinpath(dct["Prefix"])
 
-                for dct in res.get("Contents", list()):
-                    yield self._from_content_dict(self.bucket, dct)
+                yield from self._iter_from_contents(bucket, res.get("Contents", ()))
 
         return S3PathIterProxy(_iter_s3path())
 
@@ -256,6 +252,7 @@ class IterObjectsAPIMixin:
         self: "S3Path",
         for_human: bool = False,
         include_folder: bool = False,
+        max_workers: int = 1,
         bsm: T.Optional["BotoSesManager"] = None,
     ) -> T.Tuple[int, T.Union[int, str]]:
         """
@@ -283,12 +280,19 @@ class IterObjectsAPIMixin:
         :param for_human: Default False. If true, returns human readable string for "size".
         :param include_folder: Default False, whether counting the hard folder
         (an empty "/" object).
+        :param max_workers: Default 1. If greater than 1, list the sub folders
+            concurrently, see
+            :func:`~s3pathlib.better_client.list_objects.scan_prefix_stats`.
         :param bsm: See bsm_.
 
         :return: a tuple, first value is number of objects,
             second value is total size in bytes
 
         .. versionadded:: 1.0.1
+
+        .. versionchanged:: 2.0.2
+
+            Add ``max_workers`` parameter.
         """
         self.ensure_dir()
         s3_client = resolve_s3_client(context, bsm)
@@ -297,6 +301,7 @@ class IterObjectsAPIMixin:
             bucket=self.bucket,
             prefix=self.key,
             include_folder=include_folder,
+            max_workers=max_workers,
         )
         if for_human:
             size = utils.repr_data_size(size)
@@ -305,6 +310,7 @@ class IterObjectsAPIMixin:
     def count_objects(
         self: "S3Path",
         include_folder: bool = False,
+        max_workers: int = 1,
         bsm: T.Optional["BotoSesManager"] = None,
     ) -> int:
         """
@@ -329,11 +335,18 @@ class IterObjectsAPIMixin:
 
         :param include_folder: Default False, whether counting the hard folder
         (an empty "/" object).
+        :param max_workers: Default 1. If greater than 1, list the sub folders
+            concurrently, see
+            :func:`~s3pathlib.better_client.list_objects.scan_prefix_stats`.
         :param bsm: See bsm_.
 
         :return: an integer represents the number of objects
 
         .. versionadded:: 1.0.1
+
+        .. versionchanged:: 2.0.2
+
+            Add ``max_workers`` parameter.
         """
         self.ensure_dir()
         s3_client = resolve_s3_client(context, bsm)
@@ -342,4 +355,5 @@ class IterObjectsAPIMixin:
             bucket=self.bucket,
             prefix=self.key,
             include_folder=include_folder,
+            max_workers=max_workers,
         )
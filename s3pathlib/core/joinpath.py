@@ -6,6 +6,7 @@ Join path operator implementation.
 
 import typing as T
 
+from .. import utils
 from .relative import RelativePathAPIMixin
 from ..marker import warn_deprecate
 
@@ -38,12 +39,15 @@ class JoinPathAPIMixin:
 
         .. versionadded:: 1.1.1
         """
-        args = [
-            self,
-        ]
+        # self is already parsed, extend its parts directly instead of
+        # parsing everything again in ``_from_parts``
+        parts = list(self._parts)
+        is_dir = self._is_dir
         for part in other:
             if isinstance(part, str):
-                args.append(part)
+                utils.validate_s3_key(part)
+                parts.extend(utils.split_parts(part))
+                is_dir = part.endswith("/")
             elif isinstance(part, RelativePathAPIMixin):
                 if part.is_relpath() is False:
                     msg = (
@@ -52,14 +56,21 @@ class JoinPathAPIMixin:
                     ).format(part)
                     raise TypeError(msg)
                 else:
-                    args.append(part)
+                    parts.extend(part._parts)
+                    is_dir = part._is_dir
             else:
                 msg = (
                     "you can only join with string part or relative path! "
                     "{} is not a relative path"
                 ).format(part)
                 raise TypeError(msg)
-        return self._from_parts(args)
+        if (self._bucket is not None) and len(parts) == 0:  # bucket root
+            is_dir = True
+        return self._from_parsed_parts(
+            bucket=self._bucket,
+            parts=parts,
+            is_dir=is_dir,
+        )
 
     def __truediv__(
         self: "S3Path", other: T.Union[str, "S3Path", T.List[T.Union[str, "S3Path"]]]
@@ -82,7 +93,31 @@ class JoinPathAPIMixin:
             S3Path('s3://new-bucket/file.txt')
 
         .. versionadded:: 1.0.11
+
+        .. versionchanged:: 2.0.2
+
+            joining a concrete path with a single part string skips the
+            generic constructor.
         """
+        # fast path, ``s3path / "file.txt"`` or ``s3path / "folder/"``
+        if isinstance(other, str) and self._bucket is not None:
+            if other.endswith("/"):
+                name, is_dir = other[:-1], True
+            else:
+                name, is_dir = other, False
+            if name and "/" not in name:
+                p = self._from_parsed_parts(
+                    bucket=self._bucket,
+                    parts=self._parts + [name],
+                    is_dir=is_dir,
+                )
+                # extend the cached key instead of joining all parts again
+                key = self._key
+                if key is not None:
+                    if key and not key.endswith("/"):
+                        key += "/"
+                    p._key = key + other
+                return p
         if self.is_void():
             raise TypeError("You cannot do ``VoidS3Path / other``!")
         if isinstance(other, list):
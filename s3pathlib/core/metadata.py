@@ -4,6 +4,7 @@
 Metadata related API.
 """
 
+import sys
 import typing as T
 from datetime import datetime
 
@@ -20,6 +21,58 @@ if T.TYPE_CHECKING:  # pragma: no cover
     from boto_session_manager import BotoSesManager
 
 
+_LISTED_META_FIELDS = (
+    "Key",
+    "VersionId",
+    "LastModified",
+    "ETag",
+    "ContentLength",
+    "StorageClass",
+    "IsLatest",
+    "ChecksumAlgorithm",
+    "Owner",
+    IS_DELETE_MARKER,
+)
+_LISTED_META_FIELD_SET = frozenset(_LISTED_META_FIELDS)
+
+
+class _ListedMeta:
+    """
+    The metadata of a s3 object that comes from the list objects / list object
+    versions API. One listed object creates one of it, a slotted object is
+    a lot smaller than a dict. It supports the read only subset of the dict
+    API that the metadata cache needs: ``meta[key]``, ``meta.get(key)`` and
+    ``key in meta``. An unset field is a missing key.
+
+    The ``head_object`` response is still stored as a dict.
+    """
+
+    __slots__ = _LISTED_META_FIELDS
+
+    def get(self, key: str, default: T.Any = None) -> T.Any:
+        if key in _LISTED_META_FIELD_SET:
+            return getattr(self, key, default)
+        return default
+
+    def __getitem__(self, key: str) -> T.Any:
+        if key in _LISTED_META_FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in _LISTED_META_FIELD_SET and hasattr(self, key)
+
+    def to_dict(self) -> dict:
+        return {
+            key: getattr(self, key)
+            for key in _LISTED_META_FIELDS
+            if hasattr(self, key)
+        }
+
+
 class MetadataAPIMixin:
     """
     A mixin class that implements the metadata related methods.
@@ -54,9 +107,10 @@ class MetadataAPIMixin:
 
             This method is for those metadata fields that conditionally exists.
         """
-        if self._meta is None:
-            self.head_object(bsm=bsm)
-        return self._meta.get(key, default)
+        meta = self._meta
+        if meta is None:
+            meta = self.head_object(bsm=bsm)
+        return meta.get(key, default)
 
     def _get_or_pull_meta_value(
         self: "S3Path",
@@ -67,11 +121,18 @@ class MetadataAPIMixin:
         Note:
 
             This method is for those metadata fields that always exists.
+
+            An object yielded by the list API already carries the
+            ``LastModified``, ``ETag``, ``ContentLength`` and ``StorageClass``,
+            they are returned without a HEAD request. The fields that list API
+            doesn't return (e.g. user ``Metadata``) pull the full metadata.
         """
-        value = self._get_meta_value(key, default=None, bsm=bsm)
-        if value is None:
-            self.head_object(bsm=bsm)
-        return self._meta[key]
+        meta = self._meta
+        if meta is not None:
+            value = meta.get(key)
+            if value is not None:
+                return value
+        return self.head_object(bsm=bsm)[key]
 
     @FilterableProperty
     def etag(self: "S3Path") -> T.Optional[str]:
@@ -202,45 +263,74 @@ class MetadataAPIMixin:
 
         :return: a new S3Path object.
         """
-        p = cls(bucket, dct["Key"])
-        p._meta = {
-            "Key": dct["Key"],
-            "LastModified": dct["LastModified"],
-            "ETag": dct["ETag"],
-            "ContentLength": dct["Size"],
-            "StorageClass": dct["StorageClass"],
-            "ChecksumAlgorithm": dct.get("ChecksumAlgorithm", []),
-            "Owner": dct.get("Owner", {}),
-        }
+        p = cls._from_bucket_key(sys.intern(bucket), dct["Key"])
+        meta = _ListedMeta()
+        meta.Key = dct["Key"]
+        meta.LastModified = dct["LastModified"]
+        meta.ETag = dct["ETag"]
+        meta.ContentLength = dct["Size"]
+        # only a handful of distinct values, share one string object
+        meta.StorageClass = sys.intern(dct["StorageClass"])
+        meta.ChecksumAlgorithm = dct.get("ChecksumAlgorithm", [])
+        meta.Owner = dct.get("Owner", {})
+        p._meta = meta
         return p
 
+    @classmethod
+    def _iter_from_contents(
+        cls: T.Type["S3Path"],
+        bucket: str,
+        contents: T.Iterable[dict],
+        include_folder: bool = True,
+    ) -> T.Iterator["S3Path"]:
+        """
+        Lazily convert the response["Contents"] dictionaries into S3Path
+        objects, nothing is materialized, a page of the paginator is released
+        as soon as it is consumed.
+
+        :param include_folder: if False, skip the hard folder (an empty
+            "/" object).
+
+        .. versionadded:: 2.0.2
+        """
+        bucket = sys.intern(bucket)
+        from_content_dict = cls._from_content_dict
+        if include_folder:
+            for dct in contents:
+                yield from_content_dict(bucket, dct)
+        else:
+            # inline the is_content_an_object test, avoid a function call per object
+            for dct in contents:
+                if dct["Key"][-1:] != "/" or dct["Size"] != 0:
+                    yield from_content_dict(bucket, dct)
+
     @classmethod
     def _from_version_dict(cls: T.Type["S3Path"], bucket: str, dct: dict) -> "S3Path":
-        p = cls(bucket, dct["Key"])
-        p._meta = {
-            "Key": dct["Key"],
-            "VersionId": dct["VersionId"],
-            "LastModified": dct["LastModified"],
-            "ETag": dct["ETag"],
-            "ContentLength": dct["Size"],
-            "StorageClass": dct["StorageClass"],
-            "IsLatest": dct["IsLatest"],
-            "ChecksumAlgorithm": dct.get("ChecksumAlgorithm", []),
-            "Owner": dct.get("Owner", {}),
-        }
+        p = cls._from_bucket_key(sys.intern(bucket), dct["Key"])
+        meta = _ListedMeta()
+        meta.Key = dct["Key"]
+        meta.VersionId = dct["VersionId"]
+        meta.LastModified = dct["LastModified"]
+        meta.ETag = dct["ETag"]
+        meta.ContentLength = dct["Size"]
+        meta.StorageClass = sys.intern(dct["StorageClass"])
+        meta.IsLatest = dct["IsLatest"]
+        meta.ChecksumAlgorithm = dct.get("ChecksumAlgorithm", [])
+        meta.Owner = dct.get("Owner", {})
+        p._meta = meta
         return p
 
     @classmethod
     def _from_delete_marker(cls: T.Type["S3Path"], bucket: str, dct: dict) -> "S3Path":
-        p = cls(bucket, dct["Key"])
-        p._meta = {
-            "Key": dct["Key"],
-            "VersionId": dct["VersionId"],
-            "LastModified": dct["LastModified"],
-            "IsLatest": dct["IsLatest"],
-            "Owner": dct.get("Owner", {}),
-            IS_DELETE_MARKER: True,
-        }
+        p = cls._from_bucket_key(sys.intern(bucket), dct["Key"])
+        meta = _ListedMeta()
+        meta.Key = dct["Key"]
+        meta.VersionId = dct["VersionId"]
+        meta.LastModified = dct["LastModified"]
+        meta.IsLatest = dct["IsLatest"]
+        meta.Owner = dct.get("Owner", {})
+        setattr(meta, IS_DELETE_MARKER, True)
+        p._meta = meta
         return p
 
     def update_metadata(self: "S3Path", metadata: dict):  # pragma: no cover
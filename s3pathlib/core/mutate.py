@@ -126,7 +126,11 @@ class MutateAPIMixin:
                     new_basename,
                 ]
             )
-            p._bucket = None
+            p = self._from_parsed_parts(
+                bucket=None,
+                parts=p._parts,
+                is_dir=p._is_dir,
+            )
         else:
             p = self._from_parts(
                 [
@@ -169,8 +173,10 @@ class MutateAPIMixin:
         if self.is_file():
             return self.copy()
         elif self.is_dir():
-            p = self.copy()
-            p._is_dir = False
-            return p
+            return self._from_parsed_parts(
+                bucket=self._bucket,
+                parts=list(self._parts),
+                is_dir=False,
+            )
         else:
             raise ValueError("only concrete file or folder S3Path can do .to_file()")
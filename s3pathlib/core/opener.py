@@ -13,7 +13,7 @@ from func_args import NOTHING, resolve_kwargs
 
 from ..metadata import warn_upper_case_in_metadata_key
 from ..aws import context
-from ..compat import smart_open, compat
+from ..compat import compat
 from ..type import MetadataType, TagType
 from ..tag import encode_url_query
 
@@ -136,4 +136,4 @@ class OpenerAPIMixin:
                 transport_params["client_kwargs"].update(client_kwargs)
             else:
                 transport_params["client_kwargs"] = client_kwargs
-        return smart_open.open(**open_kwargs)
+        return compat.smart_open.open(**open_kwargs)
@@ -112,7 +112,9 @@ class RelativePathAPIMixin:
             raise ValueError(msg)
 
         n = len(other._parts)
-        if self._parts[:n] != other._parts:
+        # a shorter path can't start with other, reject it without slicing,
+        # the C level slice compare is faster than a Python loop otherwise
+        if len(self._parts) < n or self._parts[:n] != other._parts:
             msg = "{} does not start with {}".format(
                 self.uri,
                 other.uri,
@@ -123,11 +125,20 @@ class RelativePathAPIMixin:
             is_dir = self._is_dir
         else:
             is_dir = None
-        return self._from_parsed_parts(
+        p = self._from_parsed_parts(
             bucket=None,
             parts=rel_parts,
             is_dir=is_dir,
         )
+        # the relative key is a suffix of the cached key
+        key, other_key = self._key, other._key
+        if (
+            key is not None
+            and other_key is not None
+            and (other_key == "" or other_key.endswith("/"))
+        ):
+            p._key = key[len(other_key):] if len(rel_parts) else ""
+        return p
 
     def is_relpath(self: "S3Path") -> bool:
         """
@@ -141,16 +152,7 @@ class RelativePathAPIMixin:
 
         .. versionadded:: 1.0.1
         """
-        if self._bucket is None:
-            if len(self._parts) == 0:
-                if self._is_dir is None:
-                    return True
-                else:
-                    return False
-            else:
-                return True
-        else:
-            return False
+        return self._bucket is None and (self._is_dir is None or len(self._parts) != 0)
 
     def __sub__(self: "S3Path", other: "S3Path") -> "S3Path":
         """
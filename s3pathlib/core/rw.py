@@ -18,8 +18,8 @@ from func_args import NOTHING, resolve_kwargs
 from .. import exc
 from ..metadata import warn_upper_case_in_metadata_key
 from ..type import TagType, MetadataType
-from ..tag import encode_url_query
 from ..aws import context
+from ..better_client.put_object import put_object
 
 from .resolve_s3_client import resolve_s3_client
 
@@ -338,45 +338,44 @@ class ReadAndWriteAPIMixin:
         s3_client = resolve_s3_client(context, bsm)
         if metadata is not NOTHING:
             warn_upper_case_in_metadata_key(metadata)
-        response = s3_client.put_object(
-            **resolve_kwargs(
-                Bucket=self.bucket,
-                Key=self.key,
-                Body=data,
-                Metadata=metadata,
-                Tagging=tags if tags is NOTHING else encode_url_query(tags),
-                ACL=acl,
-                CacheControl=cache_control,
-                ContentDisposition=content_disposition,
-                ContentEncoding=content_encoding,
-                ContentLanguage=content_language,
-                ContentLength=content_length,
-                ContentMD5=content_md5,
-                ContentType=content_type,
-                ChecksumAlgorithm=checksum_algorithm,
-                ChecksumCRC32=checksum_crc32,
-                ChecksumCRC32C=checksum_crc32c,
-                ChecksumSHA1=checksum_sha1,
-                ChecksumSHA256=checksum_sha256,
-                Expires=expires_datetime,
-                GrantFullControl=grant_full_control,
-                GrantRead=grant_read,
-                GrantReadACP=grant_read_acp,
-                GrantWriteACP=grant_write_acp,
-                ServerSideEncryption=server_side_encryption,
-                StorageClass=storage_class,
-                WebsiteRedirectLocation=website_redirect_location,
-                SSECustomerAlgorithm=sse_customer_algorithm,
-                SSECustomerKey=sse_customer_key,
-                SSEKMSKeyId=sse_kms_key_id,
-                SSEKMSEncryptionContext=sse_kms_encryption_context,
-                BucketKeyEnabled=bucket_key_enabled,
-                RequestPayer=request_payer,
-                ObjectLockMode=object_lock_mode,
-                ObjectLockRetainUntilDate=object_lock_retain_until_datetime,
-                ObjectLockLegalHoldStatus=object_lock_legal_hold_status,
-                ExpectedBucketOwner=expected_bucket_owner,
-            )
+        response = put_object(
+            s3_client=s3_client,
+            bucket=self.bucket,
+            key=self.key,
+            body=data,
+            metadata=metadata,
+            tags=tags,
+            acl=acl,
+            cache_control=cache_control,
+            content_disposition=content_disposition,
+            content_encoding=content_encoding,
+            content_language=content_language,
+            content_length=content_length,
+            content_md5=content_md5,
+            content_type=content_type,
+            checksum_algorithm=checksum_algorithm,
+            checksum_crc32=checksum_crc32,
+            checksum_crc32c=checksum_crc32c,
+            checksum_sha1=checksum_sha1,
+            checksum_sha256=checksum_sha256,
+            expires_datetime=expires_datetime,
+            grant_full_control=grant_full_control,
+            grant_read=grant_read,
+            grant_read_acp=grant_read_acp,
+            grant_write_acp=grant_write_acp,
+            server_side_encryption=server_side_encryption,
+            storage_class=storage_class,
+            website_redirect_location=website_redirect_location,
+            sse_customer_algorithm=sse_customer_algorithm,
+            sse_customer_key=sse_customer_key,
+            sse_kms_key_id=sse_kms_key_id,
+            sse_kms_encryption_context=sse_kms_encryption_context,
+            bucket_key_enabled=bucket_key_enabled,
+            request_payer=request_payer,
+            object_lock_mode=object_lock_mode,
+            object_lock_retain_until_datetime=object_lock_retain_until_datetime,
+            object_lock_legal_hold_status=object_lock_legal_hold_status,
+            expected_bucket_owner=expected_bucket_owner,
         )
         # print("--- put_object response ---")
         # pprint(response)
@@ -90,7 +90,7 @@ class TaggingAPIMixin:
             **resolve_kwargs(
                 Bucket=self.bucket,
                 Key=self.key,
-                Tagging=dict(TagSet=encode_tag_set(tags)),
+                Tagging={"TagSet": encode_tag_set(tags)},
                 VersionId=version_id,
                 ContentMD5=content_md5,
                 ChecksumAlgorithm=checksum_algorithm,
@@ -9,7 +9,8 @@ import typing as T
 from pathlib_mate import Path
 
 from .resolve_s3_client import resolve_s3_client
-from ..better_client.upload import upload_dir
+from .. import exc
+from ..better_client.upload import upload_dir, is_conditional_upload_supported
 from ..type import PathType
 from ..aws import context
 
@@ -47,12 +48,36 @@ class UploadAPIMixin:
             if any of target s3 location already taken.
 
         .. versionadded:: 1.0.1
+
+        .. versionchanged:: 2.0.2
+
+            With ``overwrite=False``, it makes a conditional write
+            (``IfNoneMatch="*"``) instead of a ``head_object`` before the
+            upload, if the installed boto3 supports it. It saves one round
+            trip and there is no race between the check and the write.
         """
         self.ensure_object()
-        if overwrite is False:
-            self.ensure_not_exists(bsm=bsm)
         p = Path(path)
         s3_client = resolve_s3_client(context, bsm)
+        if overwrite is False:
+            if is_conditional_upload_supported():
+                extra_args = dict(extra_args) if extra_args else {}
+                extra_args["IfNoneMatch"] = "*"
+                try:
+                    return s3_client.upload_file(
+                        Filename=p.abspath,
+                        Bucket=self.bucket,
+                        Key=self.key,
+                        ExtraArgs=extra_args,
+                        Callback=callback,
+                        Config=config,
+                    )
+                except Exception as e:
+                    if exc.is_precondition_failed_error(e):
+                        raise exc.S3FileAlreadyExist.make(self.uri)
+                    raise
+            elif self.exists(bsm=bsm):
+                raise exc.S3FileAlreadyExist.make(self.uri)
         return s3_client.upload_file(
             Filename=p.abspath,
             Bucket=self.bucket,
@@ -60,13 +60,17 @@ class UriAPIMixin:
 
         .. versionadded:: 1.0.1
         """
-        if len(self._parts):
-            return "{}{}".format(
-                "/".join(self._parts),
-                "/" if self._is_dir else ""
-            )
-        else:
-            return ""
+        key = self._key
+        if key is None:
+            if len(self._parts):
+                key = "/".join(self._parts)
+                if self._is_dir:
+                    key += "/"
+            else:
+                key = ""
+            # S3Path is immutable, join the parts only once
+            self._key = key
+        return key
 
     @FilterableProperty
     def uri(self: 'S3Path') -> T.Optional[str]:
@@ -101,15 +105,17 @@ class UriAPIMixin:
 
         .. versionadded:: 1.0.1
         """
-        if self._bucket is None:
-            return None
-        if len(self._parts):
-            return "s3://{}/{}".format(
-                self.bucket,
-                self.key,
-            )
-        else:
-            return "s3://{}/".format(self._bucket)
+        uri = self._uri
+        if uri is None:
+            if self._bucket is None:
+                return None
+            if len(self._parts):
+                uri = f"s3://{self._bucket}/{self.key}"
+            else:
+                uri = f"s3://{self._bucket}/"
+            # only concrete path has uri, cache it like the key
+            self._uri = uri
+        return uri
 
     @property
     def console_url(self: 'S3Path') -> T.Optional[str]:
@@ -198,12 +204,9 @@ class UriAPIMixin:
         if self._bucket is None:
             return None
         if len(self._parts):
-            return "arn:aws:s3:::{}/{}".format(
-                self.bucket,
-                self.key,
-            )
+            return f"arn:aws:s3:::{self._bucket}/{self.key}"
         else:
-            return "arn:aws:s3:::{}".format(self._bucket)
+            return f"arn:aws:s3:::{self._bucket}"
 
     @classmethod
     def from_s3_uri(cls: T.Type['S3Path'], uri: str) -> 'S3Path':
@@ -8,6 +8,7 @@ import typing as T
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .core.s3path import S3Path
+    import botocore.exceptions
 
 
 def ensure_one_and_only_one_not_none(**kwargs) -> None:
@@ -16,7 +17,7 @@ def ensure_one_and_only_one_not_none(**kwargs) -> None:
     """
     if len(kwargs) == 0:
         raise ValueError
-    if sum([v is not None for _, v in kwargs.items()]) != 1:
+    if sum(v is not None for v in kwargs.values()) != 1:
         raise ValueError(
             f"one and only one of arguments from " f"{list(kwargs)} can be not None!"
         )
@@ -28,10 +29,46 @@ def ensure_all_none(**kwargs) -> None:
     """
     if len(kwargs) == 0:
         raise ValueError
-    if sum([v is not None for _, v in kwargs.items()]) != 0:
+    if sum(v is not None for v in kwargs.values()) != 0:
         raise ValueError(f"arguments from {list(kwargs)} has to be all None!")
 
 
+NOT_FOUND_ERROR_CODES = frozenset({"404", "NoSuchKey", "NoSuchBucket", "NotFound"})
+
+
+def get_error_code(e: "botocore.exceptions.ClientError") -> str:
+    """
+    Get the structured error code from a boto3 ``ClientError``, it is much
+    cheaper and more robust than matching the ``str(e)`` error message.
+    """
+    return e.response.get("Error", {}).get("Code", "")
+
+
+def is_precondition_failed_error(e: Exception) -> bool:
+    """
+    Test if a boto3 error means a conditional request (e.g. ``IfNoneMatch``)
+    is rejected. ``upload_file`` raises a ``S3UploadFailedError`` while
+    handling the ``ClientError`` (without ``raise ... from``), so the
+    original error is its ``__context__``.
+    """
+    while e is not None:
+        response = getattr(e, "response", None)
+        if isinstance(response, dict):
+            return response.get("Error", {}).get("Code", "") == "PreconditionFailed"
+        e = e.__cause__ or e.__context__
+    return False
+
+
+def is_not_found_error(e: "botocore.exceptions.ClientError") -> bool:
+    """
+    Test if a boto3 ``ClientError`` means the bucket or object is not found.
+    It checks the error code in the response instead of the error message.
+    """
+    if get_error_code(e) in NOT_FOUND_ERROR_CODES:
+        return True
+    return e.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 404
+
+
 class _UriRelatedError:
     _tpl: str
 
@@ -45,6 +45,30 @@ def encode_tag_set(tags: TagType) -> TagSetType:
     return [{"Key": k, "Value": v} for k, v in tags.items()]
 
 
+def merge_tag_set(tag_set: TagSetType, tags: TagType) -> TagSetType:
+    """
+    Merge the pythonic dictionary key value pairs into the tag set in boto3
+    API response, without parsing and re-encoding the whole tag set.
+    Unchanged items are reused, the original tag set is not modified.
+
+    Example::
+
+        >>> merge_tag_set([{"Key": "name", "Value": "Alice"}], {"age": "18"})
+        [{"Key": "name", "Value": "Alice"}, {"Key": "age", "Value": "18"}]
+
+    .. versionadded:: 2.0.2
+    """
+    merged = list(tag_set)
+    index = {dct["Key"]: ith for ith, dct in enumerate(tag_set)}
+    for k, v in tags.items():
+        ith = index.get(k)
+        if ith is None:
+            merged.append({"Key": k, "Value": v})
+        elif merged[ith]["Value"] != v:
+            merged[ith] = {"Key": k, "Value": v}
+    return merged
+
+
 def encode_url_query(tags: TagType) -> str:
     """
     Some API requires: ``Key1=Value1&Key2=Value2`` for tagging parameter.
@@ -9,6 +9,7 @@ import moto
 from boto_session_manager import BotoSesManager
 from rich import print as rprint
 from s3pathlib import S3Path, context
+from s3pathlib import exc
 from s3pathlib.compat import cached_property
 
 if T.TYPE_CHECKING:
@@ -36,7 +37,7 @@ def is_bucket_exists(bsm: BotoSesManager, name: str) -> bool:
         bsm.s3_client.head_bucket(Bucket=name)
         return True
     except botocore.exceptions.ClientError as e:
-        if "Not Found" in str(e):
+        if exc.is_not_found_error(e):
             return False
         else:  # pragma: no cover
             raise e
@@ -2,6 +2,9 @@
 
 import typing as T
 import hashlib
+import functools
+
+from func_args import NOTHING
 
 try:
     import botocore.exceptions
@@ -54,8 +57,16 @@ def split_parts(key: str) -> T.List[str]:
         ["a", "b", "c"]
 
     .. versionadded:: 1.0.1
+
+    .. versionchanged:: 2.0.2
+
+        a normalized key (no empty part) is returned from ``str.split``
+        directly, without the Python level filter.
     """
-    return [part for part in key.split("/") if part]
+    parts = key.split("/")
+    if "" in parts:
+        return [part for part in parts if part]
+    return parts
 
 
 def smart_join_s3_key(
@@ -89,6 +100,7 @@ def smart_join_s3_key(
         return key
 
 
+@functools.lru_cache(maxsize=4096)
 def make_s3_console_url(
     bucket: T.Optional[str] = None,
     prefix: T.Optional[str] = None,
@@ -113,6 +125,11 @@ def make_s3_console_url(
     .. versionchanged:: 2.0.1
 
         add ``version_id`` parameter.
+
+    .. versionchanged:: 2.0.2
+
+        the result is cached, use ``make_s3_console_url.cache_clear()``
+        to reset it.
     """
     if s3_uri is None:
         if not ((bucket is not None) and (prefix is not None)):
@@ -148,6 +165,7 @@ def make_s3_console_url(
     )
 
 
+@functools.lru_cache(maxsize=4096)
 def make_s3_select_console_url(
     bucket: str,
     key: str,
@@ -435,3 +453,58 @@ def grouper_list(
             counter = 0
     if len(chunk) > 0:
         yield chunk
+
+
+def make_kwargs_builder(
+    name: str,
+    required_fields: T.Sequence[T.Tuple[str, str]],
+    optional_fields: T.Sequence[T.Tuple[str, str]],
+    converters: T.Optional[T.Dict[str, T.Callable]] = None,
+) -> T.Callable[..., dict]:
+    """
+    Generate a function that builds the boto3 API kwargs. It is the
+    specialized version of ``func_args.resolve_kwargs``. The generated
+    function is a straight line of ``is not NOTHING`` check and dict
+    assignment, no intermediate dict and no loop.
+
+    Example::
+
+        >>> build = make_kwargs_builder(
+        ...     "build",
+        ...     required_fields=[("Bucket", "bucket")],
+        ...     optional_fields=[("Tagging", "tags")],
+        ...     converters={"tags": encode_url_query},
+        ... )
+        >>> build("my-bucket", tags={"k": "v"})
+        {"Bucket": "my-bucket", "Tagging": "k=v"}
+
+    :param name: the name of the generated function.
+    :param required_fields: list of ``(api argument name, parameter name)``
+        of the required positional arguments.
+    :param optional_fields: list of ``(api argument name, parameter name)``
+        of the optional arguments, default is ``NOTHING``.
+    :param converters: optional ``{parameter name: function}`` to convert
+        the parameter value before put it into the kwargs.
+
+    .. versionadded:: 2.0.2
+    """
+    if converters is None:
+        converters = dict()
+    namespace = {"NOTHING": NOTHING}
+    params = [param for _, param in required_fields]
+    params.extend(f"{param}=NOTHING" for _, param in optional_fields)
+    lines = [
+        f"def {name}({', '.join(params)}):",
+        "    kwargs = {%s}"
+        % ", ".join(f"{api!r}: {param}" for api, param in required_fields),
+    ]
+    for api, param in optional_fields:
+        lines.append(f"    if {param} is not NOTHING:")
+        if param in converters:
+            namespace[f"_convert_{param}"] = converters[param]
+            lines.append(f"        kwargs[{api!r}] = _convert_{param}({param})")
+        else:
+            lines.append(f"        kwargs[{api!r}] = {param}")
+    lines.append("    return kwargs")
+    exec("\n".join(lines), namespace)
+    return namespace[name]
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+import botocore.exceptions
+from s3pathlib import exc
+from s3pathlib.better_client.aio import (
+    ahead_object,
+    ais_object_exists,
+    aget_object_tagging,
+    aupdate_object_tagging,
+    aupdate_object_tagging_many,
+    aput_object,
+)
+from s3pathlib.better_client.tagging import update_object_tagging
+from s3pathlib.tests import run_cov_test
+
+
+class StubS3Client:
+    """
+    An in-memory s3 client, only implements the APIs used in this test,
+    records every API call.
+    """
+
+    def __init__(self):
+        self.objects = dict()  # key -> tag set
+        self.calls = list()
+
+    def head_object(self, Bucket, Key, **kwargs):
+        self.calls.append(("head_object", Key))
+        if Key not in self.objects:
+            raise botocore.exceptions.ClientError(
+                {
+                    "Error": {"Code": "404", "Message": "Not Found"},
+                    "ResponseMetadata": {"HTTPStatusCode": 404},
+                },
+                "HeadObject",
+            )
+        return {"ContentLength": 0}
+
+    def get_object_tagging(self, Bucket, Key, **kwargs):
+        self.calls.append(("get_object_tagging", Key))
+        return {"TagSet": list(self.objects[Key])}
+
+    def put_object_tagging(self, Bucket, Key, Tagging, **kwargs):
+        self.calls.append(("put_object_tagging", Key, Tagging))
+        self.objects[Key] = list(Tagging["TagSet"])
+        return {}
+
+    def put_object(self, **kwargs):
+        self.calls.append(("put_object", kwargs))
+        self.objects[kwargs["Key"]] = []
+        return {"ETag": '"abc"'}
+
+
+class AsyncStubS3Client:
+    def __init__(self, s3_client: StubS3Client):
+        self.s3_client = s3_client
+
+    def __getattr__(self, name):
+        method = getattr(self.s3_client, name)
+
+        async def call(**kwargs):
+            await asyncio.sleep(0)
+            return method(**kwargs)
+
+        return call
+
+
+def make_clients(objects: dict):
+    s3_client = StubS3Client()
+    s3_client.objects.update(objects)
+    return s3_client, AsyncStubS3Client(s3_client)
+
+
+def test_ahead_object():
+    s3_client, as3_client = make_clients({"a.txt": []})
+    assert asyncio.run(ahead_object(as3_client, "bucket", "a.txt")) == {
+        "ContentLength": 0
+    }
+    assert asyncio.run(ais_object_exists(as3_client, "bucket", "a.txt")) is True
+
+    # not found
+    with pytest.raises(exc.S3FileNotExist):
+        asyncio.run(ahead_object(as3_client, "bucket", "b.txt"))
+    assert (
+        asyncio.run(
+            ahead_object(as3_client, "bucket", "b.txt", ignore_not_found=True)
+        )
+        is None
+    )
+    assert asyncio.run(ais_object_exists(as3_client, "bucket", "b.txt")) is False
+
+
+def test_aget_object_tagging():
+    _, as3_client = make_clients({"a.txt": [{"Key": "k1", "Value": "v1"}]})
+    assert asyncio.run(aget_object_tagging(as3_client, "bucket", "a.txt")) == (
+        None,
+        {"k1": "v1"},
+    )
+
+
+@pytest.mark.parametrize(
+    "tags,merge",
+    [
+        ({"k1": "v1"}, True),  # nothing changed
+        ({"k1": "v1", "k2": "v2"}, True),  # add a tag
+        ({"k1": "v9"}, True),  # change a tag
+        ({"k2": "v2"}, False),  # replace all tags
+    ],
+)
+def test_aupdate_object_tagging_same_as_sync(tags, merge):
+    objects = {"a.txt": [{"Key": "k1", "Value": "v1"}]}
+    s3_client, _ = make_clients(objects)
+    expected = update_object_tagging(s3_client, "bucket", "a.txt", tags, merge=merge)
+
+    as3_client_backend, as3_client = make_clients(objects)
+    result = asyncio.run(
+        aupdate_object_tagging(as3_client, "bucket", "a.txt", tags, merge=merge)
+    )
+    assert result == expected
+    assert as3_client_backend.calls == s3_client.calls
+    assert as3_client_backend.objects == s3_client.objects
+
+
+def test_aupdate_object_tagging():
+    s3_client, as3_client = make_clients({"a.txt": [{"Key": "k1", "Value": "v1"}]})
+
+    # nothing changed, skip the put
+    assert asyncio.run(
+        aupdate_object_tagging(as3_client, "bucket", "a.txt", {"k1": "v1"})
+    ) == (None, {"k1": "v1"})
+    assert [call[0] for call in s3_client.calls] == ["get_object_tagging"]
+
+    # merge
+    s3_client.calls.clear()
+    assert asyncio.run(
+        aupdate_object_tagging(as3_client, "bucket", "a.txt", {"k2": "v2"})
+    ) == (None, {"k1": "v1", "k2": "v2"})
+    assert [call[0] for call in s3_client.calls] == [
+        "get_object_tagging",
+        "put_object_tagging",
+    ]
+
+    # replace, don't read the existing tags
+    s3_client.calls.clear()
+    assert asyncio.run(
+        aupdate_object_tagging(
+            as3_client, "bucket", "a.txt", {"k3": "v3"}, merge=False
+        )
+    ) == (None, {"k3": "v3"})
+    assert [call[0] for call in s3_client.calls] == ["put_object_tagging"]
+    assert s3_client.objects["a.txt"] == [{"Key": "k3", "Value": "v3"}]
+
+
+def test_aupdate_object_tagging_many():
+    s3_client, as3_client = make_clients(
+        {
+            "a.txt": [{"Key": "k1", "Value": "v1"}],
+            "b.txt": [],
+            "c.txt": [{"Key": "k1", "Value": "v0"}],
+        }
+    )
+    result = asyncio.run(
+        aupdate_object_tagging_many(
+            as3_client,
+            "bucket",
+            ["a.txt", "b.txt", "c.txt"],
+            {"k1": "v1"},
+            concurrency=2,
+        )
+    )
+    assert result == {
+        "a.txt": (None, {"k1": "v1"}),
+        "b.txt": (None, {"k1": "v1"}),
+        "c.txt": (None, {"k1": "v1"}),
+    }
+    # a.txt is not changed, skip the put
+    assert sorted(
+        call[1] for call in s3_client.calls if call[0] == "put_object_tagging"
+    ) == ["b.txt", "c.txt"]
+
+    s3_client.calls.clear()
+    result = asyncio.run(
+        aupdate_object_tagging_many(
+            as3_client,
+            "bucket",
+            ["a.txt", "b.txt"],
+            {"k2": "v2"},
+            merge=False,
+        )
+    )
+    assert result == {"a.txt": (None, {"k2": "v2"}), "b.txt": (None, {"k2": "v2"})}
+    assert {call[0] for call in s3_client.calls} == {"put_object_tagging"}
+
+
+def test_aput_object():
+    s3_client, as3_client = make_clients({})
+    response = asyncio.run(
+        aput_object(
+            as3_client,
+            "bucket",
+            "a.txt",
+            b"hello",
+            metadata={"creator": "alice"},
+            tags={"k1": "v1"},
+        )
+    )
+    assert response == {"ETag": '"abc"'}
+    kwargs = s3_client.calls[0][1]
+    assert kwargs["Bucket"] == "bucket"
+    assert kwargs["Key"] == "a.txt"
+    assert kwargs["Body"] == b"hello"
+    assert kwargs["Metadata"] == {"creator": "alice"}
+    assert kwargs["Tagging"] == "k1=v1"
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, module="s3pathlib.better_client.aio", preview=False)
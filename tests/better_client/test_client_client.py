@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import warnings
+
+import pytest
+import boto3
+from s3pathlib.better_client.client import (
+    make_tuned_s3_client,
+    get_paginator,
+    get_executor,
+    check_pool_size,
+    resolve_max_workers,
+    DEFAULT_MAX_WORKERS,
+)
+from s3pathlib.tests import run_cov_test
+
+
+def test_make_tuned_s3_client():
+    boto_ses = boto3.session.Session(region_name="us-east-1")
+    s3_client = make_tuned_s3_client(boto_ses=boto_ses, pool_size=32)
+    assert s3_client.meta.config.max_pool_connections == 32
+
+
+def test_check_pool_size():
+    boto_ses = boto3.session.Session(region_name="us-east-1")
+    s3_client = make_tuned_s3_client(boto_ses=boto_ses, pool_size=16)
+    check_pool_size(s3_client, 16)
+    with pytest.warns(UserWarning):
+        check_pool_size(s3_client, 32)
+
+
+def test_resolve_max_workers():
+    boto_ses = boto3.session.Session(region_name="us-east-1")
+    s3_client = make_tuned_s3_client(boto_ses=boto_ses, pool_size=4)
+    # the default is capped to the pool size, without warning
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", UserWarning)
+        assert resolve_max_workers(s3_client) == min(DEFAULT_MAX_WORKERS, 4)
+        assert resolve_max_workers(s3_client, 2) == 2
+    # an explicit value is used as it is
+    with pytest.warns(UserWarning):
+        assert resolve_max_workers(s3_client, 8) == 8
+
+    s3_client = make_tuned_s3_client(boto_ses=boto_ses, pool_size=64)
+    assert resolve_max_workers(s3_client) == DEFAULT_MAX_WORKERS
+
+
+def test_get_paginator():
+    boto_ses = boto3.session.Session(region_name="us-east-1")
+    s3_client = boto_ses.client("s3")
+    paginator = get_paginator(s3_client, "list_objects_v2")
+    assert get_paginator(s3_client, "list_objects_v2") is paginator
+    assert get_paginator(s3_client, "list_object_versions") is not paginator
+
+
+def test_get_executor():
+    executor = get_executor(4)
+    assert get_executor(4) is executor
+    assert get_executor(8) is not executor
+    assert list(executor.map(lambda x: x * 2, [1, 2, 3])) == [2, 4, 6]
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, module="s3pathlib.better_client.client", preview=False)
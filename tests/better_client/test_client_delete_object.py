@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import warnings
+
+import pytest
+import botocore.exceptions
 from s3pathlib.better_client.head_object import is_object_exists
 from s3pathlib.better_client.list_objects import (
     calculate_total_size,
@@ -9,6 +13,7 @@ from s3pathlib.better_client.delete_object import (
     delete_object,
     delete_dir,
     delete_object_versions,
+    _delete_objects_in_parallel,
 )
 from s3pathlib.utils import smart_join_s3_key
 from s3pathlib.tests import run_cov_test
@@ -125,6 +130,46 @@ class BetterDeleteObject(DummyData):
         )
         assert total_size == 0
 
+    def _test_delete_objects_in_parallel(self):
+        s3_client = self.s3_client
+        bucket = self.bucket
+        prefix = smart_join_s3_key([self.prefix, "delete_in_parallel"], is_dir=True)
+        keys = [f"{prefix}{i}.txt" for i in range(5)]
+        for key in keys:
+            s3_client.put_object(Bucket=bucket, Key=key, Body="hello")
+
+        def make_kwargs(bucket: str, key: str) -> dict:
+            return dict(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key}], "Quiet": True},
+            )
+
+        # the default max_workers fits the client's connection pool
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", UserWarning)
+            count = _delete_objects_in_parallel(
+                s3_client,
+                (make_kwargs(bucket, key) for key in keys),
+            )
+        assert count == 5
+        assert count_objects(s3_client=s3_client, bucket=bucket, prefix=prefix) == 0
+
+        # stop consuming the batches on the first failure
+        n_pulled = 0
+
+        def kwargs_list():
+            nonlocal n_pulled
+            for i in range(100):
+                n_pulled += 1
+                if i == 0:
+                    yield make_kwargs(f"{bucket}-not-exists", keys[0])
+                else:
+                    yield make_kwargs(bucket, keys[0])
+
+        with pytest.raises(botocore.exceptions.ClientError):
+            _delete_objects_in_parallel(s3_client, kwargs_list(), max_workers=2)
+        assert n_pulled <= 2 * 2 + 1
+
     def _test_with_dummy_data(self):
         self.setup_dummy_data()
 
@@ -185,6 +230,7 @@ class BetterDeleteObject(DummyData):
         self._test_delete_object()
         self._test_delete_object_versions()
         self._test_with_list_objects_folder()
+        self._test_delete_objects_in_parallel()
         self._test_with_dummy_data()
 
 
@@ -15,6 +15,17 @@ class BetterHeadBucket(BaseTest):
     def test(self):
         assert is_bucket_exists(self.s3_client, "this-bucket-exists") is True
         assert is_bucket_exists(self.s3_client, "this-bucket-not-exists") is False
+        for _ in range(2):
+            assert (
+                is_bucket_exists(self.s3_client, "this-bucket-exists", cache=True)
+                is True
+            )
+            assert (
+                is_bucket_exists(self.s3_client, "this-bucket-not-exists", cache=True)
+                is False
+            )
+        is_bucket_exists.cache_clear()
+        assert is_bucket_exists(self.s3_client, "this-bucket-exists", cache=True)
 
 
 # NOTE: this module should ONLY be tested with MOCK
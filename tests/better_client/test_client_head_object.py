@@ -5,6 +5,8 @@ from s3pathlib import exc
 from s3pathlib.better_client.head_object import (
     head_object,
     is_object_exists,
+    invalidate_object_exists_cache,
+    exists_many,
 )
 from s3pathlib.utils import smart_join_s3_key
 from s3pathlib.tests import run_cov_test
@@ -98,9 +100,111 @@ class BetterHeadObject(DummyData):
             is True
         )
 
+    def _test_is_object_exists_with_cache(self):
+        s3_client = self.s3_client
+        bucket = self.bucket
+        key = smart_join_s3_key([self.prefix, "cached.txt"], is_dir=False)
+
+        kwargs = dict(s3_client=s3_client, bucket=bucket, key=key, cache=True)
+        assert is_object_exists(**kwargs) is False
+        s3_client.put_object(Bucket=bucket, Key=key, Body="hello")
+        # negative result is cached
+        assert is_object_exists(**kwargs) is False
+        invalidate_object_exists_cache(s3_client, bucket, self.prefix)
+        assert is_object_exists(**kwargs) is True
+
+        # the cache is per client
+        other_s3_client = self.bsm.boto_ses.client("s3")
+        s3_client.delete_object(Bucket=bucket, Key=key)
+        assert is_object_exists(**kwargs) is True
+        assert (
+            is_object_exists(
+                s3_client=other_s3_client, bucket=bucket, key=key, cache=True
+            )
+            is False
+        )
+        # invalidate one client doesn't touch the other one
+        invalidate_object_exists_cache(other_s3_client, bucket, self.prefix)
+        assert is_object_exists(**kwargs) is True
+        is_object_exists.cache_clear()
+        assert is_object_exists(**kwargs) is False
+
+    def _test_exists_many(self):
+        s3_client = self.s3_client
+        bucket = self.bucket
+        keys = [
+            self.key_hello,
+            self.key_soft_folder,
+            self.key_soft_folder_file,
+            self.prefix_hard_folder,
+            self.key_hard_folder_file,
+            self.key_empty_hard_folder,
+        ]
+        expected = {
+            self.key_hello,
+            self.key_soft_folder_file,
+            self.prefix_hard_folder,
+            self.key_hard_folder_file,
+        }
+        # list the common prefix
+        assert exists_many(s3_client, bucket, keys) == expected
+        # head object for a few keys
+        assert exists_many(s3_client, bucket, keys[:2]) == {self.key_hello}
+        assert exists_many(s3_client, bucket, []) == set()
+
+    def _test_exists_many_key_range(self):
+        s3_client = self.s3_client
+        bucket = self.bucket
+        prefix = smart_join_s3_key([self.prefix, "exists_many"], is_dir=True)
+        for i in range(10):
+            s3_client.put_object(Bucket=bucket, Key=f"{prefix}{i}.txt", Body="")
+        keys = [f"{prefix}2.txt", f"{prefix}3.txt", f"{prefix}3a.txt", f"{prefix}5.txt"]
+        expected = {f"{prefix}2.txt", f"{prefix}3.txt", f"{prefix}5.txt"}
+
+        calls = {"ListObjectsV2": 0, "HeadObject": 0}
+
+        def count_calls(event_name, **kwargs):
+            calls[event_name.split(".")[-1]] += 1
+
+        s3_client.meta.events.register("before-call.s3.ListObjectsV2", count_calls)
+        s3_client.meta.events.register("before-call.s3.HeadObject", count_calls)
+        try:
+            # only the key range 2.txt ~ 5.txt is listed, it stops at 6.txt
+            assert (
+                exists_many(s3_client, bucket, keys, batch_size=1, max_list_calls=100)
+                == expected
+            )
+            assert calls == {"ListObjectsV2": 5, "HeadObject": 0}
+
+            # the range is wider than max_list_calls, head the rest of the keys
+            calls.update({"ListObjectsV2": 0, "HeadObject": 0})
+            assert (
+                exists_many(s3_client, bucket, keys, batch_size=1, max_list_calls=2)
+                == expected
+            )
+            assert calls == {"ListObjectsV2": 2, "HeadObject": 2}
+
+            # keys at the 1024 bytes limit
+            long_prefix = f"{prefix}long/"
+            long_keys = [
+                long_prefix + str(i) * (1024 - len(long_prefix.encode("utf-8")))
+                for i in range(4)
+            ]
+            for key in long_keys[:3]:
+                s3_client.put_object(Bucket=bucket, Key=key, Body="")
+            calls.update({"ListObjectsV2": 0, "HeadObject": 0})
+            assert exists_many(s3_client, bucket, long_keys) == set(long_keys[:3])
+            assert calls == {"ListObjectsV2": 1, "HeadObject": 0}
+        finally:
+            s3_client.meta.events.unregister("before-call.s3.ListObjectsV2", count_calls)
+            s3_client.meta.events.unregister("before-call.s3.HeadObject", count_calls)
+
     def test(self):
         self._test_before_and_after_put_object()
         self._test_is_object_exists()
+        self._test_is_object_exists_with_cache()
+        self._test_exists_many()
+        self._test_exists_many_key_range()
 
 
 # NOTE: this module should ONLY be tested with MOCK
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import json
+
+import pytest
+from s3pathlib.better_client.inventory import (
+    InventorySource,
+    calculate_total_size_from_inventory,
+)
+from s3pathlib.better_client.list_objects import (
+    calculate_total_size,
+    count_objects,
+)
+from s3pathlib.tests import run_cov_test
+from s3pathlib.tests.mock import BaseTest
+
+
+class BetterInventory(BaseTest):
+    module = "better_client.inventory"
+
+    @classmethod
+    def custom_setup_class(cls):
+        rows = [
+            ("source-bucket", "folder/", "0"),
+            ("source-bucket", "folder/1.txt", "1"),
+            ("source-bucket", "folder/my+file.txt", "2"),
+            ("source-bucket", "folder/sub/3.txt", "3"),
+            ("source-bucket", "other/4.txt", "4"),
+        ]
+        body = "".join(f'"{b}","{k}","{s}"\n' for b, k, s in rows)
+        bucket = cls.get_bucket()
+        s3_client = cls.bsm.s3_client
+        folder = cls.get_module_folders()
+        data_key = f"{folder}/data/1.csv.gz"
+        manifest_key = f"{folder}/manifest.json"
+        s3_client.put_object(
+            Bucket=bucket,
+            Key=data_key,
+            Body=gzip.compress(body.encode("utf-8")),
+        )
+        manifest = {
+            "sourceBucket": "source-bucket",
+            "destinationBucket": f"arn:aws:s3:::{bucket}",
+            "fileFormat": "CSV",
+            "fileSchema": "Bucket, Key, Size",
+            "files": [{"key": data_key}],
+        }
+        s3_client.put_object(
+            Bucket=bucket,
+            Key=manifest_key,
+            Body=json.dumps(manifest),
+        )
+        cls.inventory = InventorySource(
+            bucket=bucket,
+            manifest_key=manifest_key,
+        )
+
+        # versioned bucket, a row per version and per delete marker
+        rows = [
+            # bucket, key, version id, is latest, is delete marker, size
+            ("source-bucket", "folder/1.txt", "v2", "true", "false", "10"),
+            ("source-bucket", "folder/1.txt", "v1", "false", "false", "1"),
+            ("source-bucket", "folder/2.txt", "v2", "true", "true", ""),
+            ("source-bucket", "folder/2.txt", "v1", "false", "false", "2"),
+            ("source-bucket", "folder/3.txt", "v1", "true", "false", "3"),
+        ]
+        body = "".join(",".join(f'"{v}"' for v in row) + "\n" for row in rows)
+        data_key = f"{folder}/versioned/data/1.csv.gz"
+        manifest_key = f"{folder}/versioned/manifest.json"
+        s3_client.put_object(
+            Bucket=bucket,
+            Key=data_key,
+            Body=gzip.compress(body.encode("utf-8")),
+        )
+        manifest = {
+            "sourceBucket": "source-bucket",
+            "destinationBucket": f"arn:aws:s3:::{bucket}",
+            "fileFormat": "CSV",
+            "fileSchema": "Bucket, Key, VersionId, IsLatest, IsDeleteMarker, Size",
+            "files": [{"key": data_key}],
+        }
+        s3_client.put_object(
+            Bucket=bucket,
+            Key=manifest_key,
+            Body=json.dumps(manifest),
+        )
+        cls.versioned_inventory = InventorySource(
+            bucket=bucket,
+            manifest_key=manifest_key,
+        )
+
+        manifest_key = f"{folder}/orc/manifest.json"
+        manifest = {
+            "sourceBucket": "source-bucket",
+            "destinationBucket": f"arn:aws:s3:::{bucket}",
+            "fileFormat": "ORC",
+            "fileSchema": "struct<bucket:string,key:string,size:bigint>",
+            "files": [],
+        }
+        s3_client.put_object(
+            Bucket=bucket,
+            Key=manifest_key,
+            Body=json.dumps(manifest),
+        )
+        cls.orc_inventory = InventorySource(
+            bucket=bucket,
+            manifest_key=manifest_key,
+        )
+
+    def test(self):
+        assert calculate_total_size_from_inventory(
+            self.s3_client, self.inventory
+        ) == (4, 10)
+        assert calculate_total_size_from_inventory(
+            self.s3_client, self.inventory, include_folder=True
+        ) == (5, 10)
+        # "+" in url-encoded key is a space
+        assert calculate_total_size_from_inventory(
+            self.s3_client, self.inventory, prefix="folder/my "
+        ) == (1, 2)
+
+        assert calculate_total_size(
+            self.s3_client,
+            "source-bucket",
+            "folder/",
+            inventory=self.inventory,
+        ) == (3, 6)
+        assert (
+            count_objects(
+                self.s3_client,
+                "source-bucket",
+                "folder/",
+                include_folder=True,
+                inventory=self.inventory,
+            )
+            == 4
+        )
+
+        with pytest.raises(ValueError):
+            calculate_total_size(
+                self.s3_client,
+                "another-bucket",
+                "folder/",
+                inventory=self.inventory,
+            )
+
+        # only the latest version that is not a delete marker is counted
+        assert calculate_total_size_from_inventory(
+            self.s3_client, self.versioned_inventory
+        ) == (2, 13)
+
+        with pytest.raises(ValueError):
+            calculate_total_size_from_inventory(self.s3_client, self.orc_inventory)
+
+
+# NOTE: this module should ONLY be tested with MOCK
+# DO NOT USE REAL S3 BUCKET
+class TestUseMock(BetterInventory):
+    use_mock = True
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, module="s3pathlib.better_client.inventory", preview=False)
@@ -2,7 +2,10 @@
 
 import typing as T
 import pytest
+from s3pathlib.better_client.list_objects import CommonPrefixTypeDefIterproxy
 from s3pathlib.better_client.list_object_versions import (
+    ObjectVersionTypeDefIterproxy,
+    DeleteMarkerEntryTypeDefIterproxy,
     paginate_list_object_versions,
 )
 from s3pathlib.utils import smart_join_s3_key
@@ -100,6 +103,10 @@ class BetterListObjectVersions(DummyData):
         assert len(common_prefixes) == 0
 
         # check the number of versions, delete markers and common prefixes
+        result = list_object_versions()
+        assert isinstance(result.versions(), ObjectVersionTypeDefIterproxy)
+        assert isinstance(result.delete_markers(), DeleteMarkerEntryTypeDefIterproxy)
+        assert isinstance(result.common_prefixes(), CommonPrefixTypeDefIterproxy)
         assert len(list_object_versions().versions().all()) == 9
         assert len(list_object_versions().delete_markers().all()) == 3
         assert len(list_object_versions().common_prefixes().all()) == 0
@@ -114,6 +121,20 @@ class BetterListObjectVersions(DummyData):
         assert len(delete_markers) == 1
         assert len(common_prefixes) == 2
 
+        # limit the number of versions, delete markers and common prefixes
+        (
+            versions,
+            delete_markers,
+            common_prefixes,
+        ) = list_object_versions().versions_and_delete_markers_and_common_prefixes(
+            max_versions=4,
+            max_delete_markers=1,
+            max_common_prefixes=0,
+        )
+        assert len(versions) == 4
+        assert len(delete_markers) == 1
+        assert len(common_prefixes) == 0
+
     def test(self):
         self._test_paginate_list_object_versions_for_object()
         self._test_paginate_list_object_versions_for_folder()
@@ -2,9 +2,13 @@
 
 import pytest
 from s3pathlib.better_client.list_objects import (
+    ObjectTypeDefIterproxy,
+    CommonPrefixTypeDefIterproxy,
     paginate_list_objects_v2,
+    scan_prefix_stats,
     calculate_total_size,
     count_objects,
+    _paginate_shards_in_parallel,
 )
 from s3pathlib.tests import run_cov_test
 
@@ -22,14 +26,22 @@ class BetterListObjects(DummyData):
 
     def _test_paginate_list_objects_v2_argument_error(self):
         # invalid batch_size
-        for batch_size in [-1, 9999]:
-            with pytest.raises(ValueError):
-                paginate_list_objects_v2(
-                    s3_client=None,
-                    bucket=None,
-                    prefix=None,
-                    batch_size=batch_size,
-                )
+        with pytest.raises(ValueError):
+            paginate_list_objects_v2(
+                s3_client=None,
+                bucket=None,
+                prefix=None,
+                batch_size=-1,
+            )
+
+        # batch_size greater than S3 limit only warns
+        with pytest.warns(UserWarning):
+            paginate_list_objects_v2(
+                s3_client=self.s3_client,
+                bucket=self.bucket,
+                prefix=self.prefix_test_list_objects,
+                batch_size=9999,
+            )
 
     def _test_paginate_list_objects_v2_contents(self):
         # batch_size < limit
@@ -59,8 +71,33 @@ class BetterListObjects(DummyData):
             prefix=self.prefix_test_list_objects,
             batch_size=10,
         )
+        assert isinstance(result.contents(), ObjectTypeDefIterproxy)
+        assert isinstance(result.common_prefixs(), CommonPrefixTypeDefIterproxy)
         assert len(result.contents().all()) == 11
 
+        # content batches
+        batches = list(
+            paginate_list_objects_v2(
+                s3_client=self.s3_client,
+                bucket=self.bucket,
+                prefix=self.prefix_test_list_objects,
+                batch_size=3,
+            ).content_batches()
+        )
+        assert [len(batch) for batch in batches] == [3, 3, 3, 2]
+
+        columns = list(
+            paginate_list_objects_v2(
+                s3_client=self.s3_client,
+                bucket=self.bucket,
+                prefix=self.prefix_test_list_objects,
+                batch_size=3,
+            ).content_columns()
+        )
+        assert [len(column.keys) for column in columns] == [3, 3, 3, 2]
+        assert columns[0].keys == [content["Key"] for content in batches[0]]
+        assert columns[0].sizes == [content["Size"] for content in batches[0]]
+
     def _test_paginate_list_objects_v2_common_prefixs(self):
         contents, common_prefixes = paginate_list_objects_v2(
             s3_client=self.s3_client,
@@ -113,6 +150,73 @@ class BetterListObjects(DummyData):
         assert len(contents) == 2  # hard_folder/, hard_folder/file.txt
         assert len(common_prefixes) == 0
 
+    def _test_paginate_list_objects_v2_shard_prefixes(self):
+        contents = paginate_list_objects_v2(
+            s3_client=self.s3_client,
+            bucket=self.bucket,
+            prefix=self.prefix_dummy_data,
+            shard_prefixes=[
+                self.prefix_soft_folder,
+                self.prefix_hard_folder,
+                self.prefix_empty_hard_folder,
+            ],
+            max_workers=2,
+        ).contents().all()
+        # soft_folder/file.txt,
+        # hard_folder/
+        # hard_folder/file.txt
+        # empty_hard_folder/
+        assert len(contents) == 4
+
+        with pytest.raises(ValueError):
+            paginate_list_objects_v2(
+                s3_client=self.s3_client,
+                bucket=self.bucket,
+                prefix=self.prefix_dummy_data,
+                limit=1,
+                shard_prefixes=[self.prefix_soft_folder],
+            )
+
+    def _test_scan_prefix_stats(self):
+        stats = scan_prefix_stats(
+            s3_client=self.s3_client,
+            bucket=self.bucket,
+            prefix=self.prefix_hard_folder,
+            include_folder=True,
+        )
+        assert stats.count == 2
+        assert stats.min_size == 0
+        assert stats.max_size == stats.total_size
+        assert stats.last_modified is not None
+
+        stats = scan_prefix_stats(
+            s3_client=self.s3_client,
+            bucket=self.bucket,
+            prefix=self.prefix_empty_hard_folder,
+        )
+        assert stats.count == 0
+        assert stats.total_size == 0
+        assert stats.min_size is None
+        assert stats.max_size is None
+        assert stats.last_modified is None
+
+        # listing sub folders concurrently gives the same result
+        for include_folder in [True, False]:
+            stats = scan_prefix_stats(
+                s3_client=self.s3_client,
+                bucket=self.bucket,
+                prefix=self.prefix_dummy_data,
+                include_folder=include_folder,
+            )
+            sharded_stats = scan_prefix_stats(
+                s3_client=self.s3_client,
+                bucket=self.bucket,
+                prefix=self.prefix_dummy_data,
+                include_folder=include_folder,
+                max_workers=4,
+            )
+            assert sharded_stats == stats
+
     def _test_calculate_total_size(self):
         s3_client = self.s3_client
         bucket = self.bucket
@@ -253,10 +357,34 @@ class BetterListObjects(DummyData):
         self._test_paginate_list_objects_v2_contents()
         self._test_paginate_list_objects_v2_common_prefixs()
         self._test_paginate_list_objects_v2_hard_and_soft_folder()
+        self._test_paginate_list_objects_v2_shard_prefixes()
+        self._test_scan_prefix_stats()
         self._test_calculate_total_size()
         self._test_count_objects()
 
 
+def test_paginate_shards_in_parallel_early_exit():
+    shards = [f"folder/{i}/" for i in range(200)]
+    calls = list()
+
+    def paginate(shard: str):
+        calls.append(shard)
+        if shard == "folder/1/":
+            raise ValueError(shard)
+        yield {"Prefix": shard}
+
+    # the consumer breaks, the queued shards don't make any API call
+    for _ in _paginate_shards_in_parallel(paginate, shards, max_workers=2):
+        break
+    assert len(calls) < 20
+
+    # a shard fails, the queued shards don't make any API call
+    calls.clear()
+    with pytest.raises(ValueError):
+        list(_paginate_shards_in_parallel(paginate, shards, max_workers=2))
+    assert len(calls) < 20
+
+
 class Test(BetterListObjects):
     use_mock = False
 
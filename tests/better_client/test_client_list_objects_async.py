@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+from s3pathlib.better_client.list_objects_async import apaginate_list_objects_v2
+from s3pathlib.tests import run_cov_test
+
+
+class StubPaginator:
+    """
+    Mimic the aiobotocore ``list_objects_v2`` paginator, each prefix has
+    a list of pages, a page can be an exception to raise.
+    """
+
+    def __init__(self, pages: dict):
+        self.pages = pages
+        self.calls = list()
+        self.n_yielded = dict()
+        self.closed = set()
+
+    def paginate(self, **kwargs):
+        self.calls.append(kwargs)
+        return self._paginate(kwargs["Prefix"])
+
+    async def _paginate(self, prefix: str):
+        self.n_yielded[prefix] = 0
+        try:
+            for page in self.pages[prefix]:
+                await asyncio.sleep(0)
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+                self.n_yielded[prefix] += 1
+        finally:
+            self.closed.add(prefix)
+
+
+class StubS3Client:
+    def __init__(self, pages: dict):
+        self.paginator = StubPaginator(pages)
+
+    def get_paginator(self, name: str):
+        assert name == "list_objects_v2"
+        return self.paginator
+
+
+def make_pages(prefix: str, n_page: int, n_key: int = 2) -> list:
+    return [
+        {"Contents": [{"Key": f"{prefix}{i}-{j}.txt"} for j in range(n_key)]}
+        for i in range(n_page)
+    ]
+
+
+def collect_keys(s3_client, **kwargs) -> list:
+    async def main():
+        keys = list()
+        async for response in apaginate_list_objects_v2(s3_client, **kwargs):
+            keys.extend(dct["Key"] for dct in response.get("Contents", []))
+        return keys
+
+    return asyncio.run(main())
+
+
+def test_paginate():
+    s3_client = StubS3Client({"data/": make_pages("data/", 3)})
+    keys = collect_keys(s3_client, bucket="bucket", prefix="data/", batch_size=2)
+    assert keys == [f"data/{i}-{j}.txt" for i in range(3) for j in range(2)]
+    assert s3_client.paginator.calls == [
+        {"Bucket": "bucket", "Prefix": "data/", "PaginationConfig": {"PageSize": 2}}
+    ]
+
+
+def test_shard_fan_out():
+    pages = {
+        "data/a/": make_pages("data/a/", 3),
+        "data/b/": make_pages("data/b/", 1),
+        "data/c/": [],
+    }
+    s3_client = StubS3Client(pages)
+    keys = collect_keys(
+        s3_client,
+        bucket="bucket",
+        prefix="data/",
+        shard_prefixes=list(pages),
+        concurrency=2,
+    )
+    # the order across shards is not guaranteed
+    assert sorted(keys) == sorted(
+        dct["Key"]
+        for shard_pages in pages.values()
+        for page in shard_pages
+        for dct in page["Contents"]
+    )
+    assert sorted(kwargs["Prefix"] for kwargs in s3_client.paginator.calls) == list(
+        pages
+    )
+
+
+def test_shard_error():
+    pages = {
+        "data/a/": make_pages("data/a/", 100),
+        "data/b/": make_pages("data/b/", 1) + [RuntimeError("boom")],
+    }
+    s3_client = StubS3Client(pages)
+    with pytest.raises(RuntimeError, match="boom"):
+        collect_keys(
+            s3_client,
+            bucket="bucket",
+            prefix="data/",
+            shard_prefixes=list(pages),
+        )
+    # the other shard is cancelled, it doesn't run to the end
+    assert s3_client.paginator.closed == set(pages)
+    assert s3_client.paginator.n_yielded["data/a/"] < 100
+
+
+def test_early_break():
+    pages = {
+        "data/a/": make_pages("data/a/", 100),
+        "data/b/": make_pages("data/b/", 100),
+    }
+    s3_client = StubS3Client(pages)
+
+    async def main():
+        agen = apaginate_list_objects_v2(
+            s3_client,
+            bucket="bucket",
+            prefix="data/",
+            shard_prefixes=list(pages),
+            concurrency=2,
+        )
+        async for _ in agen:
+            break
+        await agen.aclose()
+        # all shard tasks are finished, nothing is left running
+        assert len(asyncio.all_tasks()) == 1
+
+    asyncio.run(main())
+    assert s3_client.paginator.closed == set(pages)
+    assert s3_client.paginator.n_yielded["data/a/"] < 100
+    assert s3_client.paginator.n_yielded["data/b/"] < 100
+
+
+def test_shard_not_under_prefix():
+    s3_client = StubS3Client({})
+    with pytest.raises(ValueError):
+        collect_keys(
+            s3_client,
+            bucket="bucket",
+            prefix="data/",
+            shard_prefixes=["data/a/", "logs/"],
+        )
+    assert s3_client.paginator.calls == []
+
+
+if __name__ == "__main__":
+    run_cov_test(
+        __file__, module="s3pathlib.better_client.list_objects_async", preview=False
+    )
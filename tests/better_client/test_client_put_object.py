@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+import warnings
+
+import pytest
+from func_args import NOTHING
+from s3pathlib.better_client.head_object import is_object_exists
+from s3pathlib.better_client.put_object import (
+    build_put_object_kwargs,
+    put_object,
+    put_objects_concurrent,
+)
+from s3pathlib.utils import smart_join_s3_key
+from s3pathlib.tests import run_cov_test
+from s3pathlib.tests.mock import BaseTest
+
+
+def test_build_put_object_kwargs():
+    assert build_put_object_kwargs("b", "k", b"") == {
+        "Bucket": "b",
+        "Key": "k",
+        "Body": b"",
+    }
+    assert build_put_object_kwargs(
+        "b",
+        "k",
+        b"",
+        tags={"k": "v"},
+        content_type="text/plain",
+        acl=NOTHING,
+    ) == {
+        "Bucket": "b",
+        "Key": "k",
+        "Body": b"",
+        "ContentType": "text/plain",
+        "Tagging": "k=v",
+    }
+
+
+class BetterPutObject(BaseTest):
+    module = "better_client.put_object"
+
+    def test(self):
+        key = smart_join_s3_key([self.get_prefix(), "file.txt"], is_dir=False)
+        assert is_object_exists(self.s3_client, self.bucket, key, cache=True) is False
+        put_object(
+            self.s3_client,
+            self.bucket,
+            key,
+            body=b"hello",
+            metadata={"creator": "me"},
+            tags={"env": "dev"},
+        )
+        # put_object invalidates the cached "not exists" result
+        assert is_object_exists(self.s3_client, self.bucket, key, cache=True) is True
+        response = self.s3_client.get_object(Bucket=self.bucket, Key=key)
+        assert response["Body"].read() == b"hello"
+        assert response["Metadata"] == {"creator": "me"}
+
+        # put many objects concurrently
+        kwargs_iterable = (
+            dict(
+                bucket=self.bucket,
+                key=smart_join_s3_key(
+                    [self.get_prefix(), "many", f"{i}.txt"], is_dir=False
+                ),
+                body=str(i).encode("utf-8"),
+            )
+            for i in range(20)
+        )
+        results = list(
+            put_objects_concurrent(
+                self.s3_client, kwargs_iterable, max_workers=4, max_pending=5
+            )
+        )
+        assert len(results) == 20
+        assert len({kwargs["key"] for kwargs, _ in results}) == 20
+
+        # the default max_workers fits the client's connection pool
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", UserWarning)
+            results = list(
+                put_objects_concurrent(
+                    self.s3_client,
+                    [
+                        dict(bucket=self.bucket, key=kwargs["key"], body=b"")
+                        for kwargs, _ in results
+                    ],
+                )
+            )
+        assert len(results) == 20
+
+        # an explicit max_workers larger than the pool emits a warning
+        pool_size = self.s3_client.meta.config.max_pool_connections
+        with pytest.warns(UserWarning):
+            list(
+                put_objects_concurrent(
+                    self.s3_client, [], max_workers=pool_size + 1
+                )
+            )
+
+
+# NOTE: this module should ONLY be tested with MOCK
+# DO NOT USE REAL S3 BUCKET
+class TestUseMock(BetterPutObject):
+    use_mock = True
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, module="s3pathlib.better_client.put_object", preview=False)
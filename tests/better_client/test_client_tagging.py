@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 
+import warnings
+
 import pytest
 
 from s3pathlib.better_client.tagging import (
     update_bucket_tagging,
     update_object_tagging,
+    update_object_tagging_from_head,
+    update_object_tagging_many,
 )
 from s3pathlib.tests import run_cov_test
 from s3pathlib.tests.mock import BaseTest
@@ -46,6 +50,14 @@ class BetterUpload(BaseTest):
             {"Key": "k3", "Value": "v3"},
         ]
 
+        # no change
+        tags = update_bucket_tagging(
+            s3_client=s3_client,
+            bucket=bucket,
+            tags={"k3": "v3"},
+        )
+        assert tags == {"k1": "v1", "k2": "v22", "k3": "v3"}
+
     def _test_object_tagging(self):
         s3_client = self.s3_client
         bucket = self.bucket
@@ -86,9 +98,105 @@ class BetterUpload(BaseTest):
             {"Key": "k3", "Value": "v3"},
         ]
 
+        # no change
+        tags = update_object_tagging(
+            s3_client=s3_client,
+            bucket=bucket,
+            key=key,
+            tags={"k1": "v1"},
+        )[1]
+        assert tags == {"k1": "v1", "k2": "v22", "k3": "v3"}
+
+        # replace without merge
+        tags = update_object_tagging(
+            s3_client=s3_client,
+            bucket=bucket,
+            key=key,
+            tags={"k4": "v4"},
+            merge=False,
+        )[1]
+        assert tags == {"k4": "v4"}
+        res = s3_client.get_object_tagging(Bucket=bucket, Key=key)
+        assert res["TagSet"] == [{"Key": "k4", "Value": "v4"}]
+
+    def _test_object_tagging_many(self):
+        s3_client = self.s3_client
+        bucket = self.bucket
+        keys = [f"{self.get_prefix()}/test_object_tagging_many/{i}" for i in range(5)]
+        for key in keys:
+            s3_client.put_object(Bucket=bucket, Key=key, Body="")
+        results = update_object_tagging_many(
+            s3_client=s3_client,
+            bucket=bucket,
+            keys=keys,
+            tags={"k1": "v1"},
+            max_workers=3,
+        )
+        assert set(results) == set(keys)
+        for key in keys:
+            assert results[key][1] == {"k1": "v1"}
+            res = s3_client.get_object_tagging(Bucket=bucket, Key=key)
+            assert res["TagSet"] == [{"Key": "k1", "Value": "v1"}]
+
+        # the default max_workers fits the client's connection pool
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", UserWarning)
+            results = update_object_tagging_many(
+                s3_client=s3_client,
+                bucket=bucket,
+                keys=keys,
+                tags={"k2": "v2"},
+            )
+        for key in keys:
+            assert results[key][1] == {"k1": "v1", "k2": "v2"}
+
+        # an explicit max_workers larger than the pool emits a warning
+        pool_size = s3_client.meta.config.max_pool_connections
+        with pytest.warns(UserWarning):
+            update_object_tagging_many(
+                s3_client=s3_client,
+                bucket=bucket,
+                keys=keys,
+                tags={"k2": "v2"},
+                max_workers=pool_size + 1,
+            )
+
+    def _test_object_tagging_from_head(self):
+        s3_client = self.s3_client
+        bucket = self.bucket
+        key = f"{self.get_prefix()}/test_object_tagging_from_head"
+
+        s3_client.put_object(Bucket=bucket, Key=key, Body="")
+        # known to be empty, put directly
+        tags = update_object_tagging_from_head(
+            s3_client=s3_client,
+            bucket=bucket,
+            key=key,
+            tags={"k1": "v1"},
+            head_response={"TagCount": 0},
+        )[1]
+        assert tags == {"k1": "v1"}
+
+        # tag count unknown, merge with the existing tags
+        tags = update_object_tagging_from_head(
+            s3_client=s3_client,
+            bucket=bucket,
+            key=key,
+            tags={"k2": "v2"},
+            head_response=s3_client.head_object(Bucket=bucket, Key=key),
+        )[1]
+        assert tags == {"k1": "v1", "k2": "v2"}
+        res = s3_client.get_object_tagging(Bucket=bucket, Key=key)
+        assert res["TagSet"] == [
+            {"Key": "k1", "Value": "v1"},
+            {"Key": "k2", "Value": "v2"},
+        ]
+
     def test(self):
         self._test_bucket_tagging()
         self._test_object_tagging()
+        self._test_object_tagging_many()
+        self._test_object_tagging_from_head()
 
 
 # NOTE: this module should ONLY be tested with MOCK
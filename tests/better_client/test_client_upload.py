@@ -1,8 +1,17 @@
 # -*- coding: utf-8 -*-
 
+import warnings
+
 import pytest
 
+from pathlib_mate import Path
+from s3pathlib.better_client import upload as upload_module
 from s3pathlib.better_client.upload import (
+    _parse_simple_pattern,
+    _iter_todo,
+    _get_transfer_config,
+    _upload_file,
+    _upload_files_in_parallel,
     upload_dir,
 )
 from s3pathlib.utils import smart_join_s3_key
@@ -80,8 +89,137 @@ class BetterUpload(BaseTest):
                 overwrite=False,
             )
 
+    def _test_parse_simple_pattern(self):
+        assert _parse_simple_pattern("*") == (False, None)
+        assert _parse_simple_pattern("**/*") == (True, None)
+        recursive, name_regex = _parse_simple_pattern("*.txt")
+        assert recursive is False
+        assert name_regex.match("1.txt")
+        assert not name_regex.match("data1.json")
+        recursive, name_regex = _parse_simple_pattern("**/*.txt")
+        assert recursive is True
+        assert name_regex.match("1.txt")
+
+        # fall back to Path.glob
+        assert _parse_simple_pattern("subfolder/*.txt") is None
+        assert _parse_simple_pattern("**/subfolder/*.txt") is None
+        assert _parse_simple_pattern("**") is None
+        assert _parse_simple_pattern("") is None
+
+    def _test_iter_todo(self):
+        p_local_dir = Path(dir_test_upload_dir_folder)
+        for pattern in [
+            "*",
+            "**/*",
+            "*.txt",
+            "**/*.txt",
+            "*.json",
+            "**/*.json",
+            "**/data*",
+            # these patterns use the Path.glob fallback
+            "subfolder/*.txt",
+            "*/*.json",
+        ]:
+            expected = {
+                (p.abspath, f"prefix/{p.relative_to(p_local_dir).as_posix()}")
+                for p in p_local_dir.glob(pattern)
+                if p.is_file()
+            }
+            assert set(_iter_todo(p_local_dir, pattern, "prefix/")) == expected
+
+        assert {
+            key for _, key in _iter_todo(p_local_dir, "**/*.txt", "")
+        } == {"1.txt", "subfolder/2.txt"}
+
+    def _test_get_transfer_config(self):
+        config = _get_transfer_config(True)
+        assert config.use_threads is True
+        assert config.max_concurrency == 10
+        assert config.multipart_chunksize == upload_module.MULTIPART_THRESHOLD
+        assert _get_transfer_config(True) is config
+
+        config = _get_transfer_config(False)
+        assert config.use_threads is False
+        assert _get_transfer_config(False) is config
+
+        # the config is picked by the file size
+        class S3Client:
+            def upload_file(self, Filename, Bucket, Key, Config):
+                self.config = Config
+
+        s3_client = S3Client()
+        path = f"{dir_test_upload_dir_folder.joinpath('1.txt')}"
+        _upload_file(s3_client, self.bucket, path, "1.txt")
+        assert s3_client.config is _get_transfer_config(False)
+
+        multipart_threshold = upload_module.MULTIPART_THRESHOLD
+        upload_module.MULTIPART_THRESHOLD = 1
+        try:
+            _upload_file(s3_client, self.bucket, path, "1.txt")
+        finally:
+            upload_module.MULTIPART_THRESHOLD = multipart_threshold
+        assert s3_client.config is _get_transfer_config(True)
+
+    def _test_upload_with_max_workers(self):
+        for max_workers in [None, 1, 4]:
+            prefix = smart_join_s3_key(
+                parts=[self.prefix, f"test_upload_dir_{max_workers}"],
+                is_dir=True,
+            )
+            # the default max_workers fits the client's connection pool
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", UserWarning)
+                n_files = upload_dir(
+                    s3_client=self.s3_client,
+                    bucket=self.bucket,
+                    prefix=prefix,
+                    local_dir=f"{dir_test_upload_dir_folder}",
+                    pattern="**/*",
+                    overwrite=False,
+                    max_workers=max_workers,
+                )
+            assert n_files == 4
+            res = self.s3_client.list_objects_v2(Bucket=self.bucket, Prefix=prefix)
+            assert {dct["Key"][len(prefix) :] for dct in res["Contents"]} == {
+                "1.txt",
+                "data1.json",
+                "subfolder/2.txt",
+                "subfolder/data2.json",
+            }
+
+    def _test_upload_failure_stops_submitting(self):
+        path = f"{dir_test_upload_dir_folder.joinpath('1.txt')}"
+        path_not_exists = f"{dir_test_upload_dir_folder.joinpath('not-exists.txt')}"
+        n_total = 100
+        n_pulled = 0
+
+        def todo():
+            nonlocal n_pulled
+            n_pulled += 1
+            yield path_not_exists, f"{self.prefix}failure/0.txt"
+            for i in range(1, n_total):
+                n_pulled += 1
+                yield path, f"{self.prefix}failure/{i}.txt"
+
+        for max_workers in [1, 2]:
+            n_pulled = 0
+            with pytest.raises(FileNotFoundError):
+                _upload_files_in_parallel(
+                    self.s3_client,
+                    self.bucket,
+                    todo(),
+                    max_workers=max_workers,
+                )
+            # stop consuming the todo iterator on the first failure
+            assert n_pulled <= 2 * max_workers + 1
+
     def test(self):
         self._test()
+        self._test_parse_simple_pattern()
+        self._test_iter_todo()
+        self._test_get_transfer_config()
+        self._test_upload_with_max_workers()
+        self._test_upload_failure_stops_submitting()
 
 
 class Test(BetterUpload):
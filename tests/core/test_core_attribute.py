@@ -189,6 +189,7 @@ class AttributeAPIMixin(BaseTest):
         assert S3Path("bkt/a/").is_prefix_of(S3Path("bkt/a/")) is True
 
         assert S3Path("bkt/a/b/").is_prefix_of(S3Path("bkt/a")) is False
+        assert S3Path("bkt/a/").is_prefix_of(S3Path("bkt/b")) is False
 
         # different bucket name always returns False
         assert S3Path("bkt1/a/").is_prefix_of(S3Path("bkt2/a/b/")) is False
@@ -27,6 +27,8 @@ class BaseS3Path(BaseTest):
             S3Path("bucket", "a/b/c"),
             S3Path("bucket", "/a/b/c"),
             S3Path(S3Path("//bucket//"), "/a/b/c"),
+            S3Path._from_bucket_key("bucket", "a/b/c"),
+            S3Path._from_bucket_key("bucket", "/a//b/c"),
         ]
         for p in p_list:
             assert p._bucket == "bucket"
@@ -34,6 +36,11 @@ class BaseS3Path(BaseTest):
             assert p._is_dir is False
             assert p.parts == ["a", "b", "c"]
 
+        # parts is a copy, the path is immutable
+        p = S3Path("bucket", "a/b/c")
+        p.parts.append("d")
+        assert p.key == "a/b/c"
+
     def _test_logical_aws_s3_directory(self):
         # these s3path are equivalent
         p_list = [
@@ -44,6 +51,8 @@ class BaseS3Path(BaseTest):
             S3Path("bucket//a//b//c//"),
             S3Path("//bucket//a//b//c//"),
             S3Path(S3Path("//bucket//"), "//a//b//c//"),
+            S3Path._from_bucket_key("bucket", "a/b/c/"),
+            S3Path._from_bucket_key("bucket", "a//b//c//"),
         ]
         for p in p_list:
             assert p._bucket == "bucket"
@@ -101,6 +110,17 @@ class BaseS3Path(BaseTest):
         with pytest.raises(TypeError):
             S3Path(S3Path("bucket"), S3Path("a", "b", "c"))
 
+    def _test_intern(self):
+        p1 = S3Path("bucket", "file.txt").intern()
+        p2 = S3Path.from_s3_uri("s3://bucket/file.txt").intern()
+        assert p1 is p2
+        assert S3Path("bucket", "file.txt") is not p1
+        assert S3Path("bucket", "file.txt/").intern() is not p1
+
+        p3 = S3Path("bucket", "file.txt")
+        p3._meta = {"VersionId": "v1"}
+        assert p3.intern() is p3
+
     def test(self):
         self._test_classic_aws_s3_object()
         self._test_logical_aws_s3_directory()
@@ -108,6 +128,7 @@ class BaseS3Path(BaseTest):
         self._test_void_aws_s3_path()
         self._test_uri_and_arn()
         self._test_type_error()
+        self._test_intern()
 
 
 class Test(BaseS3Path):
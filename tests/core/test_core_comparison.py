@@ -49,6 +49,16 @@ class TestComparisonAPIMixin:
         assert p3 < p2
         assert p3 <= p2
 
+        # directory sorts after the file with the same name
+        assert S3Path("bucket", "folder") < S3Path("bucket", "folder/")
+        assert S3Path("bucket", "folder/") < S3Path("bucket", "folder/file.txt")
+
+        # the directory flag is part of the key, not a "/" part
+        file, folder = S3Path("bucket", "folder"), S3Path("bucket", "folder/")
+        assert file._cparts == ("bucket", ("folder",), False)
+        assert folder._cparts == ("bucket", ("folder",), True)
+        assert len({file, folder}) == 2
+
         p_set = set(p_list + p_list)
         assert len(p_set) == 6
         for p in p_list:
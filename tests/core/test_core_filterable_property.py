@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import pytest
+
 from s3pathlib.core.filterable_property import FilterableProperty
 from s3pathlib.tests import run_cov_test
 
@@ -19,6 +21,23 @@ class TestFilterableProperty:
         func = User.username == "alice"
         assert func(user) is True
         assert func(User(name="Bob")) is False
+        assert user.username == "alice"
+        with pytest.raises(AttributeError):
+            user.username = "bob"
+
+    def test_comparison(self):
+        alice, bob = User(name="alice"), User(name="bob")
+        assert (User.username != "alice")(bob) is True
+        assert (User.username > "alice")(bob) is True
+        assert (User.username < "bob")(alice) is True
+        assert (User.username >= "bob")(bob) is True
+        assert (User.username <= "alice")(bob) is False
+        assert User.username.greater_equal("bob")(alice) is False
+        assert User.username.less_equal("bob")(alice) is True
+        assert User.username.between("a", "b")(alice) is True
+        assert User.username.startswith("al")(alice) is True
+        assert User.username.endswith("ce")(bob) is False
+        assert User.username.contains("li")(alice) is True
 
 
 if __name__ == "__main__":
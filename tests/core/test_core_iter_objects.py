@@ -6,6 +6,7 @@ from pathlib_mate import Path
 from iterproxy import and_
 
 from s3pathlib.core import S3Path
+from s3pathlib.core.iter_objects import S3PathIterProxy
 from s3pathlib.tests import run_cov_test
 from s3pathlib.tests.mock import BaseTest
 
@@ -148,6 +149,23 @@ class IterObjectsAPIMixin(BaseTest):
         ):
             assert p.ext.lower() == ".txt"
 
+        # same semantic as S3Path.ext, "" matches the file without extension
+        paths = [
+            S3Path("bucket/README"),
+            S3Path("bucket/.bashrc"),
+            S3Path("bucket/file."),
+            S3Path("bucket/file.txt"),
+            S3Path("bucket/folder/"),
+        ]
+        assert [p.basename for p in S3PathIterProxy(paths).filter_by_ext("")] == [
+            "README",
+            ".bashrc",
+            "file.",
+        ]
+        assert [
+            p.basename for p in S3PathIterProxy(paths).filter_by_ext("", ".TXT")
+        ] == ["README", ".bashrc", "file.", "file.txt"]
+
     def _test_iterdir(self):
         p_list = self.s3dir_test_iter_objects.iterdir().all()
         assert len(p_list) == 5
@@ -87,6 +87,10 @@ class TestJoinPathAPIMixin:
 
         assert bucket / relpath == file
 
+        assert directory / "sub/" == S3Path("bucket", "folder", "sub/")
+        assert (directory / "sub/").key == "folder/sub/"
+        assert (bucket / "file.txt").key == "file.txt"
+
         p = file / "/"
         assert p.is_dir()
         assert p.uri == "s3://bucket/folder/file.txt/"
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import pytest
 from datetime import datetime
 
 from s3pathlib.core import S3Path
+from s3pathlib.core.metadata import _ListedMeta
 from s3pathlib.utils import md5_binary
 from s3pathlib.tests import run_cov_test
 from s3pathlib.tests.mock import BaseTest
@@ -35,6 +37,22 @@ class MetadataAPIMixin(BaseTest):
         assert p.expire_at is None
         assert p.metadata == {"creator": "Alice"}
 
+    def _test_listed_metadata(self):
+        p = [
+            s3path
+            for s3path in self.p.parent.iter_objects()
+            if s3path.basename == "file.txt"
+        ][0]
+        # the list API already returns these fields, no HEAD request
+        assert p.size == 12
+        assert p.etag == md5_binary("Hello World!".encode("utf-8"))
+        assert isinstance(p.last_modified_at, datetime)
+        assert isinstance(p._meta, _ListedMeta)
+
+        # user metadata is not in the list API response, pull it
+        assert p.metadata == {"creator": "Alice"}
+        assert isinstance(p._meta, dict)
+
     def _test_clear_cache(self):
         p = self.p
 
@@ -60,6 +78,10 @@ class MetadataAPIMixin(BaseTest):
         assert s3path.last_modified_at == datetime(2015, 1, 1)
         assert s3path.etag == "string"
         assert s3path.size == 123
+        assert s3path._meta["StorageClass"] == "STANDARD"
+        assert "VersionId" not in s3path._meta
+        with pytest.raises(KeyError):
+            _ = s3path._meta["VersionId"]
 
     def _test_object_metadata(self):
         s3path = S3Path(self.s3dir_root, "object-metadata.txt")
@@ -81,6 +103,7 @@ class MetadataAPIMixin(BaseTest):
 
     def test(self):
         self._test_attributes()
+        self._test_listed_metadata()
         self._test_clear_cache()
         self._test_from_content_dict()
         self._test_object_metadata()
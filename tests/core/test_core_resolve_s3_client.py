@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from s3pathlib.aws import context
+from s3pathlib.aws import Context, context
 from s3pathlib.core.resolve_s3_client import resolve_s3_client
 from s3pathlib.tests import run_cov_test
 from s3pathlib.tests.mock import BaseTest
@@ -8,6 +8,7 @@ from s3pathlib.tests.mock import BaseTest
 
 class ResolveS3Client(BaseTest):
     def _test_resolve_s3_client(self):
+        assert Context() is context
         context.attach_boto_session(boto_ses=self.bsm.boto_ses)
         assert context.aws_account_id == self.bsm.aws_account_id
         assert context.aws_region == self.bsm.aws_region
@@ -2,6 +2,7 @@
 
 import pytest
 from pathlib_mate import Path
+from s3pathlib import exc
 from s3pathlib.core import S3Path
 from s3pathlib.tests import run_cov_test
 from s3pathlib.tests.mock import BaseTest
@@ -29,6 +30,13 @@ class UploadAPIMixin(BaseTest):
         with pytest.raises(FileExistsError):
             p.upload_file(path=__file__, overwrite=False)
 
+        # the existing object is left untouched
+        content = p.read_text()
+        other_file = dir_here.joinpath("test_upload_dir", "1.txt")
+        with pytest.raises(exc.S3FileAlreadyExist):
+            p.upload_file(path=other_file.abspath, overwrite=False)
+        assert p.read_text() == content
+
         # raise type error if upload to a folder
         with pytest.raises(TypeError):
             p = S3Path("bucket", "folder/")
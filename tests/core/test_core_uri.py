@@ -12,6 +12,7 @@ class TestUriAPIMixin:
         assert p.bucket == "bucket"
         assert p.key == "folder/file.txt"
         assert p.uri == "s3://bucket/folder/file.txt"
+        assert p.uri is p.uri  # cached
         assert p.arn == "arn:aws:s3:::bucket/folder/file.txt"
         assert (
             p.console_url
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
 import pytest
+import botocore.exceptions
+from boto3.exceptions import S3UploadFailedError
 from s3pathlib import exc
 
 
@@ -40,6 +42,59 @@ def test_ensure_all_none():
         exc.ensure_all_none(**kwargs)
 
 
+def test_is_not_found_error():
+    def make_error(code: str, status_code: int):
+        return botocore.exceptions.ClientError(
+            {
+                "Error": {"Code": code, "Message": "..."},
+                "ResponseMetadata": {"HTTPStatusCode": status_code},
+            },
+            "HeadObject",
+        )
+
+    assert exc.is_not_found_error(make_error("404", 404)) is True
+    assert exc.is_not_found_error(make_error("NoSuchKey", 404)) is True
+    assert exc.is_not_found_error(make_error("NoSuchBucket", 404)) is True
+    assert exc.is_not_found_error(make_error("403", 403)) is False
+    assert exc.is_not_found_error(make_error("AccessDenied", 403)) is False
+
+    assert exc.get_error_code(make_error("NoSuchTagSet", 404)) == "NoSuchTagSet"
+    assert exc.get_error_code(botocore.exceptions.ClientError({}, "HeadObject")) == ""
+
+
+def test_is_precondition_failed_error():
+    error = botocore.exceptions.ClientError(
+        {"Error": {"Code": "PreconditionFailed", "Message": "..."}},
+        "PutObject",
+    )
+    assert exc.is_precondition_failed_error(error) is True
+
+    # upload_file raises S3UploadFailedError while handling the ClientError,
+    # the same way as boto3.s3.transfer.S3Transfer.upload_file
+    try:
+        try:
+            raise error
+        except botocore.exceptions.ClientError as e:
+            raise S3UploadFailedError(f"Failed to upload: {e}")
+    except S3UploadFailedError as e:
+        assert e.__cause__ is None
+        assert exc.is_precondition_failed_error(e) is True
+
+    # explicit chaining also works
+    try:
+        raise S3UploadFailedError("Failed to upload") from error
+    except S3UploadFailedError as e:
+        assert exc.is_precondition_failed_error(e) is True
+
+    assert exc.is_precondition_failed_error(ValueError()) is False
+    assert (
+        exc.is_precondition_failed_error(
+            botocore.exceptions.ClientError({}, "PutObject")
+        )
+        is False
+    )
+
+
 if __name__ == "__main__":
     import os
 
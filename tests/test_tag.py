@@ -3,6 +3,7 @@
 from s3pathlib.tag import (
     parse_tags,
     encode_tag_set,
+    merge_tag_set,
     encode_url_query,
     encode_for_put_object,
     encode_for_put_bucket_tagging,
@@ -21,6 +22,17 @@ def test_encode_tag_set():
     ]
 
 
+def test_merge_tag_set():
+    tag_set = [{"Key": "k1", "Value": "v1"}, {"Key": "k2", "Value": "v2"}]
+    assert merge_tag_set(tag_set, {"k2": "v22", "k3": "v3"}) == [
+        {"Key": "k1", "Value": "v1"},
+        {"Key": "k2", "Value": "v22"},
+        {"Key": "k3", "Value": "v3"},
+    ]
+    # the original tag set is not modified
+    assert tag_set == [{"Key": "k1", "Value": "v1"}, {"Key": "k2", "Value": "v2"}]
+
+
 def test_encode_url_query():
     assert encode_url_query(dict(k="v", message="a=b")) == "k=v&message=a%3Db"
 
@@ -68,6 +68,9 @@ def test_make_s3_console_url():
     # s3 bucket root
     url = utils.make_s3_console_url(s3_uri="s3://my-bucket/")
     assert url == "https://console.aws.amazon.com/s3/buckets/my-bucket?tab=objects"
+    # cached
+    assert utils.make_s3_console_url(s3_uri="s3://my-bucket/") is url
+    utils.make_s3_console_url.cache_clear()
 
     # version id
     url = utils.make_s3_console_url(s3_uri="s3://my-bucket/my-folder/my-file.zip", version_id="v123")
@@ -108,5 +111,21 @@ def test_parse_data_size():
     assert utils.parse_data_size("2,512.4 MB") == 2634442342
 
 
+def test_make_kwargs_builder():
+    build = utils.make_kwargs_builder(
+        "build",
+        required_fields=[("Bucket", "bucket")],
+        optional_fields=[("Key", "key"), ("Tagging", "tags")],
+        converters={"tags": str.upper},
+    )
+    assert build("b") == {"Bucket": "b"}
+    assert build("b", key="k") == {"Bucket": "b", "Key": "k"}
+    assert build("b", key=None, tags="k=v") == {
+        "Bucket": "b",
+        "Key": None,
+        "Tagging": "K=V",
+    }
+
+
 if __name__ == "__main__":
     run_cov_test(__file__, "s3pathlib.utils", preview=False)